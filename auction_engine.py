@@ -0,0 +1,213 @@
+"""
+Python reference engine of the AuctionHouse, to simulate bidding
+strategies over many epochs and bids at a fraction of the cost of
+driving the contract.
+
+    engine = AuctionEngine(reserve_price=10**18, max_token_id=365)
+    engine.start_auction(0, timestamp=now)
+    engine.bid("alice", 0, 10**18, timestamp=now + 60)
+    engine.settle(timestamp=now + EPOCH_LENGTH + 1)
+
+Every method takes the block timestamp of the call and raises
+AuctionError with the revert message wherever the contract reverts,
+leaving the state untouched. Bidders are any hashable, None stands for
+the empty address. WETH transfers are not checked: bidders are assumed to
+have the balance and allowance for their bids. The owner checks and
+refund_highest_bidder are not modelled.
+"""
+
+EPOCH_LENGTH = 60 * 60 * 24
+TIME_BUFFER = 15 * 60
+MIN_INCREMENT_PCT = 2
+MAX_CATCH_UP_EPOCHS = 50
+MIN_EPOCH_LENGTH = 60 * 60 * 12
+
+
+class AuctionError(Exception):
+    pass
+
+
+class AuctionEngine:
+    """
+    The state of an AuctionHouse deployed with start_token_id,
+    max_token_id and reserve_price.
+
+    paid tracks the WETH each bidder transferred to the auction house
+    minus the WETH transferred back. minted maps the token ids minted so
+    far to their receiver, deposits lists the (token_id, amount) passed
+    to Vault.register_deposit.
+    """
+
+    def __init__(
+        self, reserve_price, max_token_id, start_token_id=0, fallback_receiver="fallback"
+    ):
+        if start_token_id >= max_token_id:
+            raise AuctionError("invalid token ids")
+        if reserve_price == 0:
+            raise AuctionError("reserve price cannot be zero")
+
+        self.reserve_price = reserve_price
+        self.fallback_receiver = fallback_receiver
+
+        self.current_epoch_token_id = start_token_id
+        self.max_token_id = max_token_id
+        self.highest_bid = 0
+        self.highest_bidder = None
+        self.epoch_start = 0
+        self.epoch_end = 0
+        self.auction_started = False
+
+        self.pull_refunds = False
+        self.pending_refunds = {}
+
+        self.paid = {}
+        self.minted = {}
+        self.deposits = []
+
+    def _epoch_in_progress(self, timestamp):
+        return self.epoch_start <= timestamp <= self.epoch_end
+
+    def _transfer(self, account, amount):
+        # positive amounts go from account to the auction house
+        self.paid[account] = self.paid.get(account, 0) + amount
+
+    # --------
+    #  Admin
+    # --------
+    def start_auction(self, start_time, timestamp):
+        if self.auction_started:
+            raise AuctionError("cannot restart auction")
+
+        start = start_time if start_time != 0 else timestamp
+        if start < timestamp:
+            raise AuctionError("cannot start in the past")
+
+        self.auction_started = True
+        self.epoch_start = start
+        self.epoch_end = start + EPOCH_LENGTH
+
+    def set_max_token_id(self, new_max_token_id):
+        if new_max_token_id < self.current_epoch_token_id:
+            raise AuctionError("cannot set max < current")
+
+        self.max_token_id = new_max_token_id
+
+    def set_pull_refunds(self, enabled):
+        self.pull_refunds = enabled
+
+    # ------
+    #  Bids
+    # ------
+    def bid(self, bidder, token_id, amount, timestamp):
+        if not self._epoch_in_progress(timestamp):
+            raise AuctionError("auction not in progress")
+        if amount < self.reserve_price:
+            raise AuctionError("reserve price not met")
+        if token_id != self.current_epoch_token_id:
+            raise AuctionError("token id not up for auction")
+        if amount < self.highest_bid * (100 + MIN_INCREMENT_PCT) // 100:
+            raise AuctionError("bid not high enough")
+
+        last_bidder = self.highest_bidder
+        last_bid = self.highest_bid
+
+        self.highest_bid = amount
+        self.highest_bidder = bidder
+
+        # extend epoch_end to avoid sniping if necessary
+        if timestamp > self.epoch_end - TIME_BUFFER:
+            self.epoch_end = timestamp + TIME_BUFFER
+
+        amount_to_collect = amount
+
+        if last_bidder == bidder:
+            amount_to_collect -= last_bid
+        elif last_bidder is not None and last_bid > 0:
+            if self.pull_refunds:
+                self.pending_refunds[last_bidder] = self.pending_refunds.get(last_bidder, 0) + last_bid
+            else:
+                self._transfer(last_bidder, -last_bid)
+
+        credit = self.pending_refunds.get(bidder, 0)
+        if credit > 0:
+            credit_used = min(credit, amount_to_collect)
+            self.pending_refunds[bidder] = credit - credit_used
+            amount_to_collect -= credit_used
+
+        if amount_to_collect > 0:
+            self._transfer(bidder, amount_to_collect)
+
+    def withdraw_refund(self, receiver):
+        amount = self.pending_refunds.get(receiver, 0)
+        if amount == 0:
+            return 0
+
+        self.pending_refunds[receiver] = 0
+        self._transfer(receiver, -amount)
+        return amount
+
+    def withdraw_refunds(self, receivers):
+        return sum(self.withdraw_refund(receiver) for receiver in receivers)
+
+    # ------------
+    #  Settlement
+    # ------------
+    def settle(self, timestamp):
+        self._settle(timestamp, False, 0)
+
+    def settle_and_catch_up(self, max_missed_epochs, timestamp):
+        self._settle(timestamp, True, max_missed_epochs)
+
+    def _settle(self, timestamp, catch_up, max_missed_epochs):
+        if not self.auction_started:
+            raise AuctionError("auction not started")
+        if self._epoch_in_progress(timestamp):
+            raise AuctionError("epoch not over")
+
+        token_id = self.current_epoch_token_id
+        # the NFT reverts on minting a token twice
+        if token_id in self.minted:
+            raise AuctionError("token already minted")
+
+        winner = self.highest_bidder
+        winning_amount = self.highest_bid
+        if winner is None:
+            winner = self.fallback_receiver
+
+        self.highest_bid = 0
+        self.highest_bidder = None
+
+        # count the epochs that fully elapsed since the latest epoch ended
+        next_epoch_start = timestamp
+        missed_epochs = 0
+        if catch_up:
+            next_epoch_start = self.epoch_end
+            for i in range(MAX_CATCH_UP_EPOCHS):
+                if i >= max_missed_epochs or token_id + i >= self.max_token_id:
+                    break
+                if next_epoch_start + EPOCH_LENGTH >= timestamp:
+                    break
+                missed_epochs += 1
+                next_epoch_start += EPOCH_LENGTH
+
+            next_epoch_end = next_epoch_start + EPOCH_LENGTH
+            if timestamp < next_epoch_end < timestamp + MIN_EPOCH_LENGTH:
+                next_epoch_start = timestamp
+
+        last_token_id = token_id + missed_epochs
+        self.current_epoch_token_id = last_token_id
+
+        if last_token_id < self.max_token_id:
+            self.current_epoch_token_id += 1
+            self.epoch_start = next_epoch_start
+            self.epoch_end = next_epoch_start + EPOCH_LENGTH
+        else:
+            self.epoch_start = 0
+            self.epoch_end = 0
+
+        self.minted[token_id] = winner
+        for missed_token_id in range(token_id + 1, last_token_id + 1):
+            self.minted[missed_token_id] = self.fallback_receiver
+
+        if winning_amount > 0:
+            self.deposits.append((token_id, winning_amount))
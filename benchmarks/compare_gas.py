@@ -0,0 +1,30 @@
+"""
+Prints the gas difference per entry point between two gas reports.
+
+    python benchmarks/compare_gas.py old_gas_report.json new_gas_report.json
+"""
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)["gas_used"]
+
+
+def main(old_path, new_path):
+    old = load(old_path)
+    new = load(new_path)
+
+    for name in sorted(old.keys() | new.keys()):
+        if name not in new:
+            print(f"{name:<60} {old[name]:>9} {'removed':>9}")
+        elif name not in old:
+            print(f"{name:<60} {'new':>9} {new[name]:>9}")
+        elif old[name] != new[name]:
+            delta = new[name] - old[name]
+            print(f"{name:<60} {old[name]:>9} {new[name]:>9} {delta:>+9} ({delta / old[name]:+.2%})")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:3])
@@ -0,0 +1,298 @@
+import contextlib
+import json
+import math
+import pathlib
+import re
+
+import pytest
+import boa
+from eth.vm.gas_meter import GasMeter, allow_negative_refund_strategy
+from eth_utils import to_canonical_address
+
+from contract_loader import load_partial
+from gas_profiler import GasProfile, profile_gas
+
+BUDGETS_FILE = pathlib.Path(__file__).parent / "gas_budgets.json"
+BUDGET_HEADROOM = 1000
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--gas-report",
+        default="gas_report.json",
+        help="path the measured gas per entry point is written to",
+    )
+    parser.addoption(
+        "--update-gas-budgets",
+        action="store_true",
+        help="overwrite gas_budgets.json with the measured gas instead of checking it",
+    )
+    parser.addoption(
+        "--gas-profile",
+        default=None,
+        help="directory a per line gas profile of every benchmark is written to",
+    )
+
+
+def pytest_configure():
+    pytest.ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+    pytest.WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+def new_transaction():
+    boa.env.vm.state.lock_changes()
+
+
+class TransactionGasMeter(GasMeter):
+    # refunds are counted per call frame, so a frame may take back a
+    # refund granted to an earlier frame of the same transaction
+    def __init__(self, start_gas, refund_strategy=allow_negative_refund_strategy):
+        super().__init__(start_gas, refund_strategy)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def transaction_per_call():
+    # boa runs every call in one long transaction, so storage touched by
+    # earlier calls stays warm and dirty. Committing the pending changes
+    # before each call makes it pay cold access and fresh SSTORE costs
+    # like a real transaction would. Committed changes cannot be reverted,
+    # which is why the benchmarks deploy fresh contracts for every test
+    # instead of using boa.env.anchor().
+    execute_code = boa.env.execute_code
+    deploy_code = boa.env.deploy_code
+
+    def execute_in_new_transaction(*args, **kwargs):
+        new_transaction()
+        return execute_code(*args, **kwargs)
+
+    def deploy_in_new_transaction(*args, **kwargs):
+        new_transaction()
+        return deploy_code(*args, **kwargs)
+
+    boa.env.execute_code = execute_in_new_transaction
+    boa.env.deploy_code = deploy_in_new_transaction
+    boa.env.set_gas_meter_class(TransactionGasMeter)
+    yield
+    boa.env.execute_code = execute_code
+    boa.env.deploy_code = deploy_code
+    boa.env.reset_gas_metering_behavior()
+
+
+class GasReport:
+    """
+    Collects the gas used per benchmark, keyed by
+    `<Contract>.<function>[<scenario>]`, and checks it against the
+    budgets in gas_budgets.json.
+    """
+
+    def __init__(self, budgets, update_budgets, profile_dir=None):
+        self.budgets = budgets
+        self.update_budgets = update_budgets
+        self.profile_dir = profile_dir
+        self.measurements = {}
+
+    @contextlib.contextmanager
+    def measure(self, name, contract):
+        if self.profile_dir is None:
+            yield
+        else:
+            with profile_gas():
+                yield
+            self.write_profile(name, GasProfile.of(contract))
+
+        self.record(name, contract._computation.get_gas_used())
+
+    def measure_calls(self, name, contract, calls):
+        """
+        Records the gas of making every call in `calls`, each in its own
+        transaction, as one measurement.
+        """
+        gas = 0
+        for call in calls:
+            call()
+            gas += contract._computation.get_gas_used()
+
+        self.record(name, gas)
+
+    def record(self, name, gas):
+        self.measurements[name] = gas
+
+        if self.update_budgets:
+            return
+
+        assert name in self.budgets, f"no gas budget for {name}"
+        assert gas <= self.budgets[name], (
+            f"{name} used {gas} gas, budget is {self.budgets[name]}"
+        )
+
+    def write_profile(self, name, profile):
+        path = pathlib.Path(self.profile_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        filename = re.sub(r"[^\w.]+", "_", name).strip("_")
+
+        profile.write_folded(path / f"{filename}.folded")
+        (path / f"{filename}.txt").write_text(f"{name}\n{profile.summary()}\n")
+
+    def write(self, path):
+        report = {"gas_used": dict(sorted(self.measurements.items()))}
+        pathlib.Path(path).write_text(json.dumps(report, indent=2) + "\n")
+
+    def write_budgets(self):
+        budgets = dict(self.budgets)
+        for name, gas in self.measurements.items():
+            budgets[name] = math.ceil(gas / BUDGET_HEADROOM + 1) * BUDGET_HEADROOM
+        BUDGETS_FILE.write_text(json.dumps(dict(sorted(budgets.items())), indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def gas_report(request):
+    budgets = json.loads(BUDGETS_FILE.read_text()) if BUDGETS_FILE.exists() else {}
+    report = GasReport(
+        budgets,
+        request.config.getoption("--update-gas-budgets"),
+        request.config.getoption("--gas-profile"),
+    )
+
+    yield report
+
+    report.write(request.config.getoption("--gas-report"))
+    if report.update_budgets:
+        report.write_budgets()
+
+
+# ----------
+#  Accounts
+# ----------
+OWNER = boa.env.generate_address("owner")
+boa.env.eoa = OWNER
+
+MAX_TOKEN_ID = 100
+RESERVE_PRICE = 10**18
+
+
+@pytest.fixture(scope="session")
+def owner():
+    return OWNER
+
+
+@pytest.fixture(scope="session")
+def alice():
+    return boa.env.generate_address("alice")
+
+
+@pytest.fixture(scope="session")
+def bob():
+    return boa.env.generate_address("bob")
+
+
+@pytest.fixture(scope="session")
+def carol():
+    return boa.env.generate_address("carol")
+
+
+# -----------
+#  Deployers
+# -----------
+@pytest.fixture(scope="session")
+def weth_deployer():
+    return load_partial("contracts/testing/token/ERC20.vy")
+
+
+@pytest.fixture(scope="session")
+def nft_deployer():
+    return load_partial("contracts/testing/token/ERC721.vy")
+
+
+@pytest.fixture(scope="session")
+def lazy_nft_deployer():
+    return load_partial("contracts/token/LazyERC721.vy")
+
+
+@pytest.fixture(scope="session")
+def alchemist_deployer():
+    return load_partial("contracts/testing/MockAlchemist.vy")
+
+
+@pytest.fixture(scope="session")
+def migrator_deployer():
+    return load_partial("contracts/testing/MockMigrator.vy")
+
+
+@pytest.fixture(scope="session")
+def vault_deployer():
+    return load_partial("contracts/Vault.vy")
+
+
+@pytest.fixture(scope="session")
+def house_deployer():
+    return load_partial("contracts/AuctionHouse.vy")
+
+
+# -----------
+#  Contracts
+# -----------
+@pytest.fixture()
+def weth(weth_deployer, alice, bob, carol):
+    # WETH lives at a fixed address, drop the previous benchmark's balances
+    boa.env.vm.state.delete_account(to_canonical_address(pytest.WETH))
+    new_transaction()
+    weth = weth_deployer.deploy(
+        "wrapped ETH",
+        "WETH",
+        18,
+        10000 * 10**18,
+        override_address=pytest.WETH,
+    )
+    for account in [alice, bob, carol]:
+        weth.transfer(account, 100 * 10**18)
+    return weth
+
+
+@pytest.fixture()
+def nft(nft_deployer):
+    return nft_deployer.deploy()
+
+
+@pytest.fixture()
+def lazy_nft(lazy_nft_deployer):
+    return lazy_nft_deployer.deploy(0)
+
+
+@pytest.fixture()
+def alchemist(alchemist_deployer):
+    return alchemist_deployer.deploy()
+
+
+@pytest.fixture()
+def migrator(migrator_deployer):
+    return migrator_deployer.deploy()
+
+
+@pytest.fixture()
+def vault(vault_deployer, nft, alchemist):
+    vault = vault_deployer.deploy(nft)
+    vault.set_alchemist(alchemist)
+    alchemist.eval(f"self.total_value = {10**30}")
+    return vault
+
+
+@pytest.fixture()
+def house(house_deployer, owner, alice, bob, carol, weth, nft, vault):
+    # the real Vault sits behind the AuctionHouse so that settle is
+    # measured including the deposit into the (mocked) Alchemist
+    house = house_deployer.deploy(
+        weth,
+        nft,
+        0,  # start_token_id
+        MAX_TOKEN_ID,
+        RESERVE_PRICE,
+        owner,
+        vault,
+    )
+    for account in [owner, alice, bob, carol]:
+        with boa.env.prank(account):
+            weth.approve(house, 2**256 - 1)
+
+    nft.DEBUG_transferMinter(house)
+    vault.add_depositor(house)
+    return house
@@ -0,0 +1,98 @@
+"""
+Simulates 10,000 small distributions to three positions and prints the
+WETH that no token can claim, for the old claimable per share precision
+of 10**18 and the current one.
+
+    python -m benchmarks.dust_simulation [distributions]
+
+Every distribution is rounded down to the precision of
+amount_claimable_per_share and every claim to whole WETH, the remainder
+can't be claimed by any token. sweep_dust sends the WETH above what the
+open positions can still claim to the fund_receiver, what is left after
+that stays locked.
+"""
+import random
+import re
+import sys
+
+import boa
+
+from contract_loader import load_partial, loads_partial
+
+WETH = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+PRECISIONS = {"before": 18, "after": 36}
+DEPOSITS = [1_234_567_891_234_567_891, 2_718_281_828_459_045_235, 3_141_592_653_589_793_238]
+SEED = 1337
+
+
+def load_vault(decimals):
+    with open("contracts/Vault.vy") as f:
+        source = f.read()
+    source = re.sub(
+        r"^CLAIMABLE_PRECISION: constant\(uint256\) = .*$",
+        f"CLAIMABLE_PRECISION: constant(uint256) = 10**{decimals}",
+        source,
+        flags=re.M,
+    )
+    return loads_partial(source, "contracts/Vault.vy")
+
+
+def simulate(vault_deployer, distributions):
+    owner = boa.env.generate_address("owner")
+    boa.env.eoa = owner
+
+    weth = load_partial("contracts/testing/token/ERC20.vy").deploy(
+        "wrapped ETH",
+        "WETH",
+        18,
+        10000 * 10**18,
+        override_address=WETH,
+    )
+    nft = load_partial("contracts/testing/token/ERC721.vy").deploy()
+    alchemist = load_partial("contracts/testing/MockAlchemist.vy").deploy()
+    alchemist.eval(f"self.total_value = {10**30}")
+
+    vault = vault_deployer.deploy(nft)
+    vault.set_alchemist(alchemist)
+    vault.add_depositor(owner)
+    nft.DEBUG_transferMinter(owner)
+    weth.approve(vault, sum(DEPOSITS))
+    for token_id, amount in enumerate(DEPOSITS):
+        nft.mint(owner, token_id)
+        vault.register_deposit(token_id, amount)
+
+    # the mock keeps neither the deposited WETH nor the shares, do it in
+    # its place
+    alchemist.eval(f"self.shares = {sum(DEPOSITS)}")
+    with boa.env.prank(vault.address):
+        weth.transfer(alchemist, sum(DEPOSITS))
+
+    rng = random.Random(SEED)
+    amounts = [rng.randint(10**9, 10**15) for _ in range(distributions)]
+    weth.transfer(vault, sum(amounts))
+    for amount in amounts:
+        vault.withdraw_underlying_to_claim(0, amount)
+
+    def unclaimable():
+        claimable = sum(vault.claimable_for_token(token_id) for token_id in range(len(DEPOSITS)))
+        return weth.balanceOf(vault) - claimable
+
+    before = unclaimable()
+    vault.sweep_dust()
+    return before, unclaimable()
+
+
+def main(distributions=10_000):
+    print(f"WETH (wei) not claimable by any token after {distributions} distributions")
+    print(f"{'':<8}{'precision':>10}{'unclaimable':>14}{'sweepable':>12}{'locked':>10}")
+    for name, decimals in PRECISIONS.items():
+        vault_deployer = load_vault(decimals)
+        with boa.env.anchor():
+            unclaimable, locked = simulate(vault_deployer, distributions)
+        sweepable = unclaimable - locked
+        print(f"{name:<8}{'10**' + str(decimals):>10}{unclaimable:>14}{sweepable:>12}{locked:>10}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
@@ -0,0 +1,166 @@
+"""
+Attributes the gas of a call to Vyper source lines and to the external
+calls it makes, e.g. from Vault to the Alchemist, WETH or the NFT.
+
+    with profile_gas():
+        vault.claim(token_id)
+    profile = GasProfile.of(vault)
+    print(profile.summary())
+    profile.write_folded("claim.folded")
+
+The folded output has one `frame;frame;frame gas` line per stack and can
+be rendered with flamegraph.pl or https://www.speedscope.app.
+"""
+import contextlib
+import pathlib
+
+import boa
+from boa.vm.gas_meters import ProfilingGasMeter
+from eth.vm.gas_meter import allow_negative_refund_strategy
+from eth_utils import to_checksum_address
+from vyper import ast as vy_ast
+
+OVERHEAD = "(dispatch)"
+
+
+class _ProfilingGasMeter(ProfilingGasMeter):
+    # refunds are counted per call frame, so a frame may take back a
+    # refund granted to an earlier frame of the same transaction
+    def __init__(self, start_gas, refund_strategy=allow_negative_refund_strategy):
+        super().__init__(start_gas, refund_strategy)
+
+
+@contextlib.contextmanager
+def profile_gas(env=boa.env):
+    """
+    Records the gas of every executed instruction for calls made inside
+    the context.
+    """
+    with env.gas_meter_class(_ProfilingGasMeter):
+        yield
+
+
+class _Source:
+    """
+    Line and function lookup for a deployed Vyper contract.
+    """
+
+    def __init__(self, contract):
+        self.name = pathlib.Path(contract.compiler_data.contract_name).stem
+        self.pc_pos_map = contract.source_map["pc_pos_map"]
+        self.lines = contract.compiler_data.source_code.splitlines()
+        self.functions = [
+            (fn.lineno, fn.end_lineno, fn.name)
+            for fn in contract.compiler_data.vyper_module.get_children(vy_ast.FunctionDef)
+        ]
+
+    def function_of(self, line):
+        for start, end, name in self.functions:
+            if start <= line <= end:
+                return name
+        return OVERHEAD
+
+    def line_label(self, line):
+        source = self.lines[line - 1].strip().replace(";", ",")
+        return f"L{line} {source}"
+
+
+class GasProfile:
+    """
+    Gas used per stack of (contract, function, source line) frames.
+    External calls show up as child stacks below the line making them.
+    """
+
+    def __init__(self, env=boa.env):
+        self.env = env
+        self.stacks = {}
+        self.lines = {}
+        self.calls = []
+
+    @classmethod
+    def of(cls, contract, computation=None):
+        profile = cls(contract.env)
+        profile._add(computation or contract._computation, ())
+        return profile
+
+    @property
+    def total_gas(self):
+        return sum(self.stacks.values())
+
+    def _add(self, computation, prefix):
+        contract = self.env.lookup_contract(computation.msg.code_address)
+        address = to_checksum_address(computation.msg.code_address)
+
+        if contract is None or not hasattr(contract, "source_map"):
+            # no source available, only the total is known
+            self._count(prefix, (address,), computation.get_gas_used())
+            return
+
+        source = _Source(contract)
+        gas_used_of = computation._gas_meter._gas_used_of
+
+        # walk the trace in execution order, instructions without a
+        # source position belong to the last line seen
+        line_of_pc = {}
+        current_line = None
+        for pc in computation.code._trace:
+            pos = source.pc_pos_map.get(pc)
+            if pos is not None:
+                current_line = pos[0]
+            line_of_pc.setdefault(pc, current_line)
+
+        def frames(line):
+            if line is None:
+                return (source.name, OVERHEAD)
+            return (source.name, source.function_of(line), source.line_label(line))
+
+        for pc, gas in gas_used_of.items():
+            self._count(prefix, frames(line_of_pc.get(pc)), gas)
+
+        for pc, child in zip(computation._child_pcs, computation.children):
+            # the gas forwarded to the child is booked on the CALL
+            # instruction, move it to the child's own frames instead
+            line = line_of_pc.get(pc, line_of_pc.get(pc - 1))
+            caller = frames(line)
+            self._count(prefix, caller, -child.get_gas_used())
+            self.calls.append((caller, child))
+            self._add(child, prefix + caller)
+
+    def _count(self, prefix, frames, gas):
+        self.stacks[prefix + frames] = self.stacks.get(prefix + frames, 0) + gas
+        self.lines[frames] = self.lines.get(frames, 0) + gas
+
+    def by_line(self):
+        """
+        Gas per (contract, function, line) without the gas of external
+        calls made from that line, most expensive first.
+        """
+        return sorted(self.lines.items(), key=lambda x: -x[1])
+
+    def summary(self, limit=15):
+        total = self.total_gas
+        rows = [f"total: {total} gas", "", "lines:"]
+        for frames, gas in self.by_line()[:limit]:
+            rows.append(f"{gas:>9} {gas / total:>7.2%}  {' > '.join(frames)}")
+
+        if self.calls:
+            rows += ["", "external calls:"]
+            for caller, child in self.calls:
+                gas = child.get_gas_used()
+                target = self.env.lookup_contract(child.msg.code_address)
+                if target is None:
+                    name = to_checksum_address(child.msg.code_address)
+                else:
+                    name = pathlib.Path(target.compiler_data.contract_name).stem
+                rows.append(f"{gas:>9} {gas / total:>7.2%}  {' > '.join(caller)} -> {name}")
+
+        return "\n".join(rows)
+
+    def folded(self):
+        return "\n".join(
+            f"{';'.join(stack)} {gas}" for stack, gas in sorted(self.stacks.items()) if gas > 0
+        )
+
+    def write_folded(self, path):
+        with open(path, "w") as f:
+            f.write(self.folded() + "\n")
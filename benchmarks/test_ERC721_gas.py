@@ -0,0 +1,48 @@
+import boa
+
+TOKENS = 32
+# zero to non-zero write of a cold storage slot
+SSTORE_SET_GAS = 22100
+
+
+def test_batch_mints(nft, lazy_nft, alice, bob, carol, gas_report):
+    # every variant mints to its own receiver so that none of them
+    # profits from a balance written by another
+    with gas_report.measure(f"ERC721.mint_batch[{TOKENS}_tokens]", nft):
+        nft.mint_batch(alice, list(range(TOKENS)))
+
+    with gas_report.measure(f"ERC721.mint_range[{TOKENS}_tokens]", nft):
+        nft.mint_range(bob, TOKENS, TOKENS)
+
+    gas_report.measure_calls(
+        f"ERC721.mint[{TOKENS}_tokens_looped]",
+        nft,
+        [lambda token_id=token_id: nft.mint(carol, token_id) for token_id in range(2 * TOKENS, 3 * TOKENS)],
+    )
+
+    with gas_report.measure(f"LazyERC721.mint_range[{TOKENS}_tokens]", lazy_nft):
+        lazy_nft.mint_range(bob, 0, TOKENS)
+
+    looped_gas = gas_report.measurements[f"ERC721.mint[{TOKENS}_tokens_looped]"]
+    range_gas = gas_report.measurements[f"ERC721.mint_range[{TOKENS}_tokens]"]
+    assert gas_report.measurements[f"ERC721.mint_batch[{TOKENS}_tokens]"] < looped_gas
+    assert range_gas < looped_gas
+    assert gas_report.measurements[f"LazyERC721.mint_range[{TOKENS}_tokens]"] < range_gas
+
+
+def test_transfer_of_lazily_owned_token(nft, lazy_nft, alice, bob, gas_report):
+    nft.mint_range(alice, 0, TOKENS)
+    lazy_nft.mint_range(alice, 0, TOKENS)
+
+    with boa.env.prank(alice):
+        with gas_report.measure("ERC721.transferFrom", nft):
+            nft.transferFrom(alice, bob, TOKENS // 2)
+
+        with gas_report.measure("LazyERC721.transferFrom[lazily_owned]", lazy_nft):
+            lazy_nft.transferFrom(alice, bob, TOKENS // 2)
+
+    # the first transfer of a lazily owned token pays for writing its
+    # owner and the owner of the token after it
+    eager_gas = gas_report.measurements["ERC721.transferFrom"]
+    lazy_gas = gas_report.measurements["LazyERC721.transferFrom[lazily_owned]"]
+    assert lazy_gas < eager_gas + 2 * SSTORE_SET_GAS
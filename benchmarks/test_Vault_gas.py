@@ -0,0 +1,244 @@
+import pytest
+import boa
+
+TOKEN_IDS = [0, 1, 2, 3, 4, 5, 6, 7]
+AMOUNT = 10**18
+
+
+@pytest.fixture(autouse=True)
+def depositor(vault, nft, weth, owner):
+    nft.DEBUG_transferMinter(owner)
+    vault.add_depositor(owner)
+    weth.approve(vault, 2**256 - 1)
+
+
+def mint(nft, owner, token_ids):
+    for token_id in token_ids:
+        nft.mint(owner, token_id)
+
+
+def fund(vault, nft, owner, alchemist, token_ids):
+    mint(nft, owner, token_ids)
+    vault.register_deposits(token_ids, [AMOUNT] * len(token_ids))
+    alchemist.eval(f"self.shares = {vault.total_shares()}")
+    alchemist.eval(f"self.debt = {vault.total_shares() // 2}")
+
+
+def make_claimable(vault, weth, rounds):
+    for _ in range(rounds):
+        weth.transfer(vault, AMOUNT // 10)
+        vault.withdraw_underlying_to_claim(AMOUNT // 10, AMOUNT // 10)
+
+
+def test_register_deposit(vault, nft, owner, gas_report):
+    mint(nft, owner, TOKEN_IDS[:2])
+
+    with gas_report.measure("Vault.register_deposit[first]", vault):
+        vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+
+    with gas_report.measure("Vault.register_deposit[second]", vault):
+        vault.register_deposit(TOKEN_IDS[1], AMOUNT)
+
+
+def test_register_deposit_with_claimable(vault, nft, owner, alchemist, weth, gas_report):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS[:1])
+    make_claimable(vault, weth, 1)
+    mint(nft, owner, TOKEN_IDS[1:2])
+
+    with gas_report.measure("Vault.register_deposit[with_claimable]", vault):
+        vault.register_deposit(TOKEN_IDS[1], AMOUNT)
+
+
+def test_register_deposit_with_cached_min_collateralization(vault, nft, owner, gas_report):
+    mint(nft, owner, TOKEN_IDS[:3])
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+
+    with gas_report.measure("Vault.register_deposit[uncached_min_collateralization]", vault):
+        vault.register_deposit(TOKEN_IDS[1], AMOUNT)
+
+    vault.set_min_collateralization_cache(True)
+
+    with gas_report.measure("Vault.register_deposit[cached_min_collateralization]", vault):
+        vault.register_deposit(TOKEN_IDS[2], AMOUNT)
+
+    assert (
+        gas_report.measurements["Vault.register_deposit[cached_min_collateralization]"]
+        < gas_report.measurements["Vault.register_deposit[uncached_min_collateralization]"]
+    )
+
+
+def test_register_deposits(vault, nft, owner, gas_report):
+    looped_token_ids = [token_id + len(TOKEN_IDS) for token_id in TOKEN_IDS]
+    mint(nft, owner, TOKEN_IDS + looped_token_ids)
+
+    with gas_report.measure(f"Vault.register_deposits[{len(TOKEN_IDS)}_tokens]", vault):
+        vault.register_deposits(TOKEN_IDS, [AMOUNT] * len(TOKEN_IDS))
+
+    # looped after the batch, so the batch alone pays for the first deposit
+    gas_report.measure_calls(
+        f"Vault.register_deposit[{len(TOKEN_IDS)}_tokens_looped]",
+        vault,
+        [lambda token_id=token_id: vault.register_deposit(token_id, AMOUNT) for token_id in looped_token_ids],
+    )
+
+    assert (
+        gas_report.measurements[f"Vault.register_deposits[{len(TOKEN_IDS)}_tokens]"]
+        < gas_report.measurements[f"Vault.register_deposit[{len(TOKEN_IDS)}_tokens_looped]"]
+    )
+
+
+def test_withdraw_underlying_to_claim(vault, nft, owner, alchemist, weth, gas_report):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS)
+    weth.transfer(vault, AMOUNT)
+
+    with gas_report.measure("Vault.withdraw_underlying_to_claim", vault):
+        vault.withdraw_underlying_to_claim(AMOUNT, AMOUNT)
+
+
+def test_harvest(vault, nft, owner, alchemist, weth, gas_report):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS)
+    weth.transfer(vault, AMOUNT)
+
+    with gas_report.measure("Vault.harvest", vault):
+        vault.harvest(AMOUNT)
+
+
+@pytest.mark.parametrize("rounds", [1, 10])
+def test_claim_after_rounds(vault, nft, owner, alchemist, weth, gas_report, rounds):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS)
+    make_claimable(vault, weth, rounds)
+
+    with gas_report.measure(f"Vault.claim[after_{rounds}_rounds]", vault):
+        vault.claim(TOKEN_IDS[0])
+
+
+def test_claim_with_nothing_to_claim(vault, nft, owner, alchemist, gas_report):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS)
+
+    with gas_report.measure("Vault.claim[nothing_to_claim]", vault):
+        vault.claim(TOKEN_IDS[0])
+
+
+def test_claim_many(vault, nft, owner, alchemist, weth, gas_report):
+    looped_token_ids = [token_id + len(TOKEN_IDS) for token_id in TOKEN_IDS]
+    fund(vault, nft, owner, alchemist, TOKEN_IDS + looped_token_ids)
+    make_claimable(vault, weth, 1)
+
+    with gas_report.measure(f"Vault.claim_many[{len(TOKEN_IDS)}_tokens]", vault):
+        vault.claim_many(TOKEN_IDS)
+
+    gas_report.measure_calls(
+        f"Vault.claim[{len(TOKEN_IDS)}_tokens_looped]",
+        vault,
+        [lambda token_id=token_id: vault.claim(token_id) for token_id in looped_token_ids],
+    )
+
+    assert (
+        gas_report.measurements[f"Vault.claim_many[{len(TOKEN_IDS)}_tokens]"]
+        < gas_report.measurements[f"Vault.claim[{len(TOKEN_IDS)}_tokens_looped]"]
+    )
+
+
+def test_liquidate(vault, nft, owner, alchemist, weth, gas_report):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS)
+
+    with gas_report.measure("Vault.liquidate[nothing_to_claim]", vault):
+        vault.liquidate(TOKEN_IDS[0], 0)
+
+    make_claimable(vault, weth, 1)
+
+    with gas_report.measure("Vault.liquidate[with_claimable]", vault):
+        vault.liquidate(TOKEN_IDS[1], 0)
+
+
+def test_views(vault, nft, owner, alchemist, weth, gas_report):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS)
+    make_claimable(vault, weth, 1)
+
+    with gas_report.measure("Vault.positions", vault):
+        vault.positions(TOKEN_IDS[0])
+
+    with gas_report.measure(f"Vault.positions_batch[{len(TOKEN_IDS)}_tokens]", vault):
+        vault.positions_batch(TOKEN_IDS)
+
+    with gas_report.measure("Vault.claimable_for_token", vault):
+        vault.claimable_for_token(TOKEN_IDS[0])
+
+
+def test_admin(vault, alchemist_deployer, owner, alice, gas_report):
+    new_alchemist = alchemist_deployer.deploy()
+    new_alchemist.eval(f"self.total_value = {10**30}")
+
+    with gas_report.measure("Vault.set_alchemist", vault):
+        vault.set_alchemist(new_alchemist)
+
+    with gas_report.measure("Vault.set_min_collateralization_cache", vault):
+        vault.set_min_collateralization_cache(True)
+
+    with gas_report.measure("Vault.set_harvest_buffer", vault):
+        vault.set_harvest_buffer(100)
+
+    with gas_report.measure("Vault.set_fund_receiver", vault):
+        vault.set_fund_receiver(alice)
+
+    with gas_report.measure("Vault.add_operator", vault):
+        vault.add_operator(alice)
+
+    with gas_report.measure("Vault.remove_operator", vault):
+        vault.remove_operator(alice)
+
+    with gas_report.measure("Vault.add_depositor", vault):
+        vault.add_depositor(alice)
+
+    with gas_report.measure("Vault.remove_depositor", vault):
+        vault.remove_depositor(alice)
+
+
+def test_ownership_transfer(vault, owner, alice, gas_report):
+    with gas_report.measure("Vault.suggest_owner", vault):
+        vault.suggest_owner(alice)
+
+    with boa.env.prank(alice):
+        with gas_report.measure("Vault.accept_owner", vault):
+            vault.accept_owner()
+
+    with gas_report.measure("Vault.suggest_migration_admin", vault):
+        vault.suggest_migration_admin(alice)
+
+    with boa.env.prank(alice):
+        with gas_report.measure("Vault.accept_migration_admin", vault):
+            vault.accept_migration_admin()
+
+
+def test_migration(vault, migrator, owner, gas_report):
+    with gas_report.measure("Vault.activate_migration", vault):
+        vault.activate_migration(migrator)
+
+    with gas_report.measure("Vault.deactivate_migration", vault):
+        vault.deactivate_migration()
+
+    vault.activate_migration(migrator)
+    boa.env.vm.patch.timestamp = vault.migration_active()
+
+    with gas_report.measure("Vault.migrate", vault):
+        vault.migrate()
+
+
+def test_import_positions(vault, nft, owner, alchemist, gas_report):
+    mint(nft, owner, TOKEN_IDS)
+    alchemist.eval(f"self.shares = {len(TOKEN_IDS) * AMOUNT}")
+    positions = [(token_id, AMOUNT, AMOUNT // 10, AMOUNT, False) for token_id in TOKEN_IDS]
+
+    with gas_report.measure(f"Vault.import_positions[{len(TOKEN_IDS)}_tokens]", vault):
+        vault.import_positions(positions, 10**35)
+
+
+def test_sweep_dust(vault, nft, owner, alchemist, weth, gas_report):
+    fund(vault, nft, owner, alchemist, TOKEN_IDS[:3])
+    make_claimable(vault, weth, 1)
+    # the mock leaves the deposited WETH in the vault, no position can
+    # claim it
+    assert vault.sweepable_dust() > 0
+
+    with gas_report.measure("Vault.sweep_dust", vault):
+        vault.sweep_dust()
@@ -0,0 +1,38 @@
+import time
+
+import boa
+
+from auction_engine import AuctionEngine
+
+RESERVE_PRICE = 10**18
+
+
+def now():
+    return boa.env.vm.patch.timestamp
+
+
+def seconds_per_bid(bid, bidders, count):
+    amount = RESERVE_PRICE
+    start = time.perf_counter()
+    for i in range(count):
+        bid(bidders[i % 2], amount)
+        amount = amount * 102 // 100
+    return (time.perf_counter() - start) / count
+
+
+def test_engine_is_100x_faster(house, alice, bob):
+    house.start_auction(0)
+    engine = AuctionEngine(RESERVE_PRICE, house.max_token_id())
+    engine.start_auction(0, now())
+
+    def house_bid(bidder, amount):
+        with boa.env.prank(bidder):
+            house.bid(0, amount)
+
+    def engine_bid(bidder, amount):
+        engine.bid(bidder, 0, amount, now())
+
+    house_time = seconds_per_bid(house_bid, [alice, bob], 20)
+    engine_time = seconds_per_bid(engine_bid, [alice, bob], 20_000)
+
+    assert house_time > 100 * engine_time
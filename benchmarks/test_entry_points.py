@@ -0,0 +1,29 @@
+import json
+import pathlib
+
+import pytest
+from vyper.compiler.output import build_abi_output
+
+BUDGETS_FILE = pathlib.Path(__file__).parent / "gas_budgets.json"
+
+
+@pytest.mark.parametrize(
+    "contract_name, deployer",
+    [("Vault", "vault_deployer"), ("AuctionHouse", "house_deployer")],
+)
+def test_every_state_changing_entry_point_has_a_budget(request, contract_name, deployer):
+    abi = build_abi_output(request.getfixturevalue(deployer).compiler_data)
+    entry_points = {
+        f["name"]
+        for f in abi
+        if f["type"] == "function" and f["stateMutability"] not in ("view", "pure")
+    }
+
+    budgets = json.loads(BUDGETS_FILE.read_text())
+    benchmarked = {
+        name.split(".")[1].split("[")[0]
+        for name in budgets
+        if name.split(".")[0] == contract_name
+    }
+
+    assert entry_points - benchmarked == set()
@@ -0,0 +1,52 @@
+import pytest
+import boa
+
+from gas_profiler import GasProfile, profile_gas
+
+TOKEN_IDS = [0, 1, 2]
+AMOUNT = 10**18
+
+
+@pytest.fixture()
+def funded_vault(vault, nft, weth, alchemist, owner):
+    nft.DEBUG_transferMinter(owner)
+    vault.add_depositor(owner)
+    weth.approve(vault, 2**256 - 1)
+    for token_id in TOKEN_IDS:
+        nft.mint(owner, token_id)
+    vault.register_deposits(TOKEN_IDS, [AMOUNT] * len(TOKEN_IDS))
+
+    alchemist.eval(f"self.shares = {vault.total_shares()}")
+    alchemist.eval(f"self.debt = {vault.total_shares() // 2}")
+    weth.transfer(vault, AMOUNT)
+    vault.withdraw_underlying_to_claim(AMOUNT, AMOUNT)
+    return vault
+
+
+def test_profile_accounts_for_all_gas(funded_vault):
+    with profile_gas():
+        funded_vault.liquidate(TOKEN_IDS[0], 0)
+
+    profile = GasProfile.of(funded_vault)
+
+    assert profile.total_gas == funded_vault._computation.get_gas_used()
+    assert sum(gas for _, gas in profile.by_line()) == profile.total_gas
+
+
+def test_profile_attributes_gas_to_lines_and_external_calls(funded_vault):
+    with profile_gas():
+        funded_vault.claim(TOKEN_IDS[0])
+
+    profile = GasProfile.of(funded_vault)
+    functions = {frames[:2] for frames, _ in profile.by_line()}
+    called = {(caller[1], child.msg.code_address) for caller, child in profile.calls}
+
+    assert ("Vault", "_record_claim") in functions
+    assert ("ERC20", "transfer") in functions
+    assert ("ERC721", "ownerOf") in functions
+    assert len(called) == 2
+
+    for line in profile.folded().splitlines():
+        stack, gas = line.rsplit(" ", 1)
+        assert stack.startswith("Vault;")
+        assert int(gas) > 0
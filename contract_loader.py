@@ -0,0 +1,129 @@
+"""
+Loads Vyper contracts with titanoboa and caches the compiled contracts on
+disk, so only contracts that changed are compiled again.
+
+    from contract_loader import load, load_partial
+
+    vault = load("contracts/Vault.vy", nft)
+    weth = load_partial("contracts/token/ERC20.vy").at(pytest.WETH)
+
+Artifacts are keyed by the contract source, the Vyper version and the
+compiler settings and are stored in `.compile_cache` (change with the
+`COMPILE_CACHE_DIR` environment variable). Deleting the directory is
+always safe.
+"""
+import hashlib
+import os
+import pathlib
+import pickle
+
+import vyper
+from boa.contract import VyperDeployer
+from vyper.codegen import core, self_call
+from vyper.compiler.phases import CompilerData
+from vyper.evm import opcodes
+from vyper.ir import compile_ir
+
+CACHE_DIR = pathlib.Path(
+    os.environ.get("COMPILE_CACHE_DIR", pathlib.Path(__file__).parent / ".compile_cache")
+)
+
+_deployers = {}
+
+
+def _cache_key(filename, source):
+    preimage = ":".join(
+        [
+            f"{vyper.__version__}+{vyper.__commit__}",
+            str(opcodes.active_evm_version),
+            str(filename),
+            source,
+        ]
+    )
+    return hashlib.sha256(preimage.encode()).hexdigest()
+
+
+def _label_counters():
+    return core._label, self_call._label_counter, compile_ir._next_symbol
+
+
+def _advance_label_counters(counters):
+    # labels are numbered per process, code compiled later (e.g. by eval)
+    # must not reuse a label of a contract restored from the cache
+    label, self_call_label, next_symbol = counters
+    core._label = max(core._label, label)
+    self_call._label_counter = max(self_call._label_counter, self_call_label)
+    compile_ir._next_symbol = max(compile_ir._next_symbol, next_symbol)
+
+
+def _compile(filename, source):
+    compiler_data = CompilerData(source, str(filename))
+    # force bytecode, ABI and source map so they are part of the artifact
+    compiler_data.bytecode
+    compiler_data.bytecode_runtime
+    return compiler_data
+
+
+def _restore(path):
+    try:
+        with open(path, "rb") as f:
+            compiler_data, counters = pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+
+    _advance_label_counters(counters)
+    return compiler_data
+
+
+def _store(path, compiler_data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # several processes (e.g. pytest-xdist workers) may compile the same
+    # contract at the same time, write to a private file first and move it
+    # into place atomically
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump((compiler_data, _label_counters()), f)
+    os.replace(tmp_path, path)
+
+
+def load_partial(filename, cache_dir=CACHE_DIR):
+    """
+    Returns a deployer for the contract in filename, restored from
+    cache_dir if it was compiled before. Pass cache_dir=None to always
+    compile.
+    """
+    with open(filename) as f:
+        source = f.read()
+
+    return loads_partial(source, filename, cache_dir)
+
+
+def loads_partial(source, filename, cache_dir=CACHE_DIR):
+    """
+    Returns a deployer for source, e.g. a contract in filename with a
+    changed constant, see load_partial.
+    """
+    key = _cache_key(filename, source)
+    if key in _deployers:
+        return _deployers[key]
+
+    compiler_data = None
+    if cache_dir is not None:
+        path = pathlib.Path(cache_dir) / f"{key}.pickle"
+        compiler_data = _restore(path)
+
+    if compiler_data is None:
+        compiler_data = _compile(filename, source)
+        if cache_dir is not None:
+            _store(path, compiler_data)
+
+    _deployers[key] = VyperDeployer(compiler_data)
+    return _deployers[key]
+
+
+def load(filename, *args, **kwargs):
+    """
+    Deploys the contract in filename, see load_partial.
+    """
+    return load_partial(filename).deploy(*args, **kwargs)
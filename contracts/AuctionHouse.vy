@@ -14,6 +14,11 @@
     highest bidder and the auction proceeds are being transferred to the vault.
 
     Bidding happens in WETH, any new bid refunds the previous bidder.
+    If pull refunds are enabled by the owner, the refund is credited to
+    the previous bidder instead. Credited refunds can be withdrawn at any
+    time and are used first when the previous bidder places a new bid.
+    The highest bidder can raise their own bid by only transferring the
+    difference.
 
     A bid close to epoch_end extends the auction by 15min since last bid to 
     prevent sniping.
@@ -21,6 +26,11 @@
     If an epoch ends with no bids, the NFT is minted to the FALLBACK_RECEIVER 
     address.
 
+    If settlement is delayed for several epochs, settle_and_catch_up settles
+    the elapsed epochs without bids in one call and keeps the original
+    epoch schedule, unless less than MIN_EPOCH_LENGTH would be left of the
+    next epoch.
+
     The owner can change the max_token_id / max number of NFTs minted.
 
     The owner can transfer ownership to a new address in a 2 step process
@@ -48,6 +58,9 @@ EPOCH_LENGTH: public(constant(uint256)) = 60 * 60 * 24  # 1 day in seconds
 TIME_BUFFER: public(constant(uint256)) = 15 * 60  # 15 min in seconds
 
 MIN_INCREMENT_PCT: public(constant(uint256)) = 2  # 2%
+MAX_REFUNDS_PER_CALL: constant(uint256) = 100
+MAX_CATCH_UP_EPOCHS: constant(uint256) = 50
+MIN_EPOCH_LENGTH: public(constant(uint256)) = 60 * 60 * 12  # 12 hours in seconds
 RESERVE_PRICE: public(immutable(uint256))
 
 current_epoch_token_id: public(uint256)
@@ -60,22 +73,25 @@ epoch_start: public(uint256)
 epoch_end: public(uint256)
 auction_started: public(bool)
 
+pull_refunds: public(bool)
+pending_refunds: public(HashMap[address, uint256])
+
 owner: public(address)
 suggested_owner: public(address)
 
 
 event Bid:
-    token_id: uint256
+    token_id: indexed(uint256)
     bidder: indexed(address)
     amount: uint256
 
 event AuctionSettled:
-    token_id: uint256
+    token_id: indexed(uint256)
     winner: indexed(address)
     amount: uint256
 
 event AuctionSettledWithNoBid:
-    token_id: uint256
+    token_id: indexed(uint256)
     fallback_receiver: indexed(address)
 
 event AuctionStart:
@@ -83,11 +99,15 @@ event AuctionStart:
     account: indexed(address)
 
 event AuctionExtended:
-    token_id: uint256
+    token_id: indexed(uint256)
     new_end_time: uint256
 
 event BidRefunded:
-    token_id: uint256
+    token_id: indexed(uint256)
+    receiver: indexed(address)
+    amount: uint256
+
+event RefundWithdrawn:
     receiver: indexed(address)
     amount: uint256
 
@@ -137,7 +157,12 @@ def bid(_token_id: uint256, _amount: uint256):
         Create a new bid for _token_id with _amount.
         Requires msg.sender to have approved _amount of WETH to be transferred
         by this contract.
-        If the bid is valid, the previous bidder is refunded.
+        If msg.sender is already the highest bidder, the bid is topped up
+        and only the difference to the current highest bid is collected.
+        Pending refunds of msg.sender are used first, only the remainder
+        is transferred.
+        If the bid is valid, the previous bidder is refunded, or credited
+        if pull_refunds is enabled.
         If the bid is close to epoch_end, the auction is extended to prevent 
         sniping.
     @param _token_id
@@ -162,16 +187,75 @@ def bid(_token_id: uint256, _amount: uint256):
         self.epoch_end = block.timestamp + TIME_BUFFER
         log AuctionExtended(_token_id, self.epoch_end)
 
-    # refund last bidder
-    if last_bidder != empty(address) and last_bid > 0:
-        ERC20(WETH).transfer(last_bidder, last_bid)
+    amount_to_collect: uint256 = _amount
+
+    if last_bidder == msg.sender:
+        # top up own bid, the last bid stays in the contract
+        amount_to_collect -= last_bid
+    elif last_bidder != empty(address) and last_bid > 0:
+        # refund last bidder
+        if self.pull_refunds:
+            self.pending_refunds[last_bidder] += last_bid
+        else:
+            ERC20(WETH).transfer(last_bidder, last_bid)
         log BidRefunded(_token_id, last_bidder, last_bid)
 
-    # collect bid from current bidder
-    ERC20(WETH).transferFrom(msg.sender, self, _amount)
+    # collect bid from current bidder, pending refunds are used first
+    credit: uint256 = self.pending_refunds[msg.sender]
+    if credit > 0:
+        credit_used: uint256 = min(credit, amount_to_collect)
+        self.pending_refunds[msg.sender] = credit - credit_used
+        amount_to_collect -= credit_used
+
+    if amount_to_collect > 0:
+        ERC20(WETH).transferFrom(msg.sender, self, amount_to_collect)
     log Bid(_token_id, self.highest_bidder, self.highest_bid)
 
 
+@external
+@nonreentrant("lock")
+def withdraw_refund() -> uint256:
+    """
+    @notice
+        Transfers the pending refunds of msg.sender to msg.sender.
+    """
+    return self._withdraw_refund(msg.sender)
+
+
+@external
+@nonreentrant("lock")
+def withdraw_refunds(_receivers: DynArray[address, MAX_REFUNDS_PER_CALL]) -> uint256:
+    """
+    @notice
+        Transfers the pending refunds of all _receivers to them.
+        Can be called by anyone, e.g. a keeper paying out refunds
+        after a busy auction.
+    @param _receivers
+        The addresses to pay out the pending refunds for.
+    """
+    total_amount: uint256 = 0
+    for receiver in _receivers:
+        total_amount += self._withdraw_refund(receiver)
+    return total_amount
+
+
+@internal
+def _withdraw_refund(_receiver: address) -> uint256:
+    """
+    @notice
+        Transfers the pending refunds of _receiver to _receiver.
+    """
+    amount: uint256 = self.pending_refunds[_receiver]
+    if amount == 0:
+        return 0
+
+    self.pending_refunds[_receiver] = 0
+    ERC20(WETH).transfer(_receiver, amount)
+
+    log RefundWithdrawn(_receiver, amount)
+    return amount
+
+
 @external
 def settle():
     """
@@ -183,6 +267,37 @@ def settle():
         address.
         Resets everything and starts the next epoch / auction.
     """
+    self._settle(False, 0)
+
+
+@external
+def settle_and_catch_up(_max_missed_epochs: uint256):
+    """
+    @notice
+        Settles the latest epoch / auction like `settle`.
+        Additionally settles up to _max_missed_epochs following epochs
+        that have fully elapsed while waiting for settlement. Nobody could
+        bid in these epochs, so their NFTs are minted to the
+        FALLBACK_RECEIVER address.
+        The next epoch starts where the last settled epoch ended instead
+        of at block.timestamp, so the schedule does not drift. If that
+        epoch is in progress and ends within MIN_EPOCH_LENGTH, it starts
+        at block.timestamp instead, so nobody can settle into a short
+        auction with few bidders.
+    @param _max_missed_epochs
+        The maximum number of elapsed epochs to settle in addition to the
+        latest epoch. Capped at MAX_CATCH_UP_EPOCHS.
+    """
+    self._settle(True, _max_missed_epochs)
+
+
+@internal
+def _settle(_catch_up: bool, _max_missed_epochs: uint256):
+    """
+    @notice
+        Settles the latest epoch and, if _catch_up is set, up to
+        _max_missed_epochs elapsed epochs without bids.
+    """
     assert self.auction_started, "auction not started"
     assert self._epoch_in_progress() == False, "epoch not over"
 
@@ -198,10 +313,31 @@ def settle():
     self.highest_bid = 0
     self.highest_bidder = empty(address)
 
+    # count the epochs that fully elapsed since the latest epoch ended
+    next_epoch_start: uint256 = block.timestamp
+    missed_epochs: uint256 = 0
+    if _catch_up:
+        next_epoch_start = self.epoch_end
+        max_token_id: uint256 = self.max_token_id
+        for i in range(MAX_CATCH_UP_EPOCHS):
+            if i >= _max_missed_epochs or token_id + i >= max_token_id:
+                break
+            if next_epoch_start + EPOCH_LENGTH >= block.timestamp:
+                break
+            missed_epochs += 1
+            next_epoch_start += EPOCH_LENGTH
+
+        next_epoch_end: uint256 = next_epoch_start + EPOCH_LENGTH
+        if next_epoch_end > block.timestamp and next_epoch_end < block.timestamp + MIN_EPOCH_LENGTH:
+            next_epoch_start = block.timestamp
+
+    last_token_id: uint256 = token_id + missed_epochs
+    self.current_epoch_token_id = last_token_id
+
     # set up next round if there is one
-    if self.current_epoch_token_id < self.max_token_id:
+    if last_token_id < self.max_token_id:
         self.current_epoch_token_id += 1
-        self.epoch_start = block.timestamp
+        self.epoch_start = next_epoch_start
         self.epoch_end = self.epoch_start + EPOCH_LENGTH
     else:
         self.epoch_start = 0
@@ -209,6 +345,12 @@ def settle():
 
     MintableNFT(NFT).mint(winner, token_id)
 
+    for i in range(MAX_CATCH_UP_EPOCHS):
+        if i >= missed_epochs:
+            break
+        MintableNFT(NFT).mint(FALLBACK_RECEIVER, token_id + 1 + i)
+        log AuctionSettledWithNoBid(token_id + 1 + i, FALLBACK_RECEIVER)
+
     if winning_amount > 0:
         ERC20(WETH).approve(self.vault, winning_amount)
         Vault(self.vault).register_deposit(token_id, winning_amount)
@@ -298,6 +440,22 @@ def set_max_token_id(_new_max_token_id: uint256):
     self.max_token_id = _new_max_token_id
 
 
+@external
+def set_pull_refunds(_enabled: bool):
+    """
+    @notice
+        Enables or disables pull refunds.
+        When enabled, outbid bidders are credited in pending_refunds
+        instead of being refunded with a WETH transfer.
+        Can only be called by owner.
+    @param _enabled
+        True to credit refunds, False to transfer them.
+    """
+    assert msg.sender == self.owner, "unauthorized"
+
+    self.pull_refunds = _enabled
+
+
 @external
 def set_vault(_new_vault_address: address):
     """
@@ -88,6 +88,10 @@ interface Migrator:
 
 
 DECIMALS: constant(uint256) = 10**18
+# scale of amount_claimable_per_share, high enough that rounding the
+# per share value of a distribution loses no meaningful WETH
+CLAIMABLE_PRECISION: constant(uint256) = 10**36
+MAX_BATCH_SIZE: constant(uint256) = 256
 
 ALCX_YVWETH: constant(address) = 0xa258C4606Ca8206D8aA700cE2143D7db854D168c
 WETH: constant(address) = 0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2
@@ -97,6 +101,14 @@ NFT: public(immutable(address))
 alchemist: public(address)
 fund_receiver: public(address)
 
+# opt-in cache of IAlchemist.minimumCollateralization(), 0 if disabled
+cached_min_collateralization: public(uint256)
+
+MAX_BPS: constant(uint256) = 10_000
+# collateralization kept above the minimum by harvest, in bps of the
+# minimum, so that the debt left behind can still be liquidated
+harvest_buffer_bps: public(uint256)
+
 struct Position:
     token_id: uint256
     amount_deposited: uint256
@@ -104,9 +116,48 @@ struct Position:
     shares_owned: uint256
     is_liquidated: bool
 
-positions: public(HashMap[uint256, Position])
+struct PositionSummary:
+    token_id: uint256
+    amount_deposited: uint256
+    amount_claimed: uint256
+    shares_owned: uint256
+    is_liquidated: bool
+    claimable: uint256
+
+# The part of a Position needed to claim.
+# A position has earned shares_owned * amount_claimable_per_share, its
+# reward_debt is what was earned before it was deposited plus what it
+# claimed since.
+struct ClaimData:
+    reward_debt: uint256
+    shares_owned: uint256
+    is_liquidated: bool
+
+# Storage layout of a Position, packed so that claiming only touches
+# a single slot:
+#   claim_data:   reward_debt (bits 0-127)
+#                 | shares_owned (bits 128-254)
+#                 | is_liquidated (bit 255)
+#   deposit_data: amount_deposited (bits 0-127)
+#                 | initial_reward_debt (bits 128-255)
+struct PackedPosition:
+    claim_data: uint256
+    deposit_data: uint256
+
+MAX_REWARD_DEBT: constant(uint256) = 2**128 - 1
+MAX_SHARES_OWNED: constant(uint256) = 2**127 - 1
+MAX_AMOUNT_DEPOSITED: constant(uint256) = 2**128 - 1
+LIQUIDATED_FLAG: constant(uint256) = 2**255
+
+packed_positions: HashMap[uint256, PackedPosition]
 total_shares: public(uint256)
+# only ever grows, positions remember the value at their deposit as
+# initial_reward_debt instead of it being rescaled on every deposit
 amount_claimable_per_share: public(uint256)
+# sum of the reward_debt of the positions that are not liquidated and
+# their number, to bound the WETH they can still claim
+total_reward_debt: uint256
+open_positions: uint256
 
 owner: public(address)
 suggested_owner: public(address)
@@ -124,7 +175,7 @@ migration_executed: public(bool)
 
 event Deposit:
     token_owner: indexed(address)
-    token_id: uint256
+    token_id: indexed(uint256)
     amount: uint256
 
 event Funded:
@@ -132,7 +183,7 @@ event Funded:
     amount: uint256
 
 event Liquidated:
-    token_id: uint256
+    token_id: indexed(uint256)
     token_owner: indexed(address)
     amount: uint256
 
@@ -140,14 +191,31 @@ event Claimable:
     amount: uint256
 
 event Claimed:
-    token_id: uint256
+    token_id: indexed(uint256)
     token_owner: indexed(address)
     amount: uint256
 
+event DustSwept:
+    receiver: indexed(address)
+    amount: uint256
+
+event PositionImported:
+    token_id: indexed(uint256)
+    shares_owned: uint256
+    amount_claimed: uint256
+
 event AlchemistUpdated:
     updater: indexed(address)
     new_alchemist: indexed(address)
 
+event MinCollateralizationCacheUpdated:
+    updater: indexed(address)
+    min_collateralization: uint256
+
+event HarvestBufferUpdated:
+    updater: indexed(address)
+    harvest_buffer_bps: uint256
+
 event FundReceiverUpdated:
     updater: indexed(address)
     new_fund_receiver: indexed(address)
@@ -201,6 +269,7 @@ def __init__(
     self.owner = msg.sender
     self.is_operator[msg.sender] = True
     self.fund_receiver = msg.sender
+    self.harvest_buffer_bps = 10
 
     self.migration_active = max_value(uint256)
     self.migration_admin = msg.sender
@@ -218,53 +287,151 @@ def register_deposit(_token_id: uint256, _amount: uint256):
     assert self.is_depositor[msg.sender], "not allowed"
     assert self._is_valid_token_id(_token_id)
 
-    position: Position = self.positions[_token_id]
-    assert position.amount_deposited == 0, "can only deposit once per token"
-
-    position.token_id = _token_id
-    position.amount_deposited = _amount
+    assert self.packed_positions[_token_id].deposit_data == 0, "can only deposit once per token"
 
     # transfer WETH to self
     ERC20(WETH).transferFrom(msg.sender, self, _amount)
 
-    total_claimable: uint256 = self.total_shares * self.amount_claimable_per_share
-
     # deposit WETH to Alchemix
     shares_issued: uint256 = self._deposit_to_alchemist(_amount)
-    position.shares_owned = shares_issued
-    self.total_shares += shares_issued
+    self._open_position(_token_id, _amount, shares_issued)
+
+    self._fund_new_shares(shares_issued)
+
+    log Deposit(msg.sender, _token_id, _amount)
+
+
+@nonreentrant("lock")
+@external
+def register_deposits(
+    _token_ids: DynArray[uint256, MAX_BATCH_SIZE],
+    _amounts: DynArray[uint256, MAX_BATCH_SIZE]
+):
+    """
+    @notice
+        Registers a deposit of _amounts[i] for each of _token_ids.
+        The summed up WETH is pulled and deposited into Alchemix once
+        and a single loan is taken out and sent to fund_receiver.
+        The issued shares are split pro rata to the deposited amounts,
+        the last token receives the rounding remainder.
+    """
+    assert self.is_depositor[msg.sender], "not allowed"
+    assert len(_token_ids) == len(_amounts), "length mismatch"
+    assert len(_token_ids) > 0, "nothing to deposit"
+
+    total_amount: uint256 = 0
+    for i in range(MAX_BATCH_SIZE):
+        if i >= len(_token_ids):
+            break
+        token_id: uint256 = _token_ids[i]
+        assert self._is_valid_token_id(token_id)
+        assert _amounts[i] > 0, "cannot deposit zero"
+        assert self.packed_positions[token_id].deposit_data == 0, "can only deposit once per token"
+
+        # writing amount_deposited first also rejects duplicate token ids
+        self.packed_positions[token_id].deposit_data = _amounts[i]
+        total_amount += _amounts[i]
+
+    # transfer WETH to self
+    ERC20(WETH).transferFrom(msg.sender, self, total_amount)
+
+    # deposit WETH to Alchemix
+    shares_issued: uint256 = self._deposit_to_alchemist(total_amount)
+
+    shares_left: uint256 = shares_issued
+    last: uint256 = len(_token_ids) - 1
+    for i in range(MAX_BATCH_SIZE):
+        if i > last:
+            break
+        shares_owned: uint256 = shares_left
+        if i != last:
+            shares_owned = shares_issued * _amounts[i] / total_amount
+            shares_left -= shares_owned
+        self._open_position(_token_ids[i], _amounts[i], shares_owned)
+
+    self._fund_new_shares(shares_issued)
+
+    for i in range(MAX_BATCH_SIZE):
+        if i > last:
+            break
+        log Deposit(msg.sender, _token_ids[i], _amounts[i])
 
-    if self.amount_claimable_per_share > 0:
-        self.amount_claimable_per_share = total_claimable / self.total_shares
-    
-    self.positions[_token_id] = position
+
+@internal
+def _open_position(_token_id: uint256, _amount_deposited: uint256, _shares_owned: uint256):
+    """
+    @notice
+        Stores a new position of _shares_owned for _token_id.
+        Its reward_debt starts at what its shares would have earned
+        so far, rounded up, so it can only claim later distributions.
+    """
+    assert _amount_deposited <= MAX_AMOUNT_DEPOSITED, "amount deposited overflow"
+
+    earned: uint256 = _shares_owned * self.amount_claimable_per_share
+    initial_reward_debt: uint256 = earned / CLAIMABLE_PRECISION
+    if initial_reward_debt * CLAIMABLE_PRECISION < earned:
+        initial_reward_debt += 1
+
+    self._store_claim_data(_token_id, ClaimData({
+        reward_debt: initial_reward_debt,
+        shares_owned: _shares_owned,
+        is_liquidated: False
+    }))
+    self.packed_positions[_token_id].deposit_data = _amount_deposited | shift(initial_reward_debt, 128)
+    self.total_reward_debt += initial_reward_debt
+    self.open_positions += 1
+
+
+@internal
+def _fund_new_shares(_shares_issued: uint256):
+    """
+    @notice
+        Adds _shares_issued to total_shares and mints the corresponding
+        Alchemix debt to fund_receiver.
+    """
+    self.total_shares += _shares_issued
 
     # mint alchemix debt to fund_receiver
-    amount_to_mint: uint256 = self._calculate_amount_to_mint(shares_issued)
+    amount_to_mint: uint256 = self._calculate_amount_to_mint(_shares_issued)
     assert amount_to_mint > 0, "cannot mint new Alchemix debt"
 
     self._mint_from_alchemix(amount_to_mint, self.fund_receiver)
 
-    log Deposit(msg.sender, _token_id, _amount)
-
 
 @internal
 @view
 def _calculate_amount_to_mint(_amount_shares: uint256) -> uint256:
-    return min(self._calculate_mintable_amount(_amount_shares), self._calculate_max_mintable_amount())
+    min_collateralization: uint256 = self._min_collateralization()
+    return min(
+        self._calculate_mintable_amount(_amount_shares, min_collateralization),
+        self._calculate_max_mintable_amount(min_collateralization)
+    )
+
+
+@internal
+@view
+def _min_collateralization() -> uint256:
+    """
+    @notice
+        Returns the cached minimum collateralization if the cache is enabled,
+        otherwise fetches it from Alchemix.
+    """
+    cached: uint256 = self.cached_min_collateralization
+    if cached != 0:
+        return cached
+    return IAlchemist(self.alchemist).minimumCollateralization()
 
 
 @internal
 @view
-def _calculate_mintable_amount(_amount_shares: uint256) -> uint256:
+def _calculate_mintable_amount(_amount_shares: uint256, _min_collateralization: uint256) -> uint256:
     """
     @notice
         Calculate the mintable amount of debt tokens given _amount_shares new
         shares as collateral.
         This function does not account for existing debts on Alchemix.
     """
-    min_collateralization: uint256 = IAlchemist(self.alchemist).minimumCollateralization()
-    amount_shares_collateralized: uint256 = _amount_shares * DECIMALS / min_collateralization
+    amount_shares_collateralized: uint256 = _amount_shares * DECIMALS / _min_collateralization
     amount_underlying: uint256 = IAlchemist(self.alchemist).convertSharesToUnderlyingTokens(ALCX_YVWETH, amount_shares_collateralized)
     mintable_debt: uint256 = IAlchemist(self.alchemist).normalizeUnderlyingTokensToDebt(WETH, amount_underlying)
     if mintable_debt > 0:
@@ -275,7 +442,7 @@ def _calculate_mintable_amount(_amount_shares: uint256) -> uint256:
 
 @internal
 @view
-def _calculate_max_mintable_amount() -> uint256:
+def _calculate_max_mintable_amount(_min_collateralization: uint256) -> uint256:
     """
     @notice
         Calculate the maximum mintable amount of debt tokens given the current
@@ -284,9 +451,8 @@ def _calculate_max_mintable_amount() -> uint256:
     # Alchemist._validate(): uint256 collateralization = totalValue(owner) * 1e18 / uint256(debt);
     current_debt: uint256 = convert(IAlchemist(self.alchemist).accounts(self)[0], uint256)
     total_value: uint256 = IAlchemist(self.alchemist).totalValue(self)
-    min_collateralization: uint256 = IAlchemist(self.alchemist).minimumCollateralization()
 
-    max_mintable_debt: uint256 = total_value * DECIMALS / min_collateralization - current_debt
+    max_mintable_debt: uint256 = total_value * DECIMALS / _min_collateralization - current_debt
 
     if max_mintable_debt > 0:
         max_mintable_debt = max_mintable_debt - 1 # minus 1 for collat < min_collat check @ alchemist._validate
@@ -344,18 +510,20 @@ def liquidate(_token_id: uint256, _min_weth_out: uint256) -> uint256:
     token_owner: address = ERC721(NFT).ownerOf(_token_id)
     assert token_owner == msg.sender, "only token owner can liquidate"
     
-    assert self.positions[_token_id].is_liquidated == False, "position already liquidated"
+    assert self._load_claim_data(_token_id).is_liquidated == False, "position already liquidated"
 
     self._claim(_token_id)
 
-    position: Position = self.positions[_token_id]
+    position: ClaimData = self._load_claim_data(_token_id)
     position.is_liquidated = True
-    self.positions[_token_id] = position
+    self._store_claim_data(_token_id, position)
 
     shares_in_vault: uint256 = IAlchemist(self.alchemist).positions(self, ALCX_YVWETH)[0]
     remaining_shares_ratio: uint256 = shares_in_vault * DECIMALS / self.total_shares
 
     self.total_shares -= position.shares_owned
+    self.total_reward_debt -= position.reward_debt
+    self.open_positions -= 1
 
     remaining_position_shares: uint256 = position.shares_owned * remaining_shares_ratio / DECIMALS
 
@@ -422,10 +590,73 @@ def withdraw_underlying_to_claim(_amount_shares: uint256, _min_weth_out: uint256
         to token holders.
         The WETH is held in this contract until it is `claim`ed.
     """
+    self._withdraw_to_claim(_amount_shares, _min_weth_out)
+
+
+@external
+def harvest(_min_weth_out: uint256) -> uint256:
+    """
+    @notice
+        Withdraws all shares unlocked by paid off Alchemix debt and makes
+        the WETH claimable by token holders, so keepers don't need to
+        calculate the shares for `withdraw_underlying_to_claim`.
+        Reverts if nothing is unlocked or less than _min_weth_out is
+        received.
+    """
+    amount_shares: uint256 = self._unlocked_shares()
+    assert amount_shares > 0, "nothing to harvest"
+
+    return self._withdraw_to_claim(amount_shares, _min_weth_out)
+
+
+@view
+@external
+def unlocked_shares() -> uint256:
+    return self._unlocked_shares()
+
+
+@view
+@internal
+def _unlocked_shares() -> uint256:
+    """
+    @notice
+        Calculates the shares that can be withdrawn from Alchemix while
+        the remaining collateral still covers the debt at the minimum
+        collateralization plus harvest_buffer_bps.
+        Liquidating a position keeps the collateralization about where
+        it is, so the buffer has to cover its rounding: right at the
+        minimum, a liquidation after a harvest would revert.
+    """
+    shares_in_vault: uint256 = IAlchemist(self.alchemist).positions(self, ALCX_YVWETH)[0]
+    total_value: uint256 = IAlchemist(self.alchemist).totalValue(self)
+    if shares_in_vault == 0 or total_value == 0:
+        return 0
+
+    current_debt: int256 = IAlchemist(self.alchemist).accounts(self)[0]
+    locked_value: uint256 = 0
+    if current_debt > 0:
+        # rounded up, the withdrawal must not fail Alchemist._validate()
+        min_collateralization: uint256 = self._min_collateralization() * (MAX_BPS + self.harvest_buffer_bps)
+        locked_value = (convert(current_debt, uint256) * min_collateralization + DECIMALS * MAX_BPS - 1) / (DECIMALS * MAX_BPS)
+
+    if locked_value >= total_value:
+        return 0
+
+    return shares_in_vault * (total_value - locked_value) / total_value
+
+
+@internal
+def _withdraw_to_claim(_amount_shares: uint256, _min_weth_out: uint256) -> uint256:
+    """
+    @notice
+        Withdraws _amount_shares from Alchemix to this contract and marks
+        the WETH as claimable.
+    """
     amount_withdrawn: uint256 = self._withdraw_underlying_from_alchemix(_amount_shares, self, _min_weth_out)
     self._mark_as_claimable(amount_withdrawn)
 
     log Claimable(amount_withdrawn)
+    return amount_withdrawn
 
 
 @internal
@@ -440,8 +671,60 @@ def _mark_as_claimable(_amount: uint256):
 
     assert ERC20(WETH).balanceOf(self) >= _amount
 
-    self.amount_claimable_per_share += _amount * DECIMALS / self.total_shares
-    
+    amount_scaled: uint256 = _amount * CLAIMABLE_PRECISION
+    added_per_share: uint256 = amount_scaled / self.total_shares
+    self.amount_claimable_per_share += added_per_share
+
+
+@external
+def sweep_dust() -> uint256:
+    """
+    @notice
+        Sends the WETH of this contract that no token can claim anymore
+        to fund_receiver, see sweepable_dust.
+    """
+    amount: uint256 = self._sweepable_dust()
+    if amount == 0:
+        return 0
+
+    ERC20(WETH).transfer(self.fund_receiver, amount)
+
+    log DustSwept(self.fund_receiver, amount)
+    return amount
+
+
+@view
+@external
+def sweepable_dust() -> uint256:
+    return self._sweepable_dust()
+
+
+@view
+@internal
+def _sweepable_dust() -> uint256:
+    """
+    @notice
+        Calculates the WETH held above what the open positions can
+        still claim: the remainders of rounding amount_claimable_per_share
+        and the claimable amounts down and the initial reward debts up,
+        and WETH sent to this contract directly.
+        What the open positions can claim is bounded by what all their
+        shares earned minus their reward debt. A position whose initial
+        reward debt was rounded up can have earned a wei less than its
+        debt and claim 0, so a wei per open position is kept back too.
+    """
+    earned: uint256 = self.total_shares * self.amount_claimable_per_share / CLAIMABLE_PRECISION
+    max_claimable: uint256 = earned + self.open_positions
+    if max_claimable > self.total_reward_debt:
+        max_claimable -= self.total_reward_debt
+    else:
+        max_claimable = 0
+
+    weth_balance: uint256 = ERC20(WETH).balanceOf(self)
+    if weth_balance <= max_claimable:
+        return 0
+    return weth_balance - max_claimable
+
 
 @view
 @external
@@ -456,45 +739,210 @@ def _claimable_for_token(_token_id: uint256) -> uint256:
     @notice
         Calculates the pending WETH for a given token_id.
     """
-    position: Position = self.positions[_token_id]
-    if position.is_liquidated:
+    return self._claimable_for_position(self._load_claim_data(_token_id))
+
+
+@view
+@internal
+def _claimable_for_position(_position: ClaimData) -> uint256:
+    """
+    @notice
+        Calculates the pending WETH for a given _position.
+    """
+    if _position.is_liquidated:
         return 0
-    
 
-    total_claimable_for_position: uint256 = position.shares_owned * self.amount_claimable_per_share / DECIMALS
-    if total_claimable_for_position < position.amount_claimed:
+    earned: uint256 = _position.shares_owned * self.amount_claimable_per_share / CLAIMABLE_PRECISION
+    if earned < _position.reward_debt:
         return 0
 
-    return total_claimable_for_position - position.amount_claimed
+    return earned - _position.reward_debt
 
 
 @external
 def claim(_token_id: uint256) -> uint256:
     return self._claim(_token_id)
 
+
+@external
+def claim_many(_token_ids: DynArray[uint256, MAX_BATCH_SIZE]) -> uint256:
+    """
+    @notice
+        Allows a token holder to claim the pending WETH of several tokens
+        at once. The claimed amounts are summed up and transferred in a
+        single WETH transfer.
+        Reverts if msg.sender does not own all of _token_ids.
+    """
+    total_amount: uint256 = 0
+    for token_id in _token_ids:
+        total_amount += self._record_claim(token_id)
+
+    if total_amount > 0:
+        ERC20(WETH).transfer(msg.sender, total_amount)
+
+    return total_amount
+
+
 @internal
 def _claim(_token_id: uint256) -> uint256:
     """
     @notice
         Allows a token holder to claim his share of pending WETH.
     """
+    amount: uint256 = self._record_claim(_token_id)
+    if amount == 0:
+        return 0
+    
+    ERC20(WETH).transfer(msg.sender, amount)
+    return amount
+
+
+@internal
+def _record_claim(_token_id: uint256) -> uint256:
+    """
+    @notice
+        Books the pending WETH of _token_id as claimed without
+        transferring it. The caller is responsible for the transfer.
+        Reverts if msg.sender is not the token owner.
+    """
     token_owner: address = ERC721(NFT).ownerOf(_token_id)
     assert msg.sender == token_owner, "only token owner can claim"
 
-    amount: uint256 = self._claimable_for_token(_token_id)
+    position: ClaimData = self._load_claim_data(_token_id)
+    amount: uint256 = self._claimable_for_position(position)
     if amount == 0:
         return 0
     
-    position: Position = self.positions[_token_id]
-    position.amount_claimed += amount
-    self.positions[_token_id] = position
-    
-    ERC20(WETH).transfer(token_owner, amount)
+    position.reward_debt += amount
+    self._store_claim_data(_token_id, position)
+    self.total_reward_debt += amount
 
     log Claimed(_token_id, token_owner, amount)
     return amount
 
 
+@view
+@external
+def positions(_token_id: uint256) -> Position:
+    return self._load_position(_token_id)
+
+
+@view
+@external
+def positions_batch(
+    _token_ids: DynArray[uint256, MAX_BATCH_SIZE]
+) -> DynArray[PositionSummary, MAX_BATCH_SIZE]:
+    """
+    @notice
+        Returns the position and the pending WETH of each of _token_ids,
+        so a whole portfolio can be loaded in a single call.
+    """
+    summaries: DynArray[PositionSummary, MAX_BATCH_SIZE] = []
+    for token_id in _token_ids:
+        claim_data: ClaimData = self._load_claim_data(token_id)
+        position: Position = self._to_position(token_id, claim_data, self.packed_positions[token_id].deposit_data)
+        summaries.append(PositionSummary({
+            token_id: token_id,
+            amount_deposited: position.amount_deposited,
+            amount_claimed: position.amount_claimed,
+            shares_owned: position.shares_owned,
+            is_liquidated: position.is_liquidated,
+            claimable: self._claimable_for_position(claim_data)
+        }))
+    return summaries
+
+
+@view
+@internal
+def _load_position(_token_id: uint256) -> Position:
+    """
+    @notice
+        Reads and unpacks the full position of _token_id.
+    """
+    return self._to_position(
+        _token_id,
+        self._load_claim_data(_token_id),
+        self.packed_positions[_token_id].deposit_data
+    )
+
+
+@pure
+@internal
+def _to_position(_token_id: uint256, _claim_data: ClaimData, _deposit_data: uint256) -> Position:
+    """
+    @notice
+        Combines _claim_data and the packed _deposit_data of _token_id
+        into its Position.
+        amount_claimed is the reward_debt gained after the deposit.
+        token_id is 0 until the token is deposited, as it was when
+        positions stored it.
+    """
+    amount_deposited: uint256 = _deposit_data & MAX_AMOUNT_DEPOSITED
+    token_id: uint256 = 0
+    if amount_deposited > 0:
+        token_id = _token_id
+
+    return Position({
+        token_id: token_id,
+        amount_deposited: amount_deposited,
+        amount_claimed: _claim_data.reward_debt - shift(_deposit_data, -128),
+        shares_owned: _claim_data.shares_owned,
+        is_liquidated: _claim_data.is_liquidated
+    })
+
+
+@internal
+def _store_position(_position: Position):
+    """
+    @notice
+        Packs and writes the full position of _position.token_id with
+        an initial_reward_debt of 0, as positions had before the vault
+        tracked reward debt.
+    """
+    assert _position.amount_deposited <= MAX_AMOUNT_DEPOSITED, "amount deposited overflow"
+
+    self._store_claim_data(_position.token_id, ClaimData({
+        reward_debt: _position.amount_claimed,
+        shares_owned: _position.shares_owned,
+        is_liquidated: _position.is_liquidated
+    }))
+    self.packed_positions[_position.token_id].deposit_data = _position.amount_deposited
+
+
+@view
+@internal
+def _load_claim_data(_token_id: uint256) -> ClaimData:
+    """
+    @notice
+        Reads the single storage slot holding reward_debt, shares_owned
+        and is_liquidated of _token_id.
+    """
+    claim_data: uint256 = self.packed_positions[_token_id].claim_data
+    return ClaimData({
+        reward_debt: claim_data & MAX_REWARD_DEBT,
+        shares_owned: shift(claim_data, -128) & MAX_SHARES_OWNED,
+        is_liquidated: claim_data & LIQUIDATED_FLAG != 0
+    })
+
+
+@internal
+def _store_claim_data(_token_id: uint256, _position: ClaimData):
+    """
+    @notice
+        Writes reward_debt, shares_owned and is_liquidated of _token_id
+        into a single storage slot.
+        Reverts if the values exceed their packed bit width.
+    """
+    assert _position.reward_debt <= MAX_REWARD_DEBT, "reward debt overflow"
+    assert _position.shares_owned <= MAX_SHARES_OWNED, "shares owned overflow"
+
+    claim_data: uint256 = _position.reward_debt | shift(_position.shares_owned, 128)
+    if _position.is_liquidated:
+        claim_data = claim_data | LIQUIDATED_FLAG
+
+    self.packed_positions[_token_id].claim_data = claim_data
+
+
 @internal
 def _is_valid_token_id(_token_id: uint256) -> bool:
     """
@@ -523,10 +971,50 @@ def set_alchemist(_addr: address):
     assert _addr != self.alchemist, "same as current"
 
     self.alchemist = _addr
+    # the cached value belongs to the previous alchemist
+    self.cached_min_collateralization = 0
 
     log AlchemistUpdated(msg.sender, _addr)
 
 
+@external
+def set_min_collateralization_cache(_enabled: bool):
+    """
+    @notice
+        Enables the cache of the Alchemix minimum collateralization by
+        storing its current value, or disables it.
+        As the collateralization is assumed to stay constant, caching it
+        saves an external call on every deposit. Operators are expected
+        to refresh the cache if Alchemix changes the value.
+    """
+    assert self.is_operator[msg.sender], "unauthorized"
+
+    min_collateralization: uint256 = 0
+    if _enabled:
+        assert self.alchemist != empty(address), "invalid state, alchemist not set"
+        min_collateralization = IAlchemist(self.alchemist).minimumCollateralization()
+        assert min_collateralization != 0, "invalid min collateralization"
+
+    self.cached_min_collateralization = min_collateralization
+
+    log MinCollateralizationCacheUpdated(msg.sender, min_collateralization)
+
+
+@external
+def set_harvest_buffer(_buffer_bps: uint256):
+    """
+    @notice
+        Sets how far above the minimum collateralization, in bps of
+        the minimum, harvest leaves the vault.
+    """
+    assert self.is_operator[msg.sender], "unauthorized"
+    assert _buffer_bps <= MAX_BPS, "invalid harvest buffer"
+
+    self.harvest_buffer_bps = _buffer_bps
+
+    log HarvestBufferUpdated(msg.sender, _buffer_bps)
+
+
 @external
 def set_fund_receiver(_addr: address):
     """
@@ -595,6 +1083,58 @@ def migrate():
     )
 
 
+@external
+def import_positions(
+    _positions: DynArray[Position, MAX_BATCH_SIZE],
+    _amount_claimable_per_share: uint256
+):
+    """
+    @notice
+        Migration path for the positions of a vault that rescaled
+        amount_claimable_per_share on every deposit instead of tracking
+        reward debt.
+        Takes over each position with the amount_claimable_per_share of
+        the old vault (scaled by CLAIMABLE_PRECISION), so it can claim
+        shares_owned * amount_claimable_per_share - amount_claimed just
+        like before.
+        Only possible once, before the first deposit or distribution of
+        this vault, so no positions can be added next to real ones.
+        The Alchemix shares backing the positions have to be moved to
+        this vault first, the WETH they can still claim is pulled from
+        msg.sender.
+        Can only be called by the migration_admin.
+    """
+    assert msg.sender == self.migration_admin, "unauthorized"
+    assert self.total_shares == 0 and self.amount_claimable_per_share == 0, "vault not empty"
+
+    self.amount_claimable_per_share = _amount_claimable_per_share
+
+    total_claimable: uint256 = 0
+    for position in _positions:
+        assert self._is_valid_token_id(position.token_id)
+        assert position.amount_deposited > 0, "cannot import empty position"
+        assert self.packed_positions[position.token_id].deposit_data == 0, "can only deposit once per token"
+
+        self._store_position(position)
+        if not position.is_liquidated:
+            earned: uint256 = position.shares_owned * _amount_claimable_per_share / CLAIMABLE_PRECISION
+            assert position.amount_claimed <= earned, "claimed more than earned"
+
+            self.total_shares += position.shares_owned
+            self.total_reward_debt += position.amount_claimed
+            self.open_positions += 1
+            total_claimable += earned - position.amount_claimed
+
+        log PositionImported(position.token_id, position.shares_owned, position.amount_claimed)
+
+    assert self.total_shares > 0, "no shares imported"
+    shares_in_vault: uint256 = IAlchemist(self.alchemist).positions(self, ALCX_YVWETH)[0]
+    assert shares_in_vault >= self.total_shares, "shares not moved to vault"
+
+    if total_claimable > 0:
+        ERC20(WETH).transferFrom(msg.sender, self, total_claimable)
+
+
 @external
 def suggest_migration_admin(_new_admin: address):
     """
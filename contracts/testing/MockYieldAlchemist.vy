@@ -0,0 +1,240 @@
+# @version 0.3.7
+
+"""
+@notice
+    Stateful stand-in for the Alchemist of Alchemix V2 with a single
+    yield token, for simulating the vault over long timelines offline.
+
+    The underlying value of a share grows by yield_per_block every block.
+    The yield earned by an account's shares repays its debt: the shares
+    worth the yield are taken from the account and its debt is reduced
+    by the yield, past zero into credit like on Alchemix.
+    Deposits and withdrawals move real WETH, minting and withdrawals are
+    subject to the minimum collateralization check.
+    The mock only holds the deposited WETH, withdrawing more than that
+    requires the yield to be funded with a WETH transfer to the mock.
+"""
+
+from vyper.interfaces import ERC20
+
+WETH: constant(address) = 0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2
+FIXED_POINT_SCALAR: constant(uint256) = 10**18
+
+struct Account:
+    shares: uint256
+    debt: int256
+    last_underlying_per_share: uint256
+
+accounts_data: HashMap[address, Account]
+
+minimum_collateralization: public(uint256)
+yield_per_block: public(uint256)
+
+# underlying_per_share at checkpoint_block, from where it grows linearly
+checkpoint_underlying_per_share: uint256
+checkpoint_block: uint256
+
+minted: public(HashMap[address, uint256])
+
+
+@external
+def __init__(_yield_per_block: uint256):
+    self.minimum_collateralization = 2 * FIXED_POINT_SCALAR
+    self.yield_per_block = _yield_per_block
+    self.checkpoint_underlying_per_share = FIXED_POINT_SCALAR
+    self.checkpoint_block = block.number
+
+
+@external
+def set_yield_per_block(_yield_per_block: uint256):
+    """
+    @notice
+        Changes the yield accrued per share and block from this block on.
+    """
+    self.checkpoint_underlying_per_share = self._underlying_per_share()
+    self.checkpoint_block = block.number
+    self.yield_per_block = _yield_per_block
+
+
+@external
+def set_minimum_collateralization(_minimum_collateralization: uint256):
+    self.minimum_collateralization = _minimum_collateralization
+
+
+@external
+def depositUnderlying(
+    _yield_token: address,
+    _amount: uint256,
+    _recipient: address,
+    _min_amount_out: uint256
+) -> uint256:
+    account: Account = self._sync(_recipient)
+
+    shares: uint256 = self._to_shares(_amount)
+    assert shares >= _min_amount_out, "slippage exceeded"
+
+    ERC20(WETH).transferFrom(msg.sender, self, _amount)
+
+    account.shares += shares
+    self.accounts_data[_recipient] = account
+    return shares
+
+
+@external
+def mint(_amount: uint256, _recipient: address):
+    account: Account = self._sync(msg.sender)
+    account.debt += convert(_amount, int256)
+    self._validate(account)
+
+    self.accounts_data[msg.sender] = account
+    self.minted[_recipient] += _amount
+
+
+@external
+def withdrawUnderlying(
+    _yield_token: address,
+    _shares: uint256,
+    _recipient: address,
+    _min_amount_out: uint256
+) -> uint256:
+    account: Account = self._sync(msg.sender)
+
+    amount: uint256 = self._to_underlying(_shares)
+    assert amount >= _min_amount_out, "slippage exceeded"
+
+    account.shares -= _shares
+    self._validate(account)
+    self.accounts_data[msg.sender] = account
+
+    ERC20(WETH).transfer(_recipient, amount)
+    return amount
+
+
+@external
+def liquidate(
+    _yield_token: address,
+    _shares: uint256,
+    _min_amount_out: uint256
+) -> uint256:
+    """
+    @notice
+        Repays debt of msg.sender with the underlying value of _shares,
+        capped at the shares needed to repay all debt.
+        Returns the shares used.
+    """
+    account: Account = self._sync(msg.sender)
+    assert account.debt > 0, "no debt to liquidate"
+
+    shares: uint256 = min(_shares, self._to_shares(convert(account.debt, uint256)))
+    amount: uint256 = self._to_underlying(shares)
+    assert amount >= _min_amount_out, "slippage exceeded"
+
+    account.shares -= shares
+    account.debt -= convert(amount, int256)
+    self._validate(account)
+    self.accounts_data[msg.sender] = account
+    return shares
+
+
+@view
+@external
+def getUnderlyingTokensPerShare(_yield_token: address) -> uint256:
+    return self._underlying_per_share()
+
+
+@view
+@external
+def convertSharesToUnderlyingTokens(_yield_token: address, _shares: uint256) -> uint256:
+    return self._to_underlying(_shares)
+
+
+@view
+@external
+def convertUnderlyingTokensToShares(_yield_token: address, _amount: uint256) -> uint256:
+    return self._to_shares(_amount)
+
+
+@view
+@external
+def normalizeUnderlyingTokensToDebt(_underlying_token: address, _amount: uint256) -> uint256:
+    return _amount
+
+
+@view
+@external
+def totalValue(_owner: address) -> uint256:
+    return self._to_underlying(self._synced(_owner).shares)
+
+
+@view
+@external
+def minimumCollateralization() -> uint256:
+    return self.minimum_collateralization
+
+
+@view
+@external
+def accounts(_owner: address) -> (int256, DynArray[address, 8]):
+    return (self._synced(_owner).debt, [])
+
+
+@view
+@external
+def positions(_owner: address, _yield_token: address) -> (uint256, uint256):
+    account: Account = self._synced(_owner)
+    return account.shares, account.last_underlying_per_share
+
+
+@view
+@internal
+def _underlying_per_share() -> uint256:
+    return self.checkpoint_underlying_per_share + self.yield_per_block * (block.number - self.checkpoint_block)
+
+
+@view
+@internal
+def _to_underlying(_shares: uint256) -> uint256:
+    return _shares * self._underlying_per_share() / FIXED_POINT_SCALAR
+
+
+@view
+@internal
+def _to_shares(_amount: uint256) -> uint256:
+    return _amount * FIXED_POINT_SCALAR / self._underlying_per_share()
+
+
+@view
+@internal
+def _synced(_owner: address) -> Account:
+    """
+    @notice
+        Returns the account of _owner with the yield earned since its last
+        sync used to repay its debt.
+    """
+    account: Account = self.accounts_data[_owner]
+    underlying_per_share: uint256 = self._underlying_per_share()
+
+    if account.shares > 0 and account.last_underlying_per_share > 0:
+        earned: uint256 = account.shares * (underlying_per_share - account.last_underlying_per_share) / FIXED_POINT_SCALAR
+        account.shares -= earned * FIXED_POINT_SCALAR / underlying_per_share
+        account.debt -= convert(earned, int256)
+
+    account.last_underlying_per_share = underlying_per_share
+    return account
+
+
+@internal
+def _sync(_owner: address) -> Account:
+    account: Account = self._synced(_owner)
+    self.accounts_data[_owner] = account
+    return account
+
+
+@view
+@internal
+def _validate(_account: Account):
+    if _account.debt <= 0:
+        return
+
+    collateralization: uint256 = self._to_underlying(_account.shares) * FIXED_POINT_SCALAR / convert(_account.debt, uint256)
+    assert collateralization >= self.minimum_collateralization, "undercollateralized"
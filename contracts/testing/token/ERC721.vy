@@ -66,17 +66,37 @@ ownerToNFTokenCount: HashMap[address, uint256]
 # @dev Mapping from owner address to mapping of operator addresses.
 ownerToOperators: HashMap[address, HashMap[address, bool]]
 
+# @dev Mapping from owner address to mapping of index to owned NFT ID.
+ownerToTokenIds: HashMap[address, HashMap[uint256, uint256]]
+
+# @dev Mapping from NFT ID to its index in the owner's list of NFT IDs.
+idToOwnerIndex: HashMap[uint256, uint256]
+
+# @dev Mapping from index to NFT ID of all existing NFTs.
+allTokenIds: HashMap[uint256, uint256]
+
+# @dev Mapping from NFT ID to its index in the list of all NFT IDs.
+idToAllTokensIndex: HashMap[uint256, uint256]
+
+# @dev Count of all existing NFTs.
+tokenCount: uint256
+
 # @dev Address of minter, who can mint a token
 minter: public(address)
 
 baseURL: String[53]
 
+# @dev Maximum number of tokens minted in a single batch mint
+MAX_MINT_BATCH: constant(uint256) = 256
+
 # @dev Static list of supported ERC165 interface ids
-SUPPORTED_INTERFACES: constant(bytes4[2]) = [
+SUPPORTED_INTERFACES: constant(bytes4[3]) = [
     # ERC165 interface ID of ERC165
     0x01ffc9a7,
     # ERC165 interface ID of ERC721
     0x80ac58cd,
+    # ERC165 interface ID of ERC721 Enumerable
+    0x780e9d63,
 ]
 
 @external
@@ -150,6 +170,42 @@ def isApprovedForAll(_owner: address, _operator: address) -> bool:
     return (self.ownerToOperators[_owner])[_operator]
 
 
+@view
+@external
+def totalSupply() -> uint256:
+    """
+    @dev Returns the number of existing NFTs.
+    """
+    return self.tokenCount
+
+
+@view
+@external
+def tokenByIndex(_index: uint256) -> uint256:
+    """
+    @dev Returns the NFT ID at `_index` of all existing NFTs. The order is not stable
+         across burns.
+         Throws if `_index` >= `totalSupply()`.
+    @param _index Index of the NFT ID to query.
+    """
+    assert _index < self.tokenCount
+    return self.allTokenIds[_index]
+
+
+@view
+@external
+def tokenOfOwnerByIndex(_owner: address, _index: uint256) -> uint256:
+    """
+    @dev Returns the NFT ID at `_index` of the NFTs owned by `_owner`. The order is not
+         stable across transfers.
+         Throws if `_index` >= `balanceOf(_owner)`.
+    @param _owner Address of the owner to query.
+    @param _index Index of the NFT ID to query.
+    """
+    assert _index < self.ownerToNFTokenCount[_owner]
+    return self.ownerToTokenIds[_owner][_index]
+
+
 ### TRANSFER FUNCTION HELPERS ###
 
 @view
@@ -179,8 +235,12 @@ def _addTokenTo(_to: address, _tokenId: uint256):
     assert self.idToOwner[_tokenId] == empty(address)
     # Change the owner
     self.idToOwner[_tokenId] = _to
+    # Append to the owner's enumeration
+    index: uint256 = self.ownerToNFTokenCount[_to]
+    self.ownerToTokenIds[_to][index] = _tokenId
+    self.idToOwnerIndex[_tokenId] = index
     # Change count tracking
-    self.ownerToNFTokenCount[_to] += 1
+    self.ownerToNFTokenCount[_to] = index + 1
 
 
 @internal
@@ -193,8 +253,62 @@ def _removeTokenFrom(_from: address, _tokenId: uint256):
     assert self.idToOwner[_tokenId] == _from
     # Change the owner
     self.idToOwner[_tokenId] = empty(address)
+    # Remove from the owner's enumeration by moving the last NFT ID into its place
+    lastIndex: uint256 = self.ownerToNFTokenCount[_from] - 1
+    index: uint256 = self.idToOwnerIndex[_tokenId]
+    if index != lastIndex:
+        lastTokenId: uint256 = self.ownerToTokenIds[_from][lastIndex]
+        self.ownerToTokenIds[_from][index] = lastTokenId
+        self.idToOwnerIndex[lastTokenId] = index
+    self.ownerToTokenIds[_from][lastIndex] = 0
+    self.idToOwnerIndex[_tokenId] = 0
     # Change count tracking
-    self.ownerToNFTokenCount[_from] -= 1
+    self.ownerToNFTokenCount[_from] = lastIndex
+
+
+@internal
+def _addTokenToAllTokens(_tokenId: uint256):
+    """
+    @dev Add a newly minted NFT to the enumeration of all NFTs
+    """
+    index: uint256 = self.tokenCount
+    self.allTokenIds[index] = _tokenId
+    self.idToAllTokensIndex[_tokenId] = index
+    self.tokenCount = index + 1
+
+
+@internal
+def _removeTokenFromAllTokens(_tokenId: uint256):
+    """
+    @dev Remove a burned NFT from the enumeration of all NFTs by moving the last
+         NFT ID into its place
+    """
+    lastIndex: uint256 = self.tokenCount - 1
+    index: uint256 = self.idToAllTokensIndex[_tokenId]
+    if index != lastIndex:
+        lastTokenId: uint256 = self.allTokenIds[lastIndex]
+        self.allTokenIds[index] = lastTokenId
+        self.idToAllTokensIndex[lastTokenId] = index
+    self.allTokenIds[lastIndex] = 0
+    self.idToAllTokensIndex[_tokenId] = 0
+    self.tokenCount = lastIndex
+
+
+@internal
+def _mintWithIndices(_to: address, _tokenId: uint256, _ownerIndex: uint256, _allTokensIndex: uint256):
+    """
+    @dev Mint a NFT at the given enumeration indices without updating the counts,
+         used by the batch mints to update the counts only once.
+         Throws if `_tokenId` is owned by someone.
+    """
+    # Throws if `_tokenId` is owned by someone
+    assert self.idToOwner[_tokenId] == empty(address)
+    self.idToOwner[_tokenId] = _to
+    self.ownerToTokenIds[_to][_ownerIndex] = _tokenId
+    self.idToOwnerIndex[_tokenId] = _ownerIndex
+    self.allTokenIds[_allTokensIndex] = _tokenId
+    self.idToAllTokensIndex[_tokenId] = _allTokensIndex
+    log Transfer(empty(address), _to, _tokenId)
 
 
 @internal
@@ -344,6 +458,7 @@ def safeMint(_to: address, _tokenId: uint256) -> bool:
     assert _to != empty(address)
     # Add NFT. Throws if `_tokenId` is owned by someone
     self._addTokenTo(_to, _tokenId)
+    self._addTokenToAllTokens(_tokenId)
     log Transfer(empty(address), _to, _tokenId)
     return True
 
@@ -365,10 +480,71 @@ def mint(_to: address, _tokenId: uint256) -> bool:
     assert _to != empty(address)
     # Add NFT. Throws if `_tokenId` is owned by someone
     self._addTokenTo(_to, _tokenId)
+    self._addTokenToAllTokens(_tokenId)
     log Transfer(empty(address), _to, _tokenId)
     return True
 
 
+@external
+def mint_batch(_to: address, _tokenIds: DynArray[uint256, MAX_MINT_BATCH]) -> bool:
+    """
+    @dev Function to mint multiple tokens to the same address.
+         The token count of `_to` is only updated once.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_to` is zero address.
+         Throws if any of `_tokenIds` is owned by someone.
+    @param _to The address that will receive the minted tokens.
+    @param _tokenIds The token ids to mint.
+    @return A boolean that indicates if the operation was successful.
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+    # Throws if `_to` is zero address
+    assert _to != empty(address)
+    ownerCount: uint256 = self.ownerToNFTokenCount[_to]
+    supply: uint256 = self.tokenCount
+    for tokenId in _tokenIds:
+        # Throws if `tokenId` is owned by someone
+        self._mintWithIndices(_to, tokenId, ownerCount, supply)
+        ownerCount += 1
+        supply += 1
+    self.ownerToNFTokenCount[_to] = ownerCount
+    self.tokenCount = supply
+    return True
+
+
+@external
+def mint_range(_to: address, _firstTokenId: uint256, _amount: uint256) -> bool:
+    """
+    @dev Function to mint `_amount` consecutive tokens starting at `_firstTokenId`
+         to the same address.
+         The token count of `_to` is only updated once.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_to` is zero address.
+         Throws if `_amount` exceeds MAX_MINT_BATCH.
+         Throws if any of the token ids is owned by someone.
+    @param _to The address that will receive the minted tokens.
+    @param _firstTokenId The first token id to mint.
+    @param _amount The number of tokens to mint.
+    @return A boolean that indicates if the operation was successful.
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+    # Throws if `_to` is zero address
+    assert _to != empty(address)
+    assert _amount <= MAX_MINT_BATCH
+    ownerCount: uint256 = self.ownerToNFTokenCount[_to]
+    supply: uint256 = self.tokenCount
+    for i in range(MAX_MINT_BATCH):
+        if i >= _amount:
+            break
+        # Throws if the token id is owned by someone
+        self._mintWithIndices(_to, _firstTokenId + i, ownerCount + i, supply + i)
+    self.ownerToNFTokenCount[_to] = ownerCount + _amount
+    self.tokenCount = supply + _amount
+    return True
+
+
 @external
 def burn(_tokenId: uint256):
     """
@@ -385,6 +561,7 @@ def burn(_tokenId: uint256):
     assert owner != empty(address)
     self._clearApproval(owner, _tokenId)
     self._removeTokenFrom(owner, _tokenId)
+    self._removeTokenFromAllTokens(_tokenId)
     log Transfer(owner, empty(address), _tokenId)
 
 
@@ -0,0 +1,462 @@
+# @dev Implementation of ERC-721 non-fungible token standard with lazy ownership
+#      for sequentially minted token ids (ERC721A style).
+#      A range of consecutive token ids minted to the same owner only stores the
+#      owner of the first token id. The owner of any other token id is resolved by
+#      scanning back to the closest token id with an explicitly set owner.
+# Modified from: contracts/token/ERC721.vy
+
+from vyper.interfaces import ERC165
+from vyper.interfaces import ERC721
+
+implements: ERC721
+implements: ERC165
+
+# Interface for the contract called by safeTransferFrom()
+interface ERC721Receiver:
+    def onERC721Received(
+            _operator: address,
+            _from: address,
+            _tokenId: uint256,
+            _data: Bytes[1024]
+        ) -> bytes4: nonpayable
+
+
+# @dev Emits when ownership of any NFT changes by any mechanism. This event emits when NFTs are
+#      created (`from` == 0) and destroyed (`to` == 0). At the time of any transfer, the approved
+#      address for that NFT (if any) is reset to none.
+# @param _from Sender of NFT (if address is zero address it indicates token creation).
+# @param _to Receiver of NFT (if address is zero address it indicates token destruction).
+# @param _tokenId The NFT that got transfered.
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    tokenId: indexed(uint256)
+
+# @dev This emits when the approved address for an NFT is changed or reaffirmed. The zero
+#      address indicates there is no approved address. When a Transfer event emits, this also
+#      indicates that the approved address for that NFT (if any) is reset to none.
+# @param _owner Owner of NFT.
+# @param _approved Address that we are approving.
+# @param _tokenId NFT which we are approving.
+event Approval:
+    owner: indexed(address)
+    approved: indexed(address)
+    tokenId: indexed(uint256)
+
+# @dev This emits when an operator is enabled or disabled for an owner. The operator can manage
+#      all NFTs of the owner.
+# @param _owner Owner of NFT.
+# @param _operator Address to which we are setting operator rights.
+# @param _approved Status of operator rights(true if operator rights are given and false if
+# revoked).
+event ApprovalForAll:
+    owner: indexed(address)
+    operator: indexed(address)
+    approved: bool
+
+
+# @dev Mapping from NFT ID to the explicitly set owner. Zero for token ids that
+#      are owned by the closest lower token id with an explicitly set owner.
+ownerships: HashMap[uint256, address]
+
+# @dev Mapping from NFT ID to whether it has been burned.
+burned: HashMap[uint256, bool]
+
+# @dev Mapping from NFT ID to approved address.
+idToApprovals: HashMap[uint256, address]
+
+# @dev Mapping from owner address to count of his tokens.
+ownerToNFTokenCount: HashMap[address, uint256]
+
+# @dev Mapping from owner address to mapping of operator addresses.
+ownerToOperators: HashMap[address, HashMap[address, bool]]
+
+# @dev First token id that can be minted
+startTokenId: public(uint256)
+
+# @dev Next token id to be minted, token ids are minted sequentially
+nextTokenId: public(uint256)
+
+# @dev Address of minter, who can mint a token
+minter: public(address)
+
+baseURL: String[53]
+
+# @dev Maximum number of tokens minted in a single batch mint. Also bounds the
+#      number of slots scanned to resolve an owner.
+MAX_MINT_BATCH: constant(uint256) = 256
+
+# @dev Static list of supported ERC165 interface ids
+SUPPORTED_INTERFACES: constant(bytes4[2]) = [
+    # ERC165 interface ID of ERC165
+    0x01ffc9a7,
+    # ERC165 interface ID of ERC721
+    0x80ac58cd,
+]
+
+@external
+def __init__(_startTokenId: uint256):
+    """
+    @dev Contract constructor.
+    @param _startTokenId The first token id to be minted.
+    """
+    self.minter = msg.sender
+    self.baseURL = "https://api.babby.xyz/metadata/"
+    self.startTokenId = _startTokenId
+    self.nextTokenId = _startTokenId
+
+
+@pure
+@external
+def supportsInterface(interface_id: bytes4) -> bool:
+    """
+    @dev Interface identification is specified in ERC-165.
+    @param interface_id Id of the interface
+    """
+    return interface_id in SUPPORTED_INTERFACES
+
+
+### VIEW FUNCTIONS ###
+
+@view
+@external
+def balanceOf(_owner: address) -> uint256:
+    """
+    @dev Returns the number of NFTs owned by `_owner`.
+         Throws if `_owner` is the zero address. NFTs assigned to the zero address are considered invalid.
+    @param _owner Address for whom to query the balance.
+    """
+    assert _owner != empty(address)
+    return self.ownerToNFTokenCount[_owner]
+
+
+@view
+@external
+def ownerOf(_tokenId: uint256) -> address:
+    """
+    @dev Returns the address of the owner of the NFT.
+         Throws if `_tokenId` is not a valid NFT.
+    @param _tokenId The identifier for an NFT.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    return owner
+
+
+@view
+@external
+def getApproved(_tokenId: uint256) -> address:
+    """
+    @dev Get the approved address for a single NFT.
+         Throws if `_tokenId` is not a valid NFT.
+    @param _tokenId ID of the NFT to query the approval of.
+    """
+    # Throws if `_tokenId` is not a valid NFT
+    assert self._ownerOf(_tokenId) != empty(address)
+    return self.idToApprovals[_tokenId]
+
+
+@view
+@external
+def isApprovedForAll(_owner: address, _operator: address) -> bool:
+    """
+    @dev Checks if `_operator` is an approved operator for `_owner`.
+    @param _owner The address that owns the NFTs.
+    @param _operator The address that acts on behalf of the owner.
+    """
+    return (self.ownerToOperators[_owner])[_operator]
+
+
+### OWNERSHIP HELPERS ###
+
+@view
+@internal
+def _ownerOf(_tokenId: uint256) -> address:
+    """
+    @dev Resolves the owner of `_tokenId` by scanning back to the closest token id
+         with an explicitly set owner.
+         Returns the zero address if `_tokenId` is not a valid NFT.
+    """
+    if _tokenId < self.startTokenId or _tokenId >= self.nextTokenId:
+        return empty(address)
+    if self.burned[_tokenId]:
+        return empty(address)
+    # every minted range explicitly sets the owner of its first token id,
+    # so the scan never exceeds MAX_MINT_BATCH slots
+    for i in range(MAX_MINT_BATCH):
+        owner: address = self.ownerships[_tokenId - i]
+        if owner != empty(address):
+            return owner
+    return empty(address)
+
+
+@internal
+def _initializeNext(_tokenId: uint256, _owner: address):
+    """
+    @dev Explicitly sets `_owner` as owner of the token id following `_tokenId` if it
+         is minted and lazily owned, so it keeps its owner once `_tokenId` changes.
+    """
+    nextId: uint256 = _tokenId + 1
+    if nextId < self.nextTokenId and self.ownerships[nextId] == empty(address):
+        self.ownerships[nextId] = _owner
+
+
+### TRANSFER FUNCTION HELPERS ###
+
+@view
+@internal
+def _isApprovedOrOwner(_spender: address, _owner: address, _tokenId: uint256) -> bool:
+    """
+    @dev Returns whether the given spender can transfer a given token ID
+         The owner is passed in to avoid resolving it a second time.
+    @param spender address of the spender to query
+    @param owner address of the resolved owner of the token
+    @param tokenId uint256 ID of the token to be transferred
+    @return bool whether the msg.sender is approved for the given token ID,
+        is an operator of the owner, or is the owner of the token
+    """
+    spenderIsOwner: bool = _owner == _spender
+    spenderIsApproved: bool = _spender == self.idToApprovals[_tokenId]
+    spenderIsApprovedForAll: bool = (self.ownerToOperators[_owner])[_spender]
+    return (spenderIsOwner or spenderIsApproved) or spenderIsApprovedForAll
+
+
+@internal
+def _clearApproval(_tokenId: uint256):
+    """
+    @dev Clear an approval of a given token id
+    """
+    if self.idToApprovals[_tokenId] != empty(address):
+        # Reset approvals
+        self.idToApprovals[_tokenId] = empty(address)
+
+
+@internal
+def _transferFrom(_from: address, _to: address, _tokenId: uint256, _sender: address):
+    """
+    @dev Exeute transfer of a NFT.
+         Throws unless `msg.sender` is the current owner, an authorized operator, or the approved
+         address for this NFT. (NOTE: `msg.sender` not allowed in private function so pass `_sender`.)
+         Throws if `_to` is the zero address.
+         Throws if `_from` is not the current owner.
+         Throws if `_tokenId` is not a valid NFT.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Throws if `_from` is not the current owner
+    assert owner == _from
+    # Check requirements
+    assert self._isApprovedOrOwner(_sender, owner, _tokenId)
+    # Throws if `_to` is the zero address
+    assert _to != empty(address)
+    self._clearApproval(_tokenId)
+    # Change the owner, the following token keeps its owner
+    self.ownerships[_tokenId] = _to
+    self._initializeNext(_tokenId, _from)
+    # Change count tracking
+    self.ownerToNFTokenCount[_from] -= 1
+    self.ownerToNFTokenCount[_to] += 1
+    # Log the transfer
+    log Transfer(_from, _to, _tokenId)
+
+
+### TRANSFER FUNCTIONS ###
+
+@external
+@payable
+def transferFrom(_from: address, _to: address, _tokenId: uint256):
+    """
+    @dev Throws unless `msg.sender` is the current owner, an authorized operator, or the approved
+         address for this NFT.
+         Throws if `_from` is not the current owner.
+         Throws if `_to` is the zero address.
+         Throws if `_tokenId` is not a valid NFT.
+    @notice The caller is responsible to confirm that `_to` is capable of receiving NFTs or else
+            they maybe be permanently lost.
+    @param _from The current owner of the NFT.
+    @param _to The new owner.
+    @param _tokenId The NFT to transfer.
+    """
+    self._transferFrom(_from, _to, _tokenId, msg.sender)
+
+
+@external
+@payable
+def safeTransferFrom(
+        _from: address,
+        _to: address,
+        _tokenId: uint256,
+        _data: Bytes[1024]=b""
+    ):
+    """
+    @dev Transfers the ownership of an NFT from one address to another address.
+         Throws unless `msg.sender` is the current owner, an authorized operator, or the
+         approved address for this NFT.
+         Throws if `_from` is not the current owner.
+         Throws if `_to` is the zero address.
+         Throws if `_tokenId` is not a valid NFT.
+         If `_to` is a smart contract, it calls `onERC721Received` on `_to` and throws if
+         the return value is not `bytes4(keccak256("onERC721Received(address,address,uint256,bytes)"))`.
+    @param _from The current owner of the NFT.
+    @param _to The new owner.
+    @param _tokenId The NFT to transfer.
+    @param _data Additional data with no specified format, sent in call to `_to`.
+    """
+    self._transferFrom(_from, _to, _tokenId, msg.sender)
+    if _to.is_contract: # check if `_to` is a contract address
+        returnValue: bytes4 = ERC721Receiver(_to).onERC721Received(msg.sender, _from, _tokenId, _data)
+        # Throws if transfer destination is a contract which does not implement 'onERC721Received'
+        assert returnValue == method_id("onERC721Received(address,address,uint256,bytes)", output_type=bytes4)
+
+
+@external
+@payable
+def approve(_approved: address, _tokenId: uint256):
+    """
+    @dev Set or reaffirm the approved address for an NFT. The zero address indicates there is no approved address.
+         Throws unless `msg.sender` is the current NFT owner, or an authorized operator of the current owner.
+         Throws if `_tokenId` is not a valid NFT. (NOTE: This is not written the EIP)
+         Throws if `_approved` is the current owner. (NOTE: This is not written the EIP)
+    @param _approved Address to be approved for the given NFT ID.
+    @param _tokenId ID of the token to be approved.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Throws if `_approved` is the current owner
+    assert _approved != owner
+    # Check requirements
+    senderIsOwner: bool = owner == msg.sender
+    senderIsApprovedForAll: bool = (self.ownerToOperators[owner])[msg.sender]
+    assert (senderIsOwner or senderIsApprovedForAll)
+    # Set the approval
+    self.idToApprovals[_tokenId] = _approved
+    log Approval(owner, _approved, _tokenId)
+
+
+@external
+def setApprovalForAll(_operator: address, _approved: bool):
+    """
+    @dev Enables or disables approval for a third party ("operator") to manage all of
+         `msg.sender`'s assets. It also emits the ApprovalForAll event.
+         Throws if `_operator` is the `msg.sender`. (NOTE: This is not written the EIP)
+    @notice This works even if sender doesn't own any tokens at the time.
+    @param _operator Address to add to the set of authorized operators.
+    @param _approved True if the operators is approved, false to revoke approval.
+    """
+    # Throws if `_operator` is the `msg.sender`
+    assert _operator != msg.sender
+    self.ownerToOperators[msg.sender][_operator] = _approved
+    log ApprovalForAll(msg.sender, _operator, _approved)
+
+
+### MINT & BURN FUNCTIONS ###
+
+@internal
+def _mintRange(_to: address, _firstTokenId: uint256, _amount: uint256):
+    """
+    @dev Mints `_amount` consecutive tokens starting at `_firstTokenId` to `_to`,
+         only storing the owner of the first token id.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_to` is zero address.
+         Throws if `_firstTokenId` is not the next token id.
+         Throws if `_amount` is zero or exceeds MAX_MINT_BATCH.
+    """
+    # Throws if `msg.sender` is not the minter
+    assert msg.sender == self.minter
+    # Throws if `_to` is zero address
+    assert _to != empty(address)
+    # Throws if token ids are not minted sequentially
+    assert _firstTokenId == self.nextTokenId
+    assert _amount > 0 and _amount <= MAX_MINT_BATCH
+
+    self.ownerships[_firstTokenId] = _to
+    self.ownerToNFTokenCount[_to] += _amount
+    self.nextTokenId = _firstTokenId + _amount
+
+    for i in range(MAX_MINT_BATCH):
+        if i >= _amount:
+            break
+        log Transfer(empty(address), _to, _firstTokenId + i)
+
+
+@external
+def safeMint(_to: address, _tokenId: uint256):
+    """
+    @dev Function to mint tokens with interface
+        compatible to OpenZeppelin implementation
+         Throws if `msg.sender` is not the minter.
+         Throws if `_to` is zero address.
+         Throws if `_tokenId` is not the next token id.
+    @param _to The address that will receive the minted tokens.
+    @param _tokenId The token id to mint.
+    """
+    self._mintRange(_to, _tokenId, 1)
+
+
+@external
+def mint(_to: address, _tokenId: uint256) -> bool:
+    """
+    @dev Function to mint tokens
+         Throws if `msg.sender` is not the minter.
+         Throws if `_to` is zero address.
+         Throws if `_tokenId` is not the next token id.
+    @param _to The address that will receive the minted tokens.
+    @param _tokenId The token id to mint.
+    @return A boolean that indicates if the operation was successful.
+    """
+    self._mintRange(_to, _tokenId, 1)
+    return True
+
+
+@external
+def mint_range(_to: address, _firstTokenId: uint256, _amount: uint256) -> bool:
+    """
+    @dev Function to mint `_amount` consecutive tokens starting at `_firstTokenId`
+         to the same address with a single ownership write.
+         Throws if `msg.sender` is not the minter.
+         Throws if `_to` is zero address.
+         Throws if `_firstTokenId` is not the next token id.
+         Throws if `_amount` is zero or exceeds MAX_MINT_BATCH.
+    @param _to The address that will receive the minted tokens.
+    @param _firstTokenId The first token id to mint.
+    @param _amount The number of tokens to mint.
+    @return A boolean that indicates if the operation was successful.
+    """
+    self._mintRange(_to, _firstTokenId, _amount)
+    return True
+
+
+@external
+def burn(_tokenId: uint256):
+    """
+    @dev Burns a specific ERC721 token.
+         Throws unless `msg.sender` is the current owner, an authorized operator, or the approved
+         address for this NFT.
+         Throws if `_tokenId` is not a valid NFT.
+    @param _tokenId uint256 ID of the ERC721 token to be burned.
+    """
+    owner: address = self._ownerOf(_tokenId)
+    # Throws if `_tokenId` is not a valid NFT
+    assert owner != empty(address)
+    # Check requirements
+    assert self._isApprovedOrOwner(msg.sender, owner, _tokenId)
+    self._clearApproval(_tokenId)
+    self.burned[_tokenId] = True
+    # the following token keeps its owner
+    self._initializeNext(_tokenId, owner)
+    self.ownerToNFTokenCount[owner] -= 1
+    log Transfer(owner, empty(address), _tokenId)
+
+
+@view
+@external
+def tokenURI(tokenId: uint256) -> String[132]:
+    return concat(self.baseURL, uint2str(tokenId))
+
+
+@external
+def DEBUG_transferMinter(_newMinter: address):
+    self.minter = _newMinter
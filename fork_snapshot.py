@@ -0,0 +1,110 @@
+"""
+Records the chain state a titanoboa fork touches into a snapshot file and
+serves it from there later, so fork based runs need no RPC and always see
+the same state.
+
+    # capture once against a node, the snapshot is written on exit
+    fork(boa.env, "snapshot.json", url=RPC_URL)
+
+    # replay offline from the snapshot
+    fork(boa.env, "snapshot.json")
+
+The snapshot holds the fork block and, per account, the balance, nonce,
+code and every storage slot that was read while capturing. Replaying
+anything that was not captured raises SnapshotMiss, capture again to add
+it.
+"""
+import atexit
+import json
+import pathlib
+
+from boa.vm.fork import CachingRPC
+
+ACCOUNT_FIELDS = {
+    "eth_getBalance": "balance",
+    "eth_getTransactionCount": "nonce",
+    "eth_getCode": "code",
+}
+
+
+class SnapshotMiss(Exception):
+    pass
+
+
+class SnapshotRPC(CachingRPC):
+    """
+    RPC for AccountDBFork that records the responses of url into a
+    snapshot, or replays them from the snapshot if no url is given.
+    """
+
+    def __init__(self, path, url=None):
+        super().__init__(url, cache_file=None)
+        self.path = pathlib.Path(path)
+        self.capturing = url is not None
+
+        if self.capturing:
+            self.snapshot = {"block_number": None, "block": None, "accounts": {}}
+        else:
+            with open(self.path) as f:
+                self.snapshot = json.load(f)
+
+    def _raw_fetch_multi(self, payloads):
+        if self.capturing:
+            ret = super()._raw_fetch_multi(payloads)
+            for (i, method, params) in payloads:
+                self._record(method, params, ret[i])
+            return ret
+
+        return {i: self._replay(method, params) for (i, method, params) in payloads}
+
+    def _entry(self, method, params):
+        # returns the dict holding the response and its key in there
+        if method == "eth_blockNumber":
+            return self.snapshot, "block_number"
+        if method == "eth_getBlockByNumber":
+            return self.snapshot, "block"
+
+        account = self.snapshot["accounts"].setdefault(params[0], {"storage": {}})
+        if method == "eth_getStorageAt":
+            return account["storage"], params[1]
+        if method in ACCOUNT_FIELDS:
+            return account, ACCOUNT_FIELDS[method]
+
+        raise SnapshotMiss(f"{method} is not supported by snapshots")
+
+    def _record(self, method, params, result):
+        entry, key = self._entry(method, params)
+        entry[key] = result
+
+    def _replay(self, method, params):
+        entry, key = self._entry(method, params)
+        if entry.get(key) is None:
+            raise SnapshotMiss(
+                f"{method}{params} is not in {self.path}, capture the snapshot again"
+            )
+        return entry[key]
+
+    def save(self):
+        with open(self.path, "w") as f:
+            json.dump(self.snapshot, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+
+def fork(env, path, url=None, block_identifier="latest"):
+    """
+    Forks env from the node at url and records the state used into path,
+    or forks from the state recorded in path if no url is given.
+    """
+    rpc = SnapshotRPC(path, url)
+    if rpc.capturing:
+        atexit.register(rpc.save)
+    else:
+        # a replayed fork always starts at the captured block
+        block_identifier = int(rpc.snapshot["block"]["number"], 16)
+
+    # AccountDBFork looks its RPC up by url, hand it the snapshot instead
+    rpc_url = url or f"snapshot:{rpc.path.resolve()}"
+    CachingRPC._loaded[(rpc_url, None)] = rpc
+    env.fork(rpc_url, cache_file=None, block_identifier=block_identifier)
+
+    return rpc
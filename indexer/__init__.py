@@ -0,0 +1,37 @@
+"""
+Indexes the events of the Vault and the AuctionHouse into a local SQLite
+database. Every sync only fetches the blocks after the last indexed one.
+
+    from indexer import Indexer, RPCLogSource, Store, load_abi
+
+    indexer = Indexer(
+        Store("index.sqlite"),
+        RPCLogSource(RPC_URL),
+        {
+            "vault": (VAULT_ADDRESS, load_abi("contracts/Vault.vy")),
+            "house": (HOUSE_ADDRESS, load_abi("contracts/AuctionHouse.vy")),
+        },
+        start_block=DEPLOYMENT_BLOCK,
+    )
+    indexer.sync()
+
+or from the command line, see `python -m indexer --help`.
+
+LocalChain records the logs of a titanoboa environment, so the same
+indexer can run against a local boa chain.
+"""
+from indexer.abi import Event, EventDecoder, load_abi
+from indexer.indexer import Indexer
+from indexer.sources import LocalChain, Log, RPCLogSource
+from indexer.store import Store
+
+__all__ = [
+    "Event",
+    "EventDecoder",
+    "Indexer",
+    "LocalChain",
+    "Log",
+    "RPCLogSource",
+    "Store",
+    "load_abi",
+]
@@ -0,0 +1,44 @@
+"""
+    python -m indexer --rpc <url> --vault <address> --house <address> \
+        --from-block <deployment block> [--db index.sqlite] [--poll 60]
+"""
+import argparse
+import time
+
+from indexer import Indexer, RPCLogSource, Store, load_abi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index Vault and AuctionHouse events into SQLite")
+    parser.add_argument("--rpc", required=True, help="JSON-RPC url of the node")
+    parser.add_argument("--vault", required=True, help="address of the Vault")
+    parser.add_argument("--house", required=True, help="address of the AuctionHouse")
+    parser.add_argument("--db", default="index.sqlite", help="path of the SQLite index")
+    parser.add_argument("--from-block", type=int, default=0, help="block of the first sync")
+    parser.add_argument("--chunk-size", type=int, default=2000, help="blocks per eth_getLogs")
+    parser.add_argument("--confirmations", type=int, default=12, help="blocks left unindexed for reorgs")
+    parser.add_argument("--poll", type=int, default=0, help="seconds between syncs, 0 syncs once")
+    args = parser.parse_args()
+
+    indexer = Indexer(
+        Store(args.db),
+        RPCLogSource(args.rpc),
+        {
+            "vault": (args.vault, load_abi("contracts/Vault.vy")),
+            "house": (args.house, load_abi("contracts/AuctionHouse.vy")),
+        },
+        start_block=args.from_block,
+        chunk_size=args.chunk_size,
+        confirmations=args.confirmations,
+    )
+
+    while True:
+        indexed = indexer.sync()
+        print(f"indexed {indexed} events up to block {indexer.store.cursor()}")
+        if args.poll == 0:
+            return
+        time.sleep(args.poll)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Decodes raw logs into events with the ABI of the contract that emitted
+them.
+
+The topic of an event does not cover which of its inputs are indexed, a
+log emitted with different indexed inputs than the ABI has the same
+topic. Such logs are refused instead of decoded wrongly: the ABIs of
+this repo index token_id, Vault and AuctionHouse deployments from
+before that change have to be decoded with the ABI they were deployed
+with.
+"""
+from typing import NamedTuple
+
+from eth_abi import decode
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+from vyper.compiler.output import build_abi_output
+
+from contract_loader import load_partial
+
+
+class Event(NamedTuple):
+    contract: str
+    name: str
+    args: dict
+    block_number: int
+    log_index: int
+
+
+def load_abi(filename):
+    """
+    Returns the ABI of the Vyper contract in filename.
+    """
+    return build_abi_output(load_partial(filename).compiler_data)
+
+
+def _normalize(abi_type, value):
+    if abi_type == "address":
+        return to_checksum_address(value)
+    return value
+
+
+class EventDecoder:
+    """
+    Decodes the logs of the contract called name with the events in abi.
+    """
+
+    def __init__(self, name, abi):
+        self.name = name
+        self.events = {
+            event_abi_to_log_topic(item): item for item in abi if item["type"] == "event"
+        }
+
+    def decode(self, log):
+        """
+        Returns the Event of log, or None if it is not in the ABI.
+        Raises ValueError if log does not index the inputs the ABI does.
+        """
+        if not log.topics or log.topics[0] not in self.events:
+            return None
+
+        event_abi = self.events[log.topics[0]]
+        indexed = [i for i in event_abi["inputs"] if i["indexed"]]
+        not_indexed = [i for i in event_abi["inputs"] if not i["indexed"]]
+        if len(log.topics) != len(indexed) + 1:
+            raise ValueError(
+                f"{self.name}.{event_abi['name']} at block {log.block_number} has "
+                f"{len(log.topics) - 1} indexed inputs, the ABI has {len(indexed)}: "
+                "the contract was deployed with a different ABI"
+            )
+
+        values = {}
+        for item, topic in zip(indexed, log.topics[1:]):
+            values[item["name"]] = decode([item["type"]], topic)[0]
+        data = decode([i["type"] for i in not_indexed], log.data)
+        for item, value in zip(not_indexed, data):
+            values[item["name"]] = value
+
+        # keep the order of the event declaration
+        args = {
+            i["name"]: _normalize(i["type"], values[i["name"]]) for i in event_abi["inputs"]
+        }
+        return Event(self.name, event_abi["name"], args, log.block_number, log.log_index)
@@ -0,0 +1,59 @@
+"""
+Syncs the logs of a source into a Store.
+"""
+from indexer.abi import EventDecoder
+
+
+class Indexer:
+    """
+    Streams the logs of contracts from source into store in chunks of
+    chunk_size blocks.
+
+    contracts maps a name to the (address, abi) of a contract. The first
+    sync starts at start_block, later ones after the last indexed block.
+    Blocks younger than confirmations are left for a later sync, so
+    reorgs don't reach the index.
+    """
+
+    def __init__(self, store, source, contracts, start_block=0, chunk_size=2000, confirmations=0):
+        self.store = store
+        self.source = source
+        self.start_block = start_block
+        self.chunk_size = chunk_size
+        self.confirmations = confirmations
+
+        self.addresses = [address for address, _ in contracts.values()]
+        self.decoders = {
+            address.lower(): EventDecoder(name, abi) for name, (address, abi) in contracts.items()
+        }
+
+    def _decode(self, logs):
+        events = []
+        for log in logs:
+            decoder = self.decoders.get(log.address.lower())
+            event = decoder.decode(log) if decoder is not None else None
+            if event is not None:
+                events.append(event)
+        return events
+
+    def sync(self, to_block=None):
+        """
+        Indexes all blocks up to to_block (default: the confirmed head)
+        that were not indexed yet. Returns the number of indexed events.
+        """
+        if to_block is None:
+            to_block = self.source.head() - self.confirmations
+
+        cursor = self.store.cursor()
+        from_block = self.start_block if cursor is None else cursor + 1
+
+        indexed = 0
+        while from_block <= to_block:
+            chunk_end = min(from_block + self.chunk_size - 1, to_block)
+            events = self._decode(self.source.get_logs(self.addresses, from_block, chunk_end))
+            self.store.apply(events, chunk_end)
+
+            indexed += len(events)
+            from_block = chunk_end + 1
+
+        return indexed
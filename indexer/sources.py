@@ -0,0 +1,173 @@
+"""
+Sources of raw logs for the indexer: a JSON-RPC node and a local
+titanoboa environment.
+"""
+import json
+from typing import List, NamedTuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+from eth_utils import to_canonical_address, to_checksum_address
+
+
+class Log(NamedTuple):
+    address: str
+    topics: List[bytes]
+    data: bytes
+    block_number: int
+    log_index: int
+
+
+class RPCError(Exception):
+    pass
+
+
+# messages of nodes refusing an eth_getLogs range as too large
+RANGE_ERRORS = (
+    "block range",
+    "range too",
+    "range is too",
+    "too many",
+    "more than",
+    "response size",
+    "too large",
+)
+
+
+def _refuses_range(error):
+    """
+    Returns whether error is the node refusing a range, rather than the
+    request (authentication, rate limits, outages).
+    """
+    if isinstance(error, HTTPError):
+        return error.code == 413
+    details = error.args[0] if error.args else None
+    message = str(details.get("message", "")).lower() if isinstance(details, dict) else ""
+    return "rate" not in message and any(phrase in message for phrase in RANGE_ERRORS)
+
+
+class RPCLogSource:
+    """
+    Fetches logs from the JSON-RPC node at url.
+    """
+
+    def __init__(self, url, timeout=60):
+        self.url = url
+        self.timeout = timeout
+
+    def _request(self, method, params):
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        request = Request(
+            self.url,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                result = json.load(response)
+        except HTTPError as error:
+            # some nodes answer a refused range with HTTP 400 and a
+            # JSON-RPC error
+            try:
+                result = json.load(error)
+            except ValueError:
+                result = None
+            if not isinstance(result, dict) or "error" not in result:
+                raise
+        if "error" in result:
+            raise RPCError(result["error"])
+        return result["result"]
+
+    def head(self):
+        return int(self._request("eth_blockNumber", []), 16)
+
+    def get_logs(self, addresses, from_block, to_block):
+        """
+        Returns the logs of addresses from from_block to to_block,
+        both inclusive. Ranges the node refuses (too many results or
+        blocks) are fetched in halves, any other error is raised.
+        """
+        try:
+            raw_logs = self._request(
+                "eth_getLogs",
+                [{"address": addresses, "fromBlock": hex(from_block), "toBlock": hex(to_block)}],
+            )
+        except (RPCError, HTTPError) as error:
+            if from_block == to_block or not _refuses_range(error):
+                raise
+            middle = (from_block + to_block) // 2
+            return self.get_logs(addresses, from_block, middle) + self.get_logs(
+                addresses, middle + 1, to_block
+            )
+
+        return [
+            Log(
+                to_checksum_address(log["address"]),
+                [bytes.fromhex(topic[2:]) for topic in log["topics"]],
+                bytes.fromhex(log["data"][2:]),
+                int(log["blockNumber"], 16),
+                int(log["logIndex"], 16),
+            )
+            for log in raw_logs
+            if not log.get("removed", False)
+        ]
+
+
+class LocalChain:
+    """
+    Records the logs of every call made in a titanoboa env. boa does not
+    mine blocks, the logs are put into env.vm.patch.block_number, which
+    counts as mined once it is advanced.
+
+        with LocalChain(boa.env) as chain:
+            vault.register_deposit(0, 10**18)
+            boa.env.vm.patch.block_number += 1
+    """
+
+    def __init__(self, env):
+        self.env = env
+        self.logs = []
+        self._execute_code = None
+
+    def __enter__(self):
+        self._execute_code = self.env.execute_code
+
+        def execute_and_record(*args, **kwargs):
+            computation = self._execute_code(*args, **kwargs)
+            self._record(computation)
+            return computation
+
+        self.env.execute_code = execute_and_record
+        return self
+
+    def __exit__(self, *args):
+        self.env.execute_code = self._execute_code
+
+    def _record(self, computation):
+        block_number = self.env.vm.patch.block_number
+        log_index = sum(1 for log in self.logs if log.block_number == block_number)
+
+        # failed calls return no log entries
+        for address, topics, data in computation.get_log_entries():
+            self.logs.append(
+                Log(
+                    to_checksum_address(address),
+                    [topic.to_bytes(32, "big") for topic in topics],
+                    data,
+                    block_number,
+                    log_index,
+                )
+            )
+            log_index += 1
+
+    def head(self):
+        return self.env.vm.patch.block_number - 1
+
+    def get_logs(self, addresses, from_block, to_block):
+        addresses = {to_canonical_address(address) for address in addresses}
+        return [
+            log
+            for log in self.logs
+            if from_block <= log.block_number <= to_block
+            and to_canonical_address(log.address) in addresses
+        ]
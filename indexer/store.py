@@ -0,0 +1,196 @@
+"""
+SQLite index of the Vault and AuctionHouse events.
+
+Besides every decoded event in `logs`, the events are folded into
+
+    positions  one row per deposited token: depositor, amount deposited,
+               claimed and received on liquidation
+    auctions   one row per auctioned token: highest bid, refunded bids
+               and the winning bid
+    totals     WETH made claimable and debt funded over all tokens
+
+Token ids and WETH amounts exceed SQLite integers and are stored as
+decimal strings.
+"""
+import json
+import sqlite3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursor (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS logs (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    contract TEXT NOT NULL,
+    event TEXT NOT NULL,
+    token_id TEXT,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS logs_by_token_id ON logs (token_id);
+CREATE TABLE IF NOT EXISTS positions (
+    token_id TEXT PRIMARY KEY,
+    depositor TEXT,
+    amount_deposited TEXT NOT NULL DEFAULT '0',
+    amount_claimed TEXT NOT NULL DEFAULT '0',
+    amount_liquidated TEXT
+);
+CREATE TABLE IF NOT EXISTS auctions (
+    token_id TEXT PRIMARY KEY,
+    bids INTEGER NOT NULL DEFAULT 0,
+    highest_bidder TEXT,
+    highest_bid TEXT NOT NULL DEFAULT '0',
+    amount_refunded TEXT NOT NULL DEFAULT '0',
+    winner TEXT,
+    winning_bid TEXT
+);
+CREATE TABLE IF NOT EXISTS totals (
+    name TEXT PRIMARY KEY,
+    amount TEXT NOT NULL
+);
+"""
+
+
+def _json_default(value):
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    raise TypeError(f"cannot store {type(value)}")
+
+
+def _token_id(token_id):
+    return None if token_id is None else str(token_id)
+
+
+class Store:
+    """
+    The index at path, created if it does not exist.
+    """
+
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        self.handlers = {
+            "Deposit": self._on_deposit,
+            "Funded": self._on_funded,
+            "Claimable": self._on_claimable,
+            "Claimed": self._on_claimed,
+            "Liquidated": self._on_liquidated,
+            "Bid": self._on_bid,
+            "BidRefunded": self._on_bid_refunded,
+            "AuctionSettled": self._on_auction_settled,
+        }
+
+    def close(self):
+        self.db.close()
+
+    def cursor(self):
+        """
+        Returns the last indexed block, None if nothing was indexed yet.
+        """
+        row = self.db.execute("SELECT block_number FROM cursor").fetchone()
+        return None if row is None else row[0]
+
+    def apply(self, events, to_block):
+        """
+        Indexes events and moves the cursor to to_block in one
+        transaction, so an interrupted sync leaves no partial block range.
+        """
+        with self.db:
+            for event in sorted(events, key=lambda e: (e.block_number, e.log_index)):
+                self._insert_log(event)
+                if event.name in self.handlers:
+                    self.handlers[event.name](event.args)
+
+            self.db.execute(
+                "INSERT INTO cursor (id, block_number) VALUES (0, ?) "
+                "ON CONFLICT (id) DO UPDATE SET block_number = excluded.block_number",
+                (to_block,),
+            )
+
+    def _insert_log(self, event):
+        self.db.execute(
+            "INSERT OR REPLACE INTO logs VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                event.block_number,
+                event.log_index,
+                event.contract,
+                event.name,
+                _token_id(event.args.get("token_id")),
+                json.dumps(event.args, default=_json_default),
+            ),
+        )
+
+    # ---------
+    #  Helpers
+    # ---------
+    def _row(self, table, token_id):
+        token_id = _token_id(token_id)
+        self.db.execute(f"INSERT OR IGNORE INTO {table} (token_id) VALUES (?)", (token_id,))
+        cursor = self.db.execute(f"SELECT * FROM {table} WHERE token_id = ?", (token_id,))
+        return dict(zip([c[0] for c in cursor.description], cursor.fetchone()))
+
+    def _update(self, table, token_id, **values):
+        columns = ", ".join(f"{column} = ?" for column in values)
+        self.db.execute(
+            f"UPDATE {table} SET {columns} WHERE token_id = ?",
+            (*values.values(), _token_id(token_id)),
+        )
+
+    def _add_total(self, name, amount):
+        row = self.db.execute("SELECT amount FROM totals WHERE name = ?", (name,)).fetchone()
+        total = amount + (0 if row is None else int(row[0]))
+        self.db.execute("INSERT OR REPLACE INTO totals VALUES (?, ?)", (name, str(total)))
+
+    # -------
+    #  Vault
+    # -------
+    def _on_deposit(self, args):
+        self._row("positions", args["token_id"])
+        self._update(
+            "positions",
+            args["token_id"],
+            depositor=args["token_owner"],
+            amount_deposited=str(args["amount"]),
+        )
+
+    def _on_funded(self, args):
+        self._add_total("funded", args["amount"])
+
+    def _on_claimable(self, args):
+        self._add_total("claimable", args["amount"])
+
+    def _on_claimed(self, args):
+        position = self._row("positions", args["token_id"])
+        amount_claimed = int(position["amount_claimed"]) + args["amount"]
+        self._update("positions", args["token_id"], amount_claimed=str(amount_claimed))
+        self._add_total("claimed", args["amount"])
+
+    def _on_liquidated(self, args):
+        self._row("positions", args["token_id"])
+        self._update("positions", args["token_id"], amount_liquidated=str(args["amount"]))
+
+    # --------------
+    #  AuctionHouse
+    # --------------
+    def _on_bid(self, args):
+        auction = self._row("auctions", args["token_id"])
+        self._update(
+            "auctions",
+            args["token_id"],
+            bids=auction["bids"] + 1,
+            highest_bidder=args["bidder"],
+            highest_bid=str(args["amount"]),
+        )
+
+    def _on_bid_refunded(self, args):
+        auction = self._row("auctions", args["token_id"])
+        amount_refunded = int(auction["amount_refunded"]) + args["amount"]
+        self._update("auctions", args["token_id"], amount_refunded=str(amount_refunded))
+
+    def _on_auction_settled(self, args):
+        self._row("auctions", args["token_id"])
+        self._update(
+            "auctions", args["token_id"], winner=args["winner"], winning_bid=str(args["amount"])
+        )
@@ -1,10 +1,24 @@
+import os
+import sys
+
 import boa
 
-boa.env.fork(
-    url="https://eth-mainnet.g.alchemy.com/v2/Av81aQS88N_SG0iwgWCQCAvFy4giDIKs"
-)
+from contract_loader import load, load_partial
+from fork_snapshot import fork
+
+RPC_URL = "https://eth-mainnet.g.alchemy.com/v2/Av81aQS88N_SG0iwgWCQCAvFy4giDIKs"
+SNAPSHOT = "localtesting_snapshot.json"
+
+# `python -i localtesting.py --capture` forks mainnet and records the state
+# used into SNAPSHOT, without --capture the fork is replayed from SNAPSHOT
+capture = "--capture" in sys.argv
+if not capture and not os.path.exists(SNAPSHOT):
+    print(f"{SNAPSHOT} not found, forking mainnet to record it")
+    capture = True
+
+fork(boa.env, SNAPSHOT, url=RPC_URL if capture else None)
 
-weth = boa.load_partial("contracts/token/ERC20.vy").at(
+weth = load_partial("contracts/token/ERC20.vy").at(
     "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
 )
 
@@ -19,14 +33,14 @@ with boa.env.prank("0x06920C9fC643De77B99cB7670A944AD31eaAA260"):
 # with boa.env.prank("0x9e2b6378ee8ad2A4A95Fe481d63CAba8FB0EBBF9"):
 #     alchemistWhitelist.add(vault)
 
-alchemist = boa.load_partial("contracts/testing/MockAlchemist.vy").at(
+alchemist = load_partial("contracts/testing/MockAlchemist.vy").at(
     "0x062Bf725dC4cDF947aa79Ca2aaCCD4F385b13b5c"
 )
 
-ALCX_YVWETH = boa.load_partial("contracts/token/ERC20.vy").at(
+ALCX_YVWETH = load_partial("contracts/token/ERC20.vy").at(
     "0xa258C4606Ca8206D8aA700cE2143D7db854D168c"
 )
 
-nft = boa.load("contracts/token/ERC721.vy")
+nft = load("contracts/token/ERC721.vy")
 
-vault = boa.load("contracts/Vault.vy")
+vault = load("contracts/Vault.vy")
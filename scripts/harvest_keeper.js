@@ -0,0 +1,82 @@
+const hre = require("hardhat");
+const ethers = require("ethers")
+
+// Polls the vault and calls `harvest` once the unlocked WETH is worth the gas.
+//
+//     VAULT_ADDRESS=0x... npx hardhat run scripts/harvest_keeper.js --network mainnet
+//
+// VAULT_ADDRESS      the vault to harvest
+// MIN_PAYOUT         minimum WETH per harvest, in ether (default 0.5)
+// MAX_GAS_COST_BPS   maximum gas cost in basis points of the payout (default 100)
+// SLIPPAGE_BPS       accepted shortfall against the simulated payout (default 50)
+// POLL_INTERVAL      seconds between two checks (default 3600)
+// ONCE               check a single time and exit if set
+const vault_address = process.env.VAULT_ADDRESS
+const min_payout = ethers.utils.parseEther(process.env.MIN_PAYOUT || "0.5")
+const max_gas_cost_bps = parseInt(process.env.MAX_GAS_COST_BPS || "100")
+const slippage_bps = parseInt(process.env.SLIPPAGE_BPS || "50")
+const poll_interval = parseInt(process.env.POLL_INTERVAL || "3600")
+
+
+function log(message) {
+    console.log(new Date().toISOString(), message)
+}
+
+
+async function check(vault) {
+    // simulating harvest gives the exact payout at the current block
+    let payout
+    try {
+        payout = await vault.callStatic.harvest(0)
+    } catch (error) {
+        log("nothing to harvest")
+        return
+    }
+
+    if (payout.lt(min_payout)) {
+        log(`payout ${ethers.utils.formatEther(payout)} below minimum`)
+        return
+    }
+
+    const min_weth_out = payout.mul(10000 - slippage_bps).div(10000)
+    const gas = await vault.estimateGas.harvest(min_weth_out)
+    const fee_data = await hre.ethers.provider.getFeeData()
+    const gas_cost = gas.mul(fee_data.maxFeePerGas || fee_data.gasPrice)
+
+    // gas is paid in ETH and the payout is WETH, they compare 1:1
+    if (gas_cost.mul(10000).gt(payout.mul(max_gas_cost_bps))) {
+        log(
+            `gas cost ${ethers.utils.formatEther(gas_cost)} too high ` +
+            `for payout ${ethers.utils.formatEther(payout)}`
+        )
+        return
+    }
+
+    const tx = await vault.harvest(min_weth_out)
+    log(`harvest ${ethers.utils.formatEther(payout)} WETH: ${tx.hash}`)
+    await tx.wait()
+}
+
+
+async function main() {
+    const vault = await hre.ethers.getContractAt("Vault", vault_address)
+
+    while (true) {
+        try {
+            await check(vault)
+        } catch (error) {
+            log(error)
+        }
+
+        if (process.env.ONCE) {
+            return
+        }
+        await new Promise((resolve) => setTimeout(resolve, poll_interval * 1000))
+    }
+}
+
+
+main().catch((error) => {
+    console.error(error);
+    process.exitCode = 1;
+});
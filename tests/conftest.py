@@ -1,7 +1,13 @@
+import os
+
 import pytest
 import boa
+from eth_utils import keccak
+from hypothesis import settings
 from vyper.utils import checksum_encode
 
+import contract_loader
+
 
 def pytest_configure():
     pytest.ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
@@ -10,6 +16,37 @@ def pytest_configure():
     pytest.ALETH = "0x0100546F2cD4C9D97f798fFC9755E47865FF7Ee6"
 
 
+# ------------
+#  Hypothesis
+# ------------
+# `HYPOTHESIS_PROFILE=fuzz pytest tests/test_Vault_fuzz.py` for a long run
+settings.register_profile("default", max_examples=15, stateful_step_count=30, deadline=None)
+settings.register_profile("fuzz", max_examples=500, stateful_step_count=100, deadline=None)
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "default"))
+
+
+# --------------------
+#  Compiled contracts
+# --------------------
+@pytest.fixture(scope="session")
+def load_partial():
+    return contract_loader.load_partial
+
+
+# ---------
+#  Helpers
+# ---------
+def raw_topics(contract, signature):
+    """
+    Returns the topics of the last call's event with signature.
+    """
+    topic = int.from_bytes(keccak(text=signature), "big")
+    for _, topics, _ in contract._computation.get_log_entries():
+        if topics[0] == topic:
+            return topics
+    raise Exception(f"event {signature} was not emitted")
+
+
 # ----------
 #  Accounts
 # ----------
@@ -36,9 +73,8 @@ def bob():
 #  Contracts
 # -----------
 @pytest.fixture(scope="session")
-def house_snapshot(owner, weth_snapshot, nft_snapshot, mock_vault_snapshot):
-    return boa.load(
-        "contracts/AuctionHouse.vy",
+def house_snapshot(load_partial, owner, weth_snapshot, nft_snapshot, mock_vault_snapshot):
+    return load_partial("contracts/AuctionHouse.vy").deploy(
         weth_snapshot,
         nft_snapshot,
         0,  # start_token_id
@@ -56,9 +92,8 @@ def house(house_snapshot):
 
 
 @pytest.fixture(scope="session")
-def weth_snapshot(alice, bob):
-    weth = boa.load(
-        "contracts/testing/token/ERC20.vy",
+def weth_snapshot(load_partial, alice, bob):
+    weth = load_partial("contracts/testing/token/ERC20.vy").deploy(
         "wrapped ETH",
         "WETH",
         18,
@@ -77,8 +112,8 @@ def weth(weth_snapshot):
 
 
 @pytest.fixture(scope="session")
-def mock_migrator_snapshot():
-    return boa.load("contracts/testing/MockMigrator.vy")
+def mock_migrator_snapshot(load_partial):
+    return load_partial("contracts/testing/MockMigrator.vy").deploy()
 
 
 @pytest.fixture()
@@ -88,8 +123,8 @@ def mock_migrator(mock_migrator_snapshot):
 
 
 @pytest.fixture(scope="session")
-def nft_snapshot():
-    nft = boa.load("contracts/testing/token/ERC721.vy")
+def nft_snapshot(load_partial):
+    nft = load_partial("contracts/testing/token/ERC721.vy").deploy()
     return nft
 
 
@@ -100,8 +135,19 @@ def nft(nft_snapshot):
 
 
 @pytest.fixture(scope="session")
-def vault_snapshot(nft_snapshot):
-    return boa.load("contracts/Vault.vy", nft_snapshot)
+def lazy_nft_snapshot(load_partial):
+    return load_partial("contracts/token/LazyERC721.vy").deploy(0)
+
+
+@pytest.fixture()
+def lazy_nft(lazy_nft_snapshot):
+    with boa.env.anchor():
+        yield lazy_nft_snapshot
+
+
+@pytest.fixture(scope="session")
+def vault_snapshot(load_partial, nft_snapshot):
+    return load_partial("contracts/Vault.vy").deploy(nft_snapshot)
 
 
 @pytest.fixture()
@@ -111,8 +157,8 @@ def vault(vault_snapshot):
 
 
 @pytest.fixture(scope="session")
-def mock_vault_snapshot():
-    return boa.load("contracts/testing/MockVault.vy")
+def mock_vault_snapshot(load_partial):
+    return load_partial("contracts/testing/MockVault.vy").deploy()
 
 
 @pytest.fixture()
@@ -122,8 +168,8 @@ def mock_vault(mock_vault_snapshot):
 
 
 @pytest.fixture(scope="session")
-def mock_alchemist_snapshot():
-    return boa.load("contracts/testing/MockAlchemist.vy")
+def mock_alchemist_snapshot(load_partial):
+    return load_partial("contracts/testing/MockAlchemist.vy").deploy()
 
 
 @pytest.fixture()
@@ -132,6 +178,18 @@ def alchemist(mock_alchemist_snapshot):
         yield mock_alchemist_snapshot
 
 
+@pytest.fixture(scope="session")
+def yield_alchemist_snapshot(load_partial):
+    # about 5% a year at 12 seconds per block
+    return load_partial("contracts/testing/MockYieldAlchemist.vy").deploy(5 * 10**16 // 2_628_000)
+
+
+@pytest.fixture()
+def yield_alchemist(yield_alchemist_snapshot):
+    with boa.env.anchor():
+        yield yield_alchemist_snapshot
+
+
 # -----------
 #    setup
 # -----------
@@ -129,6 +129,30 @@ def test_last_bidder_gets_refunded(house, weth, alice, bob):
     assert alice_balance_after == alice_balance_initial
 
 
+def test_highest_bidder_top_up_only_transfers_difference(house, weth, alice):
+    amount = house.RESERVE_PRICE()
+    alice_balance_initial = weth.balanceOf(alice)
+
+    with boa.env.prank(alice):
+        house.bid(house.current_epoch_token_id(), amount)
+        house.bid(house.current_epoch_token_id(), amount * 2)
+
+    assert house.highest_bid() == amount * 2
+    assert house.highest_bidder() == alice
+    assert weth.balanceOf(alice) == alice_balance_initial - amount * 2
+    assert weth.balanceOf(house) == amount * 2
+
+
+def test_top_up_has_to_meet_min_increment(house, alice):
+    amount = house.RESERVE_PRICE()
+
+    with boa.env.prank(alice):
+        house.bid(house.current_epoch_token_id(), amount)
+
+        with boa.reverts("bid not high enough"):
+            house.bid(house.current_epoch_token_id(), amount + 1)
+
+
 def test_cannot_bid_before_epoch_starts(house):
     timetravel(house.epoch_start() - 1)
 
@@ -1,5 +1,8 @@
 import pytest
 import boa
+from vyper.compiler.output import build_abi_output
+
+from conftest import raw_topics
 
 
 def timetravel(to):
@@ -118,3 +121,28 @@ def test_accepting_ownership_emits_event(house, owner, alice):
         house.accept_ownership()
 
     assert emitted(house, "OwnershipTransferred", owner, alice)
+
+
+@pytest.mark.parametrize(
+    "event",
+    ["Bid", "AuctionSettled", "AuctionSettledWithNoBid", "AuctionExtended", "BidRefunded"],
+)
+def test_token_id_is_indexed(house, event):
+    abi = build_abi_output(house.compiler_data)
+    (event_abi,) = [e for e in abi if e["type"] == "event" and e["name"] == event]
+    inputs = {i["name"]: i["indexed"] for i in event_abi["inputs"]}
+
+    assert inputs["token_id"]
+
+
+def test_bids_can_be_filtered_by_token_id(house, owner, alice):
+    house.start_auction(0)
+    token_id = house.current_epoch_token_id()
+    reserve_price = house.RESERVE_PRICE()
+    house.bid(token_id, reserve_price)
+
+    with boa.env.prank(alice):
+        house.bid(token_id, reserve_price * 2)
+
+    assert raw_topics(house, "Bid(uint256,address,uint256)")[1] == token_id
+    assert raw_topics(house, "BidRefunded(uint256,address,uint256)")[1] == token_id
@@ -0,0 +1,151 @@
+import pytest
+
+import boa
+
+
+@pytest.fixture(autouse=True)
+def start(house):
+    house.set_pull_refunds(True)
+    house.start_auction(0)
+
+
+def test_owner_can_set_pull_refunds(house):
+    assert house.pull_refunds() == True
+    house.set_pull_refunds(False)
+    assert house.pull_refunds() == False
+
+
+def test_non_owner_cannot_set_pull_refunds(house, alice):
+    with boa.env.prank(alice):
+        with boa.reverts("unauthorized"):
+            house.set_pull_refunds(False)
+
+
+def test_outbid_credits_last_bidder_instead_of_transfer(house, weth, alice, bob):
+    amount = house.RESERVE_PRICE()
+    token_id = house.current_epoch_token_id()
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount)
+
+    alice_balance_before = weth.balanceOf(alice)
+
+    with boa.env.prank(bob):
+        house.bid(token_id, amount * 2)
+
+    assert weth.balanceOf(alice) == alice_balance_before
+    assert house.pending_refunds(alice) == amount
+    assert weth.balanceOf(house) == amount * 3
+
+
+def test_withdraw_refund_transfers_pending_refund(house, weth, alice, bob):
+    amount = house.RESERVE_PRICE()
+    token_id = house.current_epoch_token_id()
+    alice_balance_initial = weth.balanceOf(alice)
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount)
+
+    with boa.env.prank(bob):
+        house.bid(token_id, amount * 2)
+
+    with boa.env.prank(alice):
+        withdrawn = house.withdraw_refund()
+
+    assert withdrawn == amount
+    assert house.pending_refunds(alice) == 0
+    assert weth.balanceOf(alice) == alice_balance_initial
+
+
+def test_withdraw_refund_without_pending_refund_transfers_nothing(house, weth, alice):
+    alice_balance_before = weth.balanceOf(alice)
+
+    with boa.env.prank(alice):
+        withdrawn = house.withdraw_refund()
+
+    assert withdrawn == 0
+    assert weth.balanceOf(alice) == alice_balance_before
+
+
+def test_withdraw_refunds_pays_out_all_receivers(house, weth, owner, alice, bob):
+    amount = house.RESERVE_PRICE()
+    token_id = house.current_epoch_token_id()
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount)
+    with boa.env.prank(bob):
+        house.bid(token_id, amount * 2)
+    house.bid(token_id, amount * 3)
+
+    alice_balance_before = weth.balanceOf(alice)
+    bob_balance_before = weth.balanceOf(bob)
+
+    total = house.withdraw_refunds([alice, bob, owner])
+
+    assert total == amount * 3
+    assert weth.balanceOf(alice) == alice_balance_before + amount
+    assert weth.balanceOf(bob) == bob_balance_before + amount * 2
+    assert house.pending_refunds(alice) == 0
+    assert house.pending_refunds(bob) == 0
+
+
+def test_rebid_uses_pending_refund_first(house, weth, alice, bob):
+    amount = house.RESERVE_PRICE()
+    token_id = house.current_epoch_token_id()
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount)
+    with boa.env.prank(bob):
+        house.bid(token_id, amount * 2)
+
+    alice_balance_before = weth.balanceOf(alice)
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount * 3)
+
+    assert weth.balanceOf(alice) == alice_balance_before - amount * 2
+    assert house.pending_refunds(alice) == 0
+    assert house.pending_refunds(bob) == amount * 2
+    assert house.highest_bid() == amount * 3
+    assert house.highest_bidder() == alice
+
+
+def test_rebid_below_pending_refund_does_not_transfer(house, weth, alice, bob):
+    amount = house.RESERVE_PRICE()
+    token_id = house.current_epoch_token_id()
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount * 3)
+    with boa.env.prank(bob):
+        house.bid(token_id, amount * 4)
+
+    # next auction, alice still has a credit of 3 * amount
+    house.eval("self.highest_bid = 0")
+    house.eval("self.highest_bidder = empty(address)")
+
+    alice_balance_before = weth.balanceOf(alice)
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount)
+
+    assert weth.balanceOf(alice) == alice_balance_before
+    assert house.pending_refunds(alice) == amount * 2
+
+
+def test_pending_refunds_can_be_withdrawn_after_disabling(house, weth, alice, bob):
+    amount = house.RESERVE_PRICE()
+    token_id = house.current_epoch_token_id()
+
+    with boa.env.prank(alice):
+        house.bid(token_id, amount)
+    with boa.env.prank(bob):
+        house.bid(token_id, amount * 2)
+
+    house.set_pull_refunds(False)
+
+    alice_balance_before = weth.balanceOf(alice)
+    with boa.env.prank(alice):
+        house.withdraw_refund()
+
+    assert weth.balanceOf(alice) == alice_balance_before + amount
+
@@ -178,3 +178,143 @@ def test_settle_can_only_be_called_after_auction_started(house):
 
     with boa.reverts("auction not started"):
         house.settle()
+
+
+def test_catch_up_settles_elapsed_epochs_to_fallback_receiver(house, owner, nft):
+    house.set_max_token_id(10)
+    house.start_auction(0)
+    first_epoch_end = house.epoch_end()
+    epoch_length = house.EPOCH_LENGTH()
+
+    # epochs of token 1 and 2 fully elapse, token 3 would be in progress
+    timetravel(first_epoch_end + 2 * epoch_length + epoch_length // 2)
+
+    house.settle_and_catch_up(10)
+
+    for token_id in [0, 1, 2]:
+        assert nft.ownerOf(token_id) == owner
+
+    with boa.reverts():
+        nft.ownerOf(3)
+
+    assert house.current_epoch_token_id() == 3
+    assert house.epoch_start() == first_epoch_end + 2 * epoch_length
+    assert house.epoch_end() == first_epoch_end + 3 * epoch_length
+
+
+def test_catch_up_keeps_schedule_without_missed_epochs(house):
+    house.set_max_token_id(10)
+    house.start_auction(0)
+    first_epoch_end = house.epoch_end()
+
+    timetravel(first_epoch_end + 1)
+    house.settle_and_catch_up(10)
+
+    assert house.current_epoch_token_id() == 1
+    assert house.epoch_start() == first_epoch_end
+    assert house.epoch_end() == first_epoch_end + house.EPOCH_LENGTH()
+
+
+def test_catch_up_keeps_schedule_while_min_epoch_length_is_left(house):
+    house.set_max_token_id(10)
+    house.start_auction(0)
+    first_epoch_end = house.epoch_end()
+
+    timetravel(first_epoch_end + house.EPOCH_LENGTH() - house.MIN_EPOCH_LENGTH())
+    house.settle_and_catch_up(0)
+
+    assert house.epoch_start() == first_epoch_end
+    assert house.epoch_end() - boa.env.vm.patch.timestamp == house.MIN_EPOCH_LENGTH()
+
+
+def test_catch_up_does_not_shorten_the_next_auction(house):
+    house.set_max_token_id(10)
+    house.start_auction(0)
+    first_epoch_end = house.epoch_end()
+    epoch_length = house.EPOCH_LENGTH()
+
+    # a few minutes would be left of the epoch of token 1
+    timetravel(first_epoch_end + epoch_length - 5 * 60)
+    house.settle_and_catch_up(0)
+
+    assert house.current_epoch_token_id() == 1
+    assert house.epoch_start() == first_epoch_end + epoch_length - 5 * 60
+    assert house.epoch_end() == house.epoch_start() + epoch_length
+
+
+def test_catch_up_does_not_shorten_the_auction_after_missed_epochs(house, owner, nft):
+    house.set_max_token_id(10)
+    house.start_auction(0)
+    first_epoch_end = house.epoch_end()
+    epoch_length = house.EPOCH_LENGTH()
+
+    timetravel(first_epoch_end + 3 * epoch_length - 5 * 60)
+    house.settle_and_catch_up(10)
+
+    # only the epochs of token 1 and 2 fully elapsed
+    assert nft.ownerOf(2) == owner
+    assert house.current_epoch_token_id() == 3
+    assert house.epoch_start() == first_epoch_end + 3 * epoch_length - 5 * 60
+
+
+def test_catch_up_respects_max_missed_epochs(house, owner, nft):
+    house.set_max_token_id(10)
+    house.start_auction(0)
+    first_epoch_end = house.epoch_end()
+    epoch_length = house.EPOCH_LENGTH()
+
+    timetravel(first_epoch_end + 5 * epoch_length + 1)
+
+    house.settle_and_catch_up(2)
+
+    assert nft.ownerOf(2) == owner
+    assert house.current_epoch_token_id() == 3
+    assert house.epoch_start() == first_epoch_end + 2 * epoch_length
+
+    # the next epoch is already over and can be caught up right away
+    house.settle_and_catch_up(10)
+
+    assert nft.ownerOf(5) == owner
+    assert house.current_epoch_token_id() == 6
+    assert house.epoch_start() == first_epoch_end + 5 * epoch_length
+
+
+def test_catch_up_stops_at_max_token_id(house, owner, nft):
+    house.set_max_token_id(2)
+    house.start_auction(0)
+    timetravel(house.epoch_end() + 10 * house.EPOCH_LENGTH())
+
+    house.settle_and_catch_up(10)
+
+    assert nft.ownerOf(2) == owner
+    assert house.current_epoch_token_id() == house.max_token_id()
+    assert house.epoch_start() == 0
+    assert house.epoch_end() == 0
+
+
+def test_catch_up_settles_latest_epoch_with_bid(house, alice, nft, mock_vault):
+    house.set_max_token_id(10)
+    house.start_auction(0)
+    token_id = house.current_epoch_token_id()
+
+    with boa.env.prank(alice):
+        house.bid(token_id, house.RESERVE_PRICE())
+
+    timetravel(house.epoch_end() + 3 * house.EPOCH_LENGTH())
+
+    house.settle_and_catch_up(10)
+
+    assert nft.ownerOf(token_id) == alice
+    assert mock_vault.token_id() == token_id
+    assert mock_vault.amount() == house.RESERVE_PRICE()
+    assert house.current_epoch_token_id() == token_id + 3
+
+
+def test_catch_up_can_only_be_called_after_epoch_over(house):
+    with boa.reverts("auction not started"):
+        house.settle_and_catch_up(10)
+
+    house.start_auction(0)
+
+    with boa.reverts("epoch not over"):
+        house.settle_and_catch_up(10)
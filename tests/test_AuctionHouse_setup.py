@@ -8,10 +8,9 @@ INVALID_ADDRESS = pytest.ZERO_ADDRESS
 VALID_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
 
 
-def test_cannot_deploy_with_reserve_price_zero(owner, weth, nft):
+def test_cannot_deploy_with_reserve_price_zero(load_partial, owner, weth, nft):
     with pytest.raises(eth.exceptions.Revert):
-        boa.load(
-            "contracts/AuctionHouse.vy",
+        load_partial("contracts/AuctionHouse.vy").deploy(
             weth,
             nft,
             0,
@@ -22,10 +21,9 @@ def test_cannot_deploy_with_reserve_price_zero(owner, weth, nft):
         )
 
 
-def test_cannot_deploy_with_invalid_weth_address(owner, nft):
+def test_cannot_deploy_with_invalid_weth_address(load_partial, owner, nft):
     with pytest.raises(eth.exceptions.Revert):
-        boa.load(
-            "contracts/AuctionHouse.vy",
+        load_partial("contracts/AuctionHouse.vy").deploy(
             INVALID_ADDRESS,
             nft,
             0,
@@ -36,10 +34,9 @@ def test_cannot_deploy_with_invalid_weth_address(owner, nft):
         )
 
 
-def test_cannot_deploy_with_invalid_nft_address(owner, weth):
+def test_cannot_deploy_with_invalid_nft_address(load_partial, owner, weth):
     with pytest.raises(eth.exceptions.Revert):
-        boa.load(
-            "contracts/AuctionHouse.vy",
+        load_partial("contracts/AuctionHouse.vy").deploy(
             weth,
             INVALID_ADDRESS,
             0,
@@ -50,10 +47,9 @@ def test_cannot_deploy_with_invalid_nft_address(owner, weth):
         )
 
 
-def test_cannot_deploy_with_invalid_fallback_receiver_address(weth, nft):
+def test_cannot_deploy_with_invalid_fallback_receiver_address(load_partial, weth, nft):
     with pytest.raises(eth.exceptions.Revert):
-        boa.load(
-            "contracts/AuctionHouse.vy",
+        load_partial("contracts/AuctionHouse.vy").deploy(
             weth,
             nft,
             0,
@@ -64,12 +60,11 @@ def test_cannot_deploy_with_invalid_fallback_receiver_address(weth, nft):
         )
 
 
-def test_cannot_deploy_with_invalid_token_ids(weth, nft):
+def test_cannot_deploy_with_invalid_token_ids(load_partial, weth, nft):
     start_id = 2
     max_id = 1
     with pytest.raises(eth.exceptions.Revert):
-        boa.load(
-            "contracts/AuctionHouse.vy",
+        load_partial("contracts/AuctionHouse.vy").deploy(
             weth,
             nft,
             start_id,
@@ -80,10 +75,9 @@ def test_cannot_deploy_with_invalid_token_ids(weth, nft):
         )
 
 
-def test_cannot_deploy_with_invalid_vault_address():
+def test_cannot_deploy_with_invalid_vault_address(load_partial):
     with pytest.raises(eth.exceptions.Revert):
-        boa.load(
-            "contracts/AuctionHouse.vy",
+        load_partial("contracts/AuctionHouse.vy").deploy(
             VALID_ADDRESS,
             VALID_ADDRESS,
             0,
@@ -98,10 +92,9 @@ def test_auctionhouse_deployed(house):
     assert house.address != pytest.ZERO_ADDRESS
 
 
-def test_deployment_sets_reserve_price(owner, weth, nft):
+def test_deployment_sets_reserve_price(load_partial, owner, weth, nft):
     reserve_price = 123
-    house = boa.load(
-        "contracts/AuctionHouse.vy",
+    house = load_partial("contracts/AuctionHouse.vy").deploy(
         weth,
         nft,
         0,
@@ -129,10 +122,9 @@ def test_deployment_sets_fallback_receiver_address(owner, house):
     assert house.FALLBACK_RECEIVER() == owner
 
 
-def test_deployment_sets_start_token_id(house, weth, nft, owner):
+def test_deployment_sets_start_token_id(load_partial, house, weth, nft, owner):
     start_token = 2
-    house = boa.load(
-        "contracts/AuctionHouse.vy",
+    house = load_partial("contracts/AuctionHouse.vy").deploy(
         weth,
         nft,
         start_token,
@@ -144,10 +136,9 @@ def test_deployment_sets_start_token_id(house, weth, nft, owner):
     assert house.current_epoch_token_id() == start_token
 
 
-def test_deployment_sets_start_token_id(house, weth, nft, owner):
+def test_deployment_sets_start_token_id(load_partial, house, weth, nft, owner):
     max_token = 55
-    house = boa.load(
-        "contracts/AuctionHouse.vy",
+    house = load_partial("contracts/AuctionHouse.vy").deploy(
         weth,
         nft,
         0,
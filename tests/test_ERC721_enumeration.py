@@ -0,0 +1,86 @@
+import pytest
+import boa
+
+
+@pytest.fixture(autouse=True)
+def setup(nft, owner):
+    nft.DEBUG_transferMinter(owner)
+
+
+def tokens_of(nft, owner):
+    return sorted(nft.tokenOfOwnerByIndex(owner, i) for i in range(nft.balanceOf(owner)))
+
+
+def all_tokens(nft):
+    return sorted(nft.tokenByIndex(i) for i in range(nft.totalSupply()))
+
+
+def test_supports_enumerable_interface(nft):
+    assert nft.supportsInterface(bytes.fromhex("780e9d63"))
+
+
+def test_mint_adds_to_enumeration(nft, alice, bob):
+    nft.mint(alice, 7)
+    nft.mint(bob, 3)
+    nft.mint(alice, 5)
+
+    assert nft.totalSupply() == 3
+    assert all_tokens(nft) == [3, 5, 7]
+    assert tokens_of(nft, alice) == [5, 7]
+    assert tokens_of(nft, bob) == [3]
+
+
+def test_batch_mints_add_to_enumeration(nft, alice, bob):
+    nft.mint(alice, 0)
+    nft.mint_batch(alice, [10, 11, 12])
+    nft.mint_range(bob, 20, 3)
+    nft.mint_range(alice, 30, 2)
+
+    assert nft.totalSupply() == 9
+    assert all_tokens(nft) == [0, 10, 11, 12, 20, 21, 22, 30, 31]
+    assert tokens_of(nft, alice) == [0, 10, 11, 12, 30, 31]
+    assert tokens_of(nft, bob) == [20, 21, 22]
+
+
+def test_transfer_moves_token_between_enumerations(nft, alice, bob):
+    nft.mint_range(alice, 0, 5)
+    nft.mint(bob, 5)
+
+    with boa.env.prank(alice):
+        nft.transferFrom(alice, bob, 1)
+        nft.transferFrom(alice, bob, 4)
+
+    assert tokens_of(nft, alice) == [0, 2, 3]
+    assert tokens_of(nft, bob) == [1, 4, 5]
+    assert nft.totalSupply() == 6
+
+    with boa.env.prank(bob):
+        nft.transferFrom(bob, alice, 5)
+
+    assert tokens_of(nft, alice) == [0, 2, 3, 5]
+    assert tokens_of(nft, bob) == [1, 4]
+
+
+def test_burn_removes_token_from_enumerations(nft, alice):
+    nft.mint_range(alice, 0, 5)
+
+    with boa.env.prank(alice):
+        nft.burn(0)
+        nft.burn(3)
+
+    assert nft.totalSupply() == 3
+    assert all_tokens(nft) == [1, 2, 4]
+    assert tokens_of(nft, alice) == [1, 2, 4]
+
+
+def test_index_out_of_bounds_reverts(nft, alice, bob):
+    nft.mint(alice, 0)
+
+    with boa.reverts():
+        nft.tokenByIndex(1)
+
+    with boa.reverts():
+        nft.tokenOfOwnerByIndex(alice, 1)
+
+    with boa.reverts():
+        nft.tokenOfOwnerByIndex(bob, 0)
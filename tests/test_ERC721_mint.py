@@ -0,0 +1,72 @@
+import pytest
+import boa
+
+TOKEN_IDS = list(range(100, 132))
+
+
+@pytest.fixture(autouse=True)
+def setup(nft, owner):
+    nft.DEBUG_transferMinter(owner)
+
+
+def test_mint_batch_assigns_all_tokens(nft, alice):
+    nft.mint_batch(alice, TOKEN_IDS)
+
+    for token_id in TOKEN_IDS:
+        assert nft.ownerOf(token_id) == alice
+    assert nft.balanceOf(alice) == len(TOKEN_IDS)
+
+
+def test_mint_range_assigns_consecutive_tokens(nft, alice):
+    nft.mint_range(alice, TOKEN_IDS[0], len(TOKEN_IDS))
+
+    for token_id in TOKEN_IDS:
+        assert nft.ownerOf(token_id) == alice
+    assert nft.balanceOf(alice) == len(TOKEN_IDS)
+
+    with boa.reverts():
+        nft.ownerOf(TOKEN_IDS[-1] + 1)
+
+
+def test_batch_mints_add_to_existing_balance(nft, alice):
+    nft.mint(alice, 0)
+    nft.mint_batch(alice, [1, 2])
+    nft.mint_range(alice, 3, 2)
+
+    assert nft.balanceOf(alice) == 5
+
+
+def test_batch_mints_cannot_mint_existing_token(nft, alice, bob):
+    nft.mint(bob, TOKEN_IDS[5])
+
+    with boa.reverts():
+        nft.mint_batch(alice, TOKEN_IDS)
+
+    with boa.reverts():
+        nft.mint_range(alice, TOKEN_IDS[0], len(TOKEN_IDS))
+
+    with boa.reverts():
+        nft.mint_batch(alice, [1, 1])
+
+
+def test_batch_mints_cannot_mint_to_zero_address(nft):
+    with boa.reverts():
+        nft.mint_batch(pytest.ZERO_ADDRESS, TOKEN_IDS)
+
+    with boa.reverts():
+        nft.mint_range(pytest.ZERO_ADDRESS, TOKEN_IDS[0], len(TOKEN_IDS))
+
+
+def test_only_minter_can_batch_mint(nft, alice):
+    with boa.env.prank(alice):
+        with boa.reverts():
+            nft.mint_batch(alice, TOKEN_IDS)
+
+        with boa.reverts():
+            nft.mint_range(alice, TOKEN_IDS[0], len(TOKEN_IDS))
+
+
+def test_mint_range_cannot_exceed_max_batch(nft, alice):
+    with boa.reverts():
+        nft.mint_range(alice, 0, 257)
+
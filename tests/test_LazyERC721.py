@@ -0,0 +1,122 @@
+import pytest
+import boa
+
+AMOUNT = 32
+
+
+def test_mint_range_resolves_owner_of_every_token(lazy_nft, owner, alice):
+    lazy_nft.mint_range(alice, 0, AMOUNT)
+
+    for token_id in range(AMOUNT):
+        assert lazy_nft.ownerOf(token_id) == alice
+    assert lazy_nft.balanceOf(alice) == AMOUNT
+    assert lazy_nft.nextTokenId() == AMOUNT
+
+
+def test_tokens_not_minted_yet_are_invalid(lazy_nft, alice):
+    lazy_nft.mint_range(alice, 0, AMOUNT)
+
+    with boa.reverts():
+        lazy_nft.ownerOf(AMOUNT)
+
+
+def test_mints_have_to_be_sequential(lazy_nft, alice):
+    with boa.reverts():
+        lazy_nft.mint(alice, 1)
+
+    lazy_nft.mint(alice, 0)
+
+    with boa.reverts():
+        lazy_nft.mint_range(alice, 0, 2)
+
+    lazy_nft.mint_range(alice, 1, 2)
+    assert lazy_nft.nextTokenId() == 3
+
+
+def test_only_minter_can_mint(lazy_nft, alice):
+    with boa.env.prank(alice):
+        with boa.reverts():
+            lazy_nft.mint(alice, 0)
+
+        with boa.reverts():
+            lazy_nft.mint_range(alice, 0, AMOUNT)
+
+
+def test_mint_range_amount_is_bounded(lazy_nft, alice):
+    with boa.reverts():
+        lazy_nft.mint_range(alice, 0, 0)
+
+    with boa.reverts():
+        lazy_nft.mint_range(alice, 0, 257)
+
+
+def test_transfer_from_range_keeps_other_owners(lazy_nft, alice, bob):
+    lazy_nft.mint_range(alice, 0, AMOUNT)
+    lazy_nft.mint_range(bob, AMOUNT, AMOUNT)
+
+    with boa.env.prank(alice):
+        lazy_nft.transferFrom(alice, bob, 5)
+
+    for token_id in range(AMOUNT):
+        expected = bob if token_id == 5 else alice
+        assert lazy_nft.ownerOf(token_id) == expected
+    for token_id in range(AMOUNT, 2 * AMOUNT):
+        assert lazy_nft.ownerOf(token_id) == bob
+
+    assert lazy_nft.balanceOf(alice) == AMOUNT - 1
+    assert lazy_nft.balanceOf(bob) == AMOUNT + 1
+
+
+def test_transfer_of_last_minted_token(lazy_nft, alice, bob):
+    lazy_nft.mint_range(alice, 0, AMOUNT)
+
+    with boa.env.prank(alice):
+        lazy_nft.transferFrom(alice, bob, AMOUNT - 1)
+
+    assert lazy_nft.ownerOf(AMOUNT - 1) == bob
+    assert lazy_nft.ownerOf(AMOUNT - 2) == alice
+
+    lazy_nft.mint_range(alice, AMOUNT, 1)
+    assert lazy_nft.ownerOf(AMOUNT) == alice
+
+
+def test_transfer_requires_owner_or_approval(lazy_nft, owner, alice, bob):
+    lazy_nft.mint_range(alice, 0, AMOUNT)
+
+    with boa.env.prank(bob):
+        with boa.reverts():
+            lazy_nft.transferFrom(alice, bob, 3)
+
+    with boa.env.prank(alice):
+        lazy_nft.approve(bob, 3)
+
+    assert lazy_nft.getApproved(3) == bob
+
+    with boa.env.prank(bob):
+        lazy_nft.transferFrom(alice, bob, 3)
+
+    assert lazy_nft.ownerOf(3) == bob
+    assert lazy_nft.getApproved(3) == pytest.ZERO_ADDRESS
+
+    with boa.env.prank(bob):
+        with boa.reverts():
+            lazy_nft.transferFrom(alice, bob, 4)
+
+
+def test_burn_keeps_other_owners(lazy_nft, alice):
+    lazy_nft.mint_range(alice, 0, AMOUNT)
+
+    with boa.env.prank(alice):
+        lazy_nft.burn(10)
+
+    with boa.reverts():
+        lazy_nft.ownerOf(10)
+
+    for token_id in range(AMOUNT):
+        if token_id != 10:
+            assert lazy_nft.ownerOf(token_id) == alice
+    assert lazy_nft.balanceOf(alice) == AMOUNT - 1
+
+    with boa.env.prank(alice):
+        with boa.reverts():
+            lazy_nft.transferFrom(alice, alice, 10)
@@ -11,10 +11,11 @@ def setup(weth, vault, nft, owner, alchemist):
     nft.DEBUG_transferMinter(owner)
     nft.mint(owner, TOKEN_ID)
     vault.eval(
-        f"self.positions[0] = Position({{token_id: {TOKEN_ID}, amount_deposited: {1*10**18}, amount_claimed: 0, shares_owned: {1*10**18}, is_liquidated: False}})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {1*10**18}, amount_claimed: 0, shares_owned: {1*10**18}, is_liquidated: False}}))"
     )
     vault.eval(f"self.amount_claimable_per_share = 0")
     vault.eval(f"self.total_shares = {10*10**18}")
+    vault.eval("self.open_positions = 1")
     vault.eval(f"self._mark_as_claimable({1*10**18})")
     alchemist.eval(f"self.shares = {10*10**18}")
 
@@ -51,7 +52,7 @@ def test_cannot_claim_if_not_owner(vault, alice, nft):
 def test_claim_zero_if_liquidated(vault, owner, nft):
     assert nft.ownerOf(TOKEN_ID) == owner
     vault.eval(
-        f"self.positions[0] = Position({{token_id: {TOKEN_ID}, amount_deposited: {1*10**18}, amount_claimed: 0, shares_owned: 0, is_liquidated: True}})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {1*10**18}, amount_claimed: 0, shares_owned: 0, is_liquidated: True}}))"
     )
 
     to_claim = vault.eval(f"self.amount_claimable_per_share")
@@ -64,17 +65,17 @@ def test_claim_zero_if_liquidated(vault, owner, nft):
 def test_owner_can_liquidate(vault, nft, owner, alchemist):
     assert nft.ownerOf(TOKEN_ID) == owner
 
-    amount_deposited = vault.eval(f"self.positions[0].amount_deposited")
+    amount_deposited = vault.eval(f"self._load_position(0).amount_deposited")
     assert amount_deposited == 1 * 10**18
     alchemist.eval(f"self.total_value = { amount_deposited }")
     alchemist.eval(f"self.debt = { math.floor(amount_deposited / 2) }")
 
-    is_liquidated = vault.eval(f"self.positions[0].is_liquidated")
+    is_liquidated = vault.eval(f"self._load_position(0).is_liquidated")
     assert is_liquidated == False
 
     vault.liquidate(TOKEN_ID, 0)
 
-    is_liquidated = vault.eval(f"self.positions[0].is_liquidated")
+    is_liquidated = vault.eval(f"self._load_position(0).is_liquidated")
     assert is_liquidated == True
 
 
@@ -3,6 +3,7 @@ import pytest
 import boa
 
 AMOUNT = 123 * 10**18
+MIN_COLLATERALIZATION = 2 * 10**18  # hardcoded in MockAlchemist
 
 
 @pytest.fixture(autouse=True)
@@ -99,7 +100,7 @@ def test_withdraw_underlying_calls_alcx_withdraw(vault, alchemist):
 
 
 def test_amount_claimable_per_eth_is_set_correctly(vault):
-    cases = [[100, 100, 1000000000000000000], [100, 200, 2000000000000000000], [200, 300, 1500000000000000000]]
+    cases = [[100, 100, 10**36], [100, 200, 2 * 10**36], [200, 300, 15 * 10**35]]
 
     r = 0
     for c in cases:
@@ -116,7 +117,7 @@ def test_amount_claimable_per_eth_is_set_correctly(vault):
 
 def test_claimable_amount_for_token_is_calculated_correctly(vault):
     vault.eval(
-        f"self.positions[0] = Position({{token_id: 0, amount_deposited: {10**18}, amount_claimed: 0, shares_owned: {10**18}, is_liquidated: False}})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {10**18}, amount_claimed: 0, shares_owned: {10**18}, is_liquidated: False}}))"
     )
     vault.eval(f"self.total_shares = {100*10**18}")
     vault.internal._mark_as_claimable(10**18)
@@ -142,7 +143,7 @@ def test_claimable_amount_for_token_is_calculated_correctly(vault):
     assert amount == 10**15  # 0.001 ETH
 
     vault.eval(
-        f"self.positions[0] = Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: {50*10**18}, shares_owned: {100*10**18}, is_liquidated: False}})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: {50*10**18}, shares_owned: {100*10**18}, is_liquidated: False}}))"
     )
     vault.eval(f"self.amount_claimable_per_share = 0")
     vault.eval(f"self.total_shares = {100*10**18}")
@@ -155,7 +156,7 @@ def test_claimable_amount_for_token_is_calculated_correctly(vault):
 
 def test_claimable_amount_cannot_exceed_initial_deposit(vault):
     vault.eval(
-        f"self.positions[0] = Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: {100*10**18}, shares_owned: {100*10**18}, is_liquidated: False}})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: {100*10**18}, shares_owned: {100*10**18}, is_liquidated: False}}))"
     )
     vault.eval(f"self.amount_claimable_per_share = 0")
     vault.eval(f"self.total_shares = {100*10**18}")
@@ -168,7 +169,7 @@ def test_claimable_amount_cannot_exceed_initial_deposit(vault):
 
 def test_claimable_amount_for_invalid_token_is_zero(vault):
     vault.eval(
-        f"self.positions[0] = Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: 0, shares_owned: 0, is_liquidated: False}})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: 0, shares_owned: 0, is_liquidated: False}}))"
     )
     vault.eval(f"self.amount_claimable_per_share = 0")
     vault.eval(f"self.total_shares = {100*10**18}")
@@ -181,7 +182,7 @@ def test_claimable_amount_for_invalid_token_is_zero(vault):
 
 def test_claimable_amount_for_liquidated_token_is_zero(vault):
     vault.eval(
-        f"self.positions[0] = Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: 0, shares_owned: 0, is_liquidated: True}})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: 0, shares_owned: 0, is_liquidated: True}}))"
     )
     vault.eval(f"self.amount_claimable_per_share = 0")
     vault.eval(f"self.total_shares = {100*10**18}")
@@ -196,11 +197,11 @@ def test_calculate_mintable_amount(vault, alchemist):
     shares = 10 * 10**18
     alchemist.eval(f"self.total_value = {shares}")  # 10 ETH
 
-    mintable_amount = vault.internal._calculate_mintable_amount(0)
+    mintable_amount = vault.internal._calculate_mintable_amount(0, MIN_COLLATERALIZATION)
     assert mintable_amount == 0
 
     alchemist.eval(f"self.debt = {0}")
-    mintable_amount = vault.internal._calculate_mintable_amount(shares)
+    mintable_amount = vault.internal._calculate_mintable_amount(shares, MIN_COLLATERALIZATION)
     assert mintable_amount == 5 * 10**18 - 1
 
 
@@ -208,19 +209,19 @@ def test_max_mintable_amount_is_calculated_correctly(vault, alchemist):
     alchemist.eval(f"self.total_value = {10 * 10**18}")  # 10 ETH
 
     alchemist.eval(f"self.debt = {0}")
-    max_mintable = vault.internal._calculate_max_mintable_amount()
+    max_mintable = vault.internal._calculate_max_mintable_amount(MIN_COLLATERALIZATION)
     assert max_mintable == 5 * 10**18 - 1
 
     alchemist.eval(f"self.debt = {5 * 10**18}")
-    max_mintable = vault.internal._calculate_max_mintable_amount()
+    max_mintable = vault.internal._calculate_max_mintable_amount(MIN_COLLATERALIZATION)
     assert max_mintable == 0
 
     alchemist.eval(f"self.debt = {1 * 10**18}")
-    max_mintable = vault.internal._calculate_max_mintable_amount()
+    max_mintable = vault.internal._calculate_max_mintable_amount(MIN_COLLATERALIZATION)
     assert max_mintable == 4 * 10**18 - 1
 
     alchemist.eval(f"self.debt = {1 * 10**18 + 1}")
-    max_mintable = vault.internal._calculate_max_mintable_amount()
+    max_mintable = vault.internal._calculate_max_mintable_amount(MIN_COLLATERALIZATION)
     assert max_mintable == 4 * 10**18 - 2
 
 
@@ -229,12 +230,12 @@ def test_calculate_amount_to_mint(vault, alchemist):
     alchemist.eval(f"self.total_value = {100 * 10**18}")  # 10 ETH
 
     expected_mintable_by_shares = 2 * 10**18 - 1
-    mintable_amount = vault.internal._calculate_mintable_amount(shares)
+    mintable_amount = vault.internal._calculate_mintable_amount(shares, MIN_COLLATERALIZATION)
     assert mintable_amount == expected_mintable_by_shares
 
     alchemist.eval(f"self.debt = 0")
     expected_mintable_by_max = 50 * 10**18 - 1
-    max_mintable = vault.internal._calculate_max_mintable_amount()
+    max_mintable = vault.internal._calculate_max_mintable_amount(MIN_COLLATERALIZATION)
     assert max_mintable == expected_mintable_by_max
 
     amount_to_mint = vault.internal._calculate_amount_to_mint(shares)
@@ -242,8 +243,42 @@ def test_calculate_amount_to_mint(vault, alchemist):
 
     alchemist.eval(f"self.debt = {49 * 10**18}")
     expected_mintable_by_max = 1 * 10**18 - 1
-    max_mintable = vault.internal._calculate_max_mintable_amount()
+    max_mintable = vault.internal._calculate_max_mintable_amount(MIN_COLLATERALIZATION)
     assert max_mintable == expected_mintable_by_max
 
     amount_to_mint = vault.internal._calculate_amount_to_mint(shares)
     assert amount_to_mint == expected_mintable_by_max
+
+
+def test_operator_can_enable_min_collateralization_cache(vault):
+    assert vault.cached_min_collateralization() == 0
+
+    vault.set_min_collateralization_cache(True)
+    assert vault.cached_min_collateralization() == MIN_COLLATERALIZATION
+
+    vault.set_min_collateralization_cache(False)
+    assert vault.cached_min_collateralization() == 0
+
+
+def test_non_operator_cannot_set_min_collateralization_cache(vault, alice):
+    with boa.env.prank(alice):
+        with boa.reverts("unauthorized"):
+            vault.set_min_collateralization_cache(True)
+
+
+def test_setting_alchemist_clears_min_collateralization_cache(vault, alchemist):
+    vault.set_min_collateralization_cache(True)
+
+    vault.set_alchemist(pytest.WETH)
+
+    assert vault.cached_min_collateralization() == 0
+
+
+def test_cached_min_collateralization_is_used(vault, alchemist):
+    shares = 10 * 10**18
+    alchemist.eval(f"self.total_value = {100 * 10**18}")
+
+    vault.eval(f"self.cached_min_collateralization = {4 * 10**18}")
+
+    assert vault.eval("self._min_collateralization()") == 4 * 10**18
+    assert vault.eval(f"self._calculate_amount_to_mint({shares})") == shares // 4 - 1
@@ -0,0 +1,70 @@
+import pytest
+import boa
+
+TOKEN_IDS = [0, 1, 2, 3, 4, 5, 6, 7]
+
+
+@pytest.fixture(autouse=True)
+def setup(weth, vault, nft, owner, alchemist):
+    weth.transfer(vault, 1 * 10**18)
+    nft.DEBUG_transferMinter(owner)
+    for token_id in TOKEN_IDS:
+        nft.mint(owner, token_id)
+        vault.eval(
+            f"self._store_position(Position({{token_id: {token_id}, amount_deposited: {1*10**18}, amount_claimed: 0, shares_owned: {1*10**18}, is_liquidated: False}}))"
+        )
+    vault.eval(f"self.amount_claimable_per_share = 0")
+    vault.eval(f"self.total_shares = {10*10**18}")
+    vault.eval(f"self._mark_as_claimable({1*10**18})")
+    alchemist.eval(f"self.shares = {10*10**18}")
+
+
+def test_claim_many_transfers_sum_of_claimable(vault, weth, owner):
+    expected = sum(vault.claimable_for_token(t) for t in TOKEN_IDS)
+    assert expected == len(TOKEN_IDS) * 10**17
+
+    balance_before = weth.balanceOf(owner)
+    amount = vault.claim_many(TOKEN_IDS)
+    balance_after = weth.balanceOf(owner)
+
+    assert amount == expected
+    assert balance_after == balance_before + expected
+
+
+def test_claim_many_records_claimed_amount_per_token(vault):
+    claimed_amount_index = 2
+    expected = [vault.claimable_for_token(t) for t in TOKEN_IDS]
+
+    vault.claim_many(TOKEN_IDS)
+
+    for token_id, amount in zip(TOKEN_IDS, expected):
+        assert vault.positions(token_id)[claimed_amount_index] == amount
+        assert vault.claimable_for_token(token_id) == 0
+
+
+def test_claim_many_twice_transfers_nothing(vault, weth, owner):
+    vault.claim_many(TOKEN_IDS)
+
+    balance_before = weth.balanceOf(owner)
+    amount = vault.claim_many(TOKEN_IDS)
+    balance_after = weth.balanceOf(owner)
+
+    assert amount == 0
+    assert balance_after == balance_before
+
+
+def test_claim_many_skips_liquidated_positions(vault):
+    vault.eval(
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {1*10**18}, amount_claimed: 0, shares_owned: {1*10**18}, is_liquidated: True}}))"
+    )
+
+    amount = vault.claim_many(TOKEN_IDS)
+
+    assert amount == (len(TOKEN_IDS) - 1) * 10**17
+
+
+def test_cannot_claim_many_if_not_owner_of_all(vault, nft, owner, alice):
+    nft.transferFrom(owner, alice, TOKEN_IDS[-1])
+
+    with boa.reverts("only token owner can claim"):
+        vault.claim_many(TOKEN_IDS)
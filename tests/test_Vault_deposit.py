@@ -35,7 +35,7 @@ def test_register_initializes_position_correctly(vault, nft, owner, alchemist):
     nft.mint(owner, EXISTING_TOKEN_ID)
     alchemist.eval(f"self.total_value = {AMOUNT}")
     before = vault.positions(EXISTING_TOKEN_ID)
-    assert before == (0, 0, 0, 0, 0)
+    assert before == (0, 0, 0, 0, False)
 
     vault.register_deposit(EXISTING_TOKEN_ID, AMOUNT)
 
@@ -108,7 +108,7 @@ def test_non_depositor_cannot_call_deposit(vault, alice, nft, owner):
             vault.register_deposit(EXISTING_TOKEN_ID, AMOUNT)
 
 
-def test_amount_claimable_per_share_is_adjusted_on_new_deposits(vault, alice, owner, nft, alchemist, weth):
+def test_amount_claimable_per_share_is_unchanged_on_new_deposits(vault, alice, owner, nft, alchemist, weth):
     alchemist.eval(f"self.total_value = {2*AMOUNT}")
     alchemist.eval(f"self.debt = 0")
 
@@ -122,7 +122,7 @@ def test_amount_claimable_per_share_is_adjusted_on_new_deposits(vault, alice, ow
     total_shares_before = vault.total_shares()
 
     weth.transfer(vault.address, 10 * 10**18)
-    vault.internal._mark_as_claimable(10 * 10**18)
+    vault.eval(f"self._mark_as_claimable({10 * 10**18})")
 
     claimable_before = vault.amount_claimable_per_share() 
 
@@ -135,4 +135,7 @@ def test_amount_claimable_per_share_is_adjusted_on_new_deposits(vault, alice, ow
 
     assert total_shares_after == total_shares_before * 2
 
-    assert claimable_after == claimable_before / 2
\ No newline at end of file
+    assert claimable_after == claimable_before
+    # the claimable amount of a position is rounded down
+    assert vault.claimable_for_token(EXISTING_TOKEN_ID) == 10 * 10**18 - 1
+    assert vault.claimable_for_token(EXISTING_TOKEN_ID+1) == 0
\ No newline at end of file
@@ -0,0 +1,94 @@
+import pytest
+import boa
+
+TOKEN_IDS = [0, 1, 2, 3, 4, 5, 6, 7]
+AMOUNTS = [(i + 1) * 10**18 for i in range(len(TOKEN_IDS))]
+TOTAL = sum(AMOUNTS)
+
+
+@pytest.fixture(autouse=True)
+def approve_and_mint(weth, vault, nft, owner, alchemist):
+    weth.approve(vault, 2 * TOTAL)
+    vault.add_depositor(owner)
+    nft.DEBUG_transferMinter(owner)
+    for token_id in TOKEN_IDS:
+        nft.mint(owner, token_id)
+    alchemist.eval(f"self.total_value = {2 * TOTAL}")
+
+
+def test_register_deposits_pulls_weth_once(vault, weth, owner, alchemist):
+    caller_balance_before = weth.balanceOf(owner)
+    vault_balance_before = weth.balanceOf(vault)
+
+    vault.register_deposits(TOKEN_IDS, AMOUNTS)
+
+    assert weth.balanceOf(owner) == caller_balance_before - TOTAL
+    assert weth.balanceOf(vault) == vault_balance_before + TOTAL
+    assert alchemist.du_amount() == TOTAL
+
+
+def test_register_deposits_initializes_positions_pro_rata(vault):
+    vault.register_deposits(TOKEN_IDS, AMOUNTS)
+
+    for token_id, amount in zip(TOKEN_IDS, AMOUNTS):
+        assert vault.positions(token_id) == (token_id, amount, 0, amount, False)
+
+    assert vault.total_shares() == TOTAL
+
+
+def test_register_deposits_mints_debt_once(vault, alchemist):
+    expected = vault.eval(f"self._calculate_amount_to_mint({TOTAL})")
+    assert expected > 0
+
+    vault.register_deposits(TOKEN_IDS, AMOUNTS)
+
+    assert alchemist.mint_amount() == expected
+    assert alchemist.mint_recipient() == vault.fund_receiver()
+
+
+def test_register_deposits_keeps_amount_claimable_per_share(vault, weth):
+    vault.register_deposits(TOKEN_IDS[:4], AMOUNTS[:4])
+
+    weth.transfer(vault.address, 10 * 10**18)
+    vault.eval(f"self._mark_as_claimable({10 * 10**18})")
+
+    claimable_before = vault.amount_claimable_per_share()
+    token_claimable_before = [vault.claimable_for_token(t) for t in TOKEN_IDS[:4]]
+    assert claimable_before > 0
+
+    vault.register_deposits(TOKEN_IDS[4:], AMOUNTS[4:])
+
+    assert vault.total_shares() == TOTAL
+    assert vault.amount_claimable_per_share() == claimable_before
+    assert [vault.claimable_for_token(t) for t in TOKEN_IDS[:4]] == token_claimable_before
+    assert [vault.claimable_for_token(t) for t in TOKEN_IDS[4:]] == [0] * len(TOKEN_IDS[4:])
+
+
+def test_register_deposits_only_once_per_token(vault):
+    vault.register_deposit(TOKEN_IDS[3], AMOUNTS[3])
+
+    with boa.reverts("can only deposit once per token"):
+        vault.register_deposits(TOKEN_IDS, AMOUNTS)
+
+    with boa.reverts("can only deposit once per token"):
+        vault.register_deposits([0, 1, 0], [10**18, 10**18, 10**18])
+
+
+def test_register_deposits_validates_input(vault, owner):
+    with boa.reverts("length mismatch"):
+        vault.register_deposits(TOKEN_IDS, AMOUNTS[1:])
+
+    with boa.reverts("nothing to deposit"):
+        vault.register_deposits([], [])
+
+    with boa.reverts("cannot deposit zero"):
+        vault.register_deposits([0, 1], [10**18, 0])
+
+    with boa.reverts():
+        vault.register_deposits([0, 999], [10**18, 10**18])
+
+
+def test_non_depositor_cannot_register_deposits(vault, alice):
+    with boa.env.prank(alice):
+        with boa.reverts("not allowed"):
+            vault.register_deposits(TOKEN_IDS, AMOUNTS)
@@ -0,0 +1,105 @@
+import pytest
+import boa
+
+CLAIMABLE_PRECISION = 10**36
+TOKEN_IDS = [0, 1, 2]
+AMOUNT = 10**18
+
+
+@pytest.fixture(autouse=True)
+def approve_and_mint(weth, vault, nft, owner, alchemist):
+    weth.approve(vault, len(TOKEN_IDS) * AMOUNT)
+    vault.add_depositor(owner)
+    nft.DEBUG_transferMinter(owner)
+    for token_id in TOKEN_IDS:
+        nft.mint(owner, token_id)
+    alchemist.eval(f"self.total_value = {10 * AMOUNT}")
+
+
+def test_small_distribution_is_claimable_by_many_shares(vault, weth):
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+    vault.eval(f"self.total_shares = {1000 * AMOUNT}")
+
+    # less than one wei per 10**18 shares
+    weth.transfer(vault, 999)
+    vault.withdraw_underlying_to_claim(0, 999)
+
+    assert vault.claimable_for_token(TOKEN_IDS[0]) == 0  # 0.999 wei
+    vault.eval(f"self.total_shares = {10 * AMOUNT}")
+    weth.transfer(vault, 999)
+    vault.withdraw_underlying_to_claim(0, 999)
+
+    assert vault.amount_claimable_per_share() > 0
+    assert vault.claimable_for_token(TOKEN_IDS[0]) == 100  # 0.999 + 99.9 wei
+
+
+def deposit(vault, weth, alchemist, token_ids):
+    for token_id in token_ids:
+        vault.register_deposit(token_id, AMOUNT)
+
+    # the mock keeps neither the deposited WETH nor the shares, do it in
+    # its place
+    alchemist.eval(f"self.shares = {len(token_ids) * AMOUNT}")
+    with boa.env.prank(vault.address):
+        weth.transfer(alchemist, len(token_ids) * AMOUNT)
+
+
+def distribute(vault, weth, amount):
+    weth.transfer(vault, amount)
+    vault.withdraw_underlying_to_claim(0, amount)
+
+
+def test_nothing_to_sweep_while_positions_can_claim(vault, weth, alchemist, owner):
+    deposit(vault, weth, alchemist, TOKEN_IDS)
+    distribute(vault, weth, AMOUNT)
+    balance_before = weth.balanceOf(owner)
+
+    assert vault.sweepable_dust() == 0
+    assert vault.sweep_dust() == 0
+    assert weth.balanceOf(owner) == balance_before
+
+
+def test_sweep_dust_sends_weth_sent_directly(vault, weth, alchemist, alice):
+    vault.set_fund_receiver(alice)
+    deposit(vault, weth, alchemist, TOKEN_IDS[:1])
+    distribute(vault, weth, AMOUNT)
+    weth.transfer(vault, 5)
+    balance_before = weth.balanceOf(alice)
+
+    # a wei is kept back for the open position
+    assert vault.sweepable_dust() == 4
+    assert vault.sweep_dust() == 4
+
+    assert weth.balanceOf(alice) == balance_before + 4
+    assert vault.claim(TOKEN_IDS[0]) == AMOUNT
+
+
+def test_rounding_left_by_liquidated_positions_is_swept(vault, weth, alchemist, owner):
+    deposit(vault, weth, alchemist, TOKEN_IDS)
+    alchemist.eval(f"self.debt = {AMOUNT}")
+    distribute(vault, weth, 10)
+
+    # each of the three positions earned 3.33 wei and claims 3 on
+    # liquidation, the remaining wei can't be claimed by any token
+    for token_id in TOKEN_IDS:
+        vault.liquidate(token_id, 0)
+    balance_before = weth.balanceOf(owner)
+
+    assert weth.balanceOf(vault) == 1
+    assert vault.sweep_dust() == 1
+    assert weth.balanceOf(owner) == balance_before + 1
+    assert weth.balanceOf(vault) == 0
+
+
+def test_sweep_dust_keeps_what_open_positions_can_claim(vault, weth, alchemist):
+    deposit(vault, weth, alchemist, TOKEN_IDS)
+    alchemist.eval(f"self.debt = {AMOUNT}")
+    distribute(vault, weth, 10)
+    vault.liquidate(TOKEN_IDS[0], 0)
+
+    vault.sweep_dust()
+
+    assert weth.balanceOf(vault) >= vault.claimable_for_token(TOKEN_IDS[1]) + vault.claimable_for_token(
+        TOKEN_IDS[2]
+    )
+    assert vault.claim_many(TOKEN_IDS[1:]) == 6
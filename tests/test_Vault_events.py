@@ -1,6 +1,10 @@
 import pytest
 import math
 
+from vyper.compiler.output import build_abi_output
+
+from conftest import raw_topics
+
 AMOUNT = 100 * 10**18
 
 TOKEN_ID = 0
@@ -136,3 +140,21 @@ def test_remove_depositor_emits_event(vault, owner, alice):
 
     vault.remove_depositor(alice)
     assert emitted(vault, "DepositorRemoved", alice, owner)
+
+
+@pytest.mark.parametrize("event", ["Deposit", "Liquidated", "Claimed", "PositionImported"])
+def test_token_id_is_indexed(vault, event):
+    abi = build_abi_output(vault.compiler_data)
+    (event_abi,) = [e for e in abi if e["type"] == "event" and e["name"] == event]
+    inputs = {i["name"]: i["indexed"] for i in event_abi["inputs"]}
+
+    assert inputs["token_id"]
+
+
+def test_deposit_can_be_filtered_by_token_id(vault, owner, alchemist):
+    # the setup fixture of this file replaces the session wide one
+    vault.eval(f"self.alchemist = {alchemist.address}")
+    vault.register_deposit(TOKEN_ID, AMOUNT)
+
+    topics = raw_topics(vault, "Deposit(address,uint256,uint256)")
+    assert topics[2] == TOKEN_ID
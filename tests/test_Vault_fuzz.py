@@ -0,0 +1,195 @@
+from fractions import Fraction
+
+import pytest
+import boa
+from hypothesis import strategies as st
+from hypothesis.stateful import (
+    RuleBasedStateMachine,
+    invariant,
+    precondition,
+    rule,
+    run_state_machine_as_test,
+)
+
+CLAIMABLE_PRECISION = 10**36
+TOKEN_IDS = list(range(40))
+HOLDERS = [f"0x{0xF022 + i:040x}" for i in range(4)]
+
+# keeps the mock alchemist at a collateralisation of 10, so deposits can
+# always mint and liquidations always have debt to repay
+TOTAL_VALUE = 10**30
+DEBT = 10**29
+
+amounts = st.integers(min_value=10**3, max_value=10 * 10**18)
+
+
+class VaultAccounting(RuleBasedStateMachine):
+    """
+    Interleaves deposits, distributions, claims and liquidations on the
+    vault and tracks the WETH that was made claimable and the WETH that
+    was claimed.
+    """
+
+    vault = None
+    alchemist = None
+    weth = None
+
+    def __init__(self):
+        super().__init__()
+        # every example starts from the same deployed state and is rolled
+        # back afterwards instead of redeploying
+        self.anchor = boa.env.anchor()
+        self.anchor.__enter__()
+
+        self.undeposited = list(TOKEN_IDS)
+        self.deposited = []
+        self.liquidated = []
+
+        self.total_withdrawn = 0
+        # the exact WETH each token is entitled to by its shares
+        self.entitled = {}
+        # the exact amount_claimable_per_share and the number of roundings
+        # the contract did to it
+        self.exact_acps = Fraction(0)
+        self.roundings = 0
+
+    def teardown(self):
+        self.anchor.__exit__(None, None, None)
+
+    def _deposited(self, token_ids):
+        for token_id in token_ids:
+            self.undeposited.remove(token_id)
+            self.deposited.append(token_id)
+            self.entitled[token_id] = Fraction(0)
+
+        # the mock does not track deposits, give the vault its shares and
+        # take the deposited WETH
+        self.alchemist.eval("self.shares += self.du_amount")
+        with boa.env.prank(self.vault.address):
+            self.weth.transfer(self.alchemist, self.alchemist.du_amount())
+
+    def _owner_of(self, token_id):
+        return HOLDERS[token_id % len(HOLDERS)]
+
+    @precondition(lambda self: self.undeposited)
+    @rule(data=st.data(), amount=amounts)
+    def register_deposit(self, data, amount):
+        token_id = data.draw(st.sampled_from(self.undeposited))
+        acps = self.vault.amount_claimable_per_share()
+        self.vault.register_deposit(token_id, amount)
+
+        assert self.vault.amount_claimable_per_share() == acps
+        assert self.vault.claimable_for_token(token_id) == 0
+        self._deposited([token_id])
+
+    @precondition(lambda self: len(self.undeposited) > 1)
+    @rule(data=st.data())
+    def register_deposits(self, data):
+        token_ids = data.draw(
+            st.lists(st.sampled_from(self.undeposited), min_size=1, max_size=5, unique=True)
+        )
+        batch_amounts = data.draw(st.lists(amounts, min_size=len(token_ids), max_size=len(token_ids)))
+        acps = self.vault.amount_claimable_per_share()
+        self.vault.register_deposits(token_ids, batch_amounts)
+
+        assert self.vault.amount_claimable_per_share() == acps
+        self._deposited(token_ids)
+
+    @precondition(lambda self: self.vault.total_shares() > 0)
+    @rule(fraction=st.integers(min_value=1, max_value=10_000))
+    def withdraw_underlying_to_claim(self, fraction):
+        amount = self.alchemist.shares() * fraction // 10_000
+        if amount == 0:
+            return
+
+        # the mock returns the weth without sending it, send it in its place
+        self.weth.transfer(self.vault, amount)
+        self.vault.withdraw_underlying_to_claim(amount, amount)
+
+        total_shares = self.vault.total_shares()
+        self.exact_acps += Fraction(amount * CLAIMABLE_PRECISION, total_shares)
+        self.roundings += 1
+        self.total_withdrawn += amount
+        for token_id in self.deposited:
+            shares = self.vault.positions(token_id)[3]
+            self.entitled[token_id] += Fraction(amount * shares, total_shares)
+
+    @precondition(lambda self: self.deposited)
+    @rule(data=st.data())
+    def claim(self, data):
+        token_id = data.draw(st.sampled_from(self.deposited + self.liquidated))
+        expected = self.vault.claimable_for_token(token_id)
+
+        with boa.env.prank(self._owner_of(token_id)):
+            assert self.vault.claim(token_id) == expected
+
+        assert self.vault.claimable_for_token(token_id) == 0
+
+    @precondition(lambda self: self.deposited)
+    @rule(data=st.data())
+    def liquidate(self, data):
+        token_id = data.draw(st.sampled_from(self.deposited))
+        with boa.env.prank(self._owner_of(token_id)):
+            self.vault.liquidate(token_id, 0)
+
+        self.deposited.remove(token_id)
+        self.liquidated.append(token_id)
+
+    @rule()
+    def sweep_dust(self):
+        dust = self.vault.sweepable_dust()
+        assert self.vault.sweep_dust() == dust
+        assert self.vault.sweepable_dust() == 0
+
+        # a wei per open position is kept back, up to another one is
+        # lost to rounding each position's claimable amount down
+        locked = self.weth.balanceOf(self.vault) - self._claimable()
+        assert locked <= 2 * len(self.deposited)
+
+    def _claimable(self):
+        return sum(self.vault.claimable_for_token(t) for t in self.deposited + self.liquidated)
+
+    @invariant()
+    def claimable_per_share_rounding_loss_is_bounded(self):
+        # every distribution rounds amount_claimable_per_share down by
+        # less than one unit
+        loss = self.exact_acps - self.vault.amount_claimable_per_share()
+        assert 0 <= loss < max(self.roundings, 1)
+
+    @invariant()
+    def claimable_weth_is_never_swept(self):
+        assert self.weth.balanceOf(self.vault) - self.vault.sweepable_dust() >= self._claimable()
+
+    @invariant()
+    def tokens_get_what_their_shares_earned(self):
+        # rounding the per share value, the initial reward debt and the
+        # claimable amount each lose less than one wei
+        for token_id in self.deposited + self.liquidated:
+            amount_claimed = self.vault.positions(token_id)[2]
+            received = amount_claimed + self.vault.claimable_for_token(token_id)
+            assert 0 <= self.entitled[token_id] - received < 3
+
+    @invariant()
+    def claims_never_exceed_withdrawn_weth(self):
+        total_claimed = sum(self.weth.balanceOf(holder) for holder in HOLDERS)
+        assert total_claimed <= self.total_withdrawn
+
+
+@pytest.fixture()
+def fuzz_setup(vault, alchemist, weth, nft, owner):
+    vault.add_depositor(owner)
+    weth.approve(vault, 2**256 - 1)
+    nft.DEBUG_transferMinter(owner)
+    for token_id in TOKEN_IDS:
+        nft.mint(HOLDERS[token_id % len(HOLDERS)], token_id)
+
+    alchemist.eval(f"self.total_value = {TOTAL_VALUE}")
+    alchemist.eval(f"self.debt = {DEBT}")
+
+    VaultAccounting.vault = vault
+    VaultAccounting.alchemist = alchemist
+    VaultAccounting.weth = weth
+
+
+def test_vault_accounting(fuzz_setup):
+    run_state_machine_as_test(VaultAccounting)
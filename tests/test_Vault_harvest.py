@@ -0,0 +1,110 @@
+import pytest
+import boa
+
+SHARES = 100 * 10**18
+MIN_COLLATERALIZATION = 2 * 10**18  # hardcoded in MockAlchemist
+HARVEST_BUFFER_BPS = 10
+
+
+@pytest.fixture(autouse=True)
+def alchemix_position(vault, weth, alchemist):
+    weth.transfer(vault, SHARES)
+    vault.eval(f"self.total_shares = {SHARES}")
+    alchemist.eval(f"self.shares = {SHARES}")
+    alchemist.eval(f"self.total_value = {SHARES}")
+
+
+def test_unlocked_shares_leave_min_collateralization_and_buffer(vault, alchemist):
+    alchemist.eval(f"self.debt = {25 * 10**18}")
+
+    # 50.05 WETH of value keep the 25 WETH debt at 200% plus 0.1%
+    assert vault.harvest_buffer_bps() == HARVEST_BUFFER_BPS
+    assert vault.unlocked_shares() == SHARES - 5005 * 10**16
+
+
+def test_unlocked_shares_without_buffer(vault, alchemist):
+    alchemist.eval(f"self.debt = {25 * 10**18}")
+    vault.set_harvest_buffer(0)
+
+    # 50 WETH of value keep the 25 WETH debt at 200%
+    assert vault.unlocked_shares() == SHARES // 2
+
+
+def test_unlocked_shares_scale_with_share_value(vault, alchemist):
+    alchemist.eval(f"self.total_value = {2 * SHARES}")
+    alchemist.eval(f"self.debt = {25 * 10**18}")
+
+    assert vault.unlocked_shares() == SHARES * (2 * SHARES - 5005 * 10**16) // (2 * SHARES)
+
+
+def test_unlocked_shares_without_debt(vault, alchemist):
+    alchemist.eval("self.debt = 0")
+    assert vault.unlocked_shares() == SHARES
+
+    alchemist.eval(f"self.debt = {-10**18}")
+    assert vault.unlocked_shares() == SHARES
+
+
+def test_unlocked_shares_when_fully_locked(vault, alchemist):
+    alchemist.eval(f"self.debt = {SHARES // 2}")
+    assert vault.unlocked_shares() == 0
+
+    alchemist.eval(f"self.debt = {SHARES}")
+    assert vault.unlocked_shares() == 0
+
+
+def test_unlocked_shares_use_cached_min_collateralization(vault, alchemist):
+    alchemist.eval(f"self.debt = {25 * 10**18}")
+    vault.set_min_collateralization_cache(True)
+    vault.eval(f"self.cached_min_collateralization = {4 * 10**18}")
+
+    assert vault.unlocked_shares() == 0
+
+
+def test_harvest_withdraws_unlocked_shares(vault, alchemist):
+    alchemist.eval(f"self.debt = {25 * 10**18}")
+    min_out = 10 * 10**18
+
+    amount = vault.harvest(min_out)
+
+    assert amount == min_out  # the mock returns _min_amount_out
+    assert alchemist.wu_shares() == SHARES - 5005 * 10**16
+    assert alchemist.wu_recipient().lower() == vault.address.lower()
+    assert alchemist.wu_min_amount_out() == min_out
+    assert alchemist.shares() == 5005 * 10**16
+
+
+def test_harvest_makes_weth_claimable(vault, alchemist):
+    alchemist.eval(f"self.debt = {25 * 10**18}")
+
+    vault.harvest(10**18)
+
+    assert vault.amount_claimable_per_share() == 10**18 * 10**36 // SHARES
+
+
+def test_harvest_with_nothing_unlocked_reverts(vault, alchemist):
+    alchemist.eval(f"self.debt = {SHARES // 2}")
+
+    with boa.reverts("nothing to harvest"):
+        vault.harvest(0)
+
+
+def test_operator_can_set_harvest_buffer(vault, alchemist):
+    alchemist.eval(f"self.debt = {SHARES // 4}")
+
+    vault.set_harvest_buffer(10_000)
+
+    # twice the minimum collateralization
+    assert vault.harvest_buffer_bps() == 10_000
+    assert vault.unlocked_shares() == 0
+
+
+def test_non_operator_cannot_set_harvest_buffer(vault, alice):
+    with boa.env.prank(alice):
+        with boa.reverts("unauthorized"):
+            vault.set_harvest_buffer(0)
+
+
+def test_harvest_buffer_cannot_exceed_the_minimum(vault):
+    with boa.reverts("invalid harvest buffer"):
+        vault.set_harvest_buffer(10_001)
@@ -101,7 +101,7 @@ def test_cannot_liquidate_already_liquidated(vault, nft, owner):
     nft.DEBUG_transferMinter(owner)
     nft.mint(owner, 0)
     vault.eval(
-        f"self.positions[0] = Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: 0, shares_owned: {100*10**18}, is_liquidated: True }})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {100*10**18}, amount_claimed: 0, shares_owned: {100*10**18}, is_liquidated: True }}))"
     )
 
     with boa.reverts("position already liquidated"):
@@ -115,7 +115,7 @@ def test_liquidate_calls_claim(vault, alchemist, nft, owner, weth):
     alchemist.eval(f"self.total_value = {1000 * 10**18}")
     alchemist.eval(f"self.debt = {500 * 10**18}")
     vault.eval(
-        f"self.positions[0] = Position({{token_id: 0, amount_deposited: {1000*10**18}, amount_claimed: 0, shares_owned: {1000*10**18}, is_liquidated: False }})"
+        f"self._store_position(Position({{token_id: 0, amount_deposited: {1000*10**18}, amount_claimed: 0, shares_owned: {1000*10**18}, is_liquidated: False }}))"
     )
 
     vault.eval(f"self.amount_claimable_per_share = 0")
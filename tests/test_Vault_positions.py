@@ -0,0 +1,80 @@
+import pytest
+import boa
+
+TOKEN_ID = 0
+
+MAX_AMOUNT_DEPOSITED = 2**128 - 1
+MAX_AMOUNT_CLAIMED = 2**128 - 1
+MAX_SHARES_OWNED = 2**127 - 1
+
+
+def store_position(vault, amount_deposited, amount_claimed, shares_owned, is_liquidated):
+    vault.eval(
+        f"self._store_position(Position({{token_id: {TOKEN_ID}, amount_deposited: {amount_deposited}, amount_claimed: {amount_claimed}, shares_owned: {shares_owned}, is_liquidated: {is_liquidated}}}))"
+    )
+
+
+def test_position_round_trips_through_packed_storage(vault):
+    cases = [
+        (0, 0, 0, False),
+        (1, 2, 3, True),
+        (123 * 10**18, 45 * 10**18, 67 * 10**18, False),
+        (MAX_AMOUNT_DEPOSITED, MAX_AMOUNT_CLAIMED, MAX_SHARES_OWNED, True),
+        (MAX_AMOUNT_DEPOSITED, MAX_AMOUNT_CLAIMED, MAX_SHARES_OWNED, False),
+    ]
+
+    for c in cases:
+        store_position(vault, *c)
+        assert vault.positions(TOKEN_ID) == (TOKEN_ID, *c)
+
+
+def test_claim_data_uses_a_single_slot(vault):
+    store_position(vault, 10**18, 2 * 10**18, 3 * 10**18, True)
+
+    claim_data = vault.eval(f"self.packed_positions[{TOKEN_ID}].claim_data")
+
+    assert claim_data == 2 * 10**18 | (3 * 10**18 << 128) | (1 << 255)
+    # a stored position has no initial reward debt, all of it was claimed
+    assert vault.eval(f"self.packed_positions[{TOKEN_ID}].deposit_data") == 10**18
+
+
+def test_storing_amount_claimed_above_128_bits_reverts(vault):
+    with boa.reverts("reward debt overflow"):
+        store_position(vault, 0, MAX_AMOUNT_CLAIMED + 1, 0, False)
+
+
+def test_storing_amount_deposited_above_128_bits_reverts(vault):
+    with boa.reverts("amount deposited overflow"):
+        store_position(vault, MAX_AMOUNT_DEPOSITED + 1, 0, 0, False)
+
+
+def test_storing_shares_owned_above_127_bits_reverts(vault):
+    with boa.reverts("shares owned overflow"):
+        store_position(vault, 0, 0, MAX_SHARES_OWNED + 1, False)
+
+
+def test_positions_batch_returns_positions_and_claimable(vault, weth, alchemist):
+    token_ids = [0, 1, 2, 3]
+    for token_id in token_ids:
+        vault.eval(
+            f"self._store_position(Position({{token_id: {token_id}, amount_deposited: {(token_id + 1) * 10**18}, amount_claimed: 0, shares_owned: {(token_id + 1) * 10**18}, is_liquidated: {token_id == 3}}}))"
+        )
+    vault.eval(f"self.total_shares = {10 * 10**18}")
+    weth.transfer(vault, 10**18)
+    vault.eval(f"self._mark_as_claimable({10**18})")
+
+    summaries = vault.positions_batch(token_ids + [99])
+
+    assert len(summaries) == len(token_ids) + 1
+    for token_id, summary in zip(token_ids + [99], summaries):
+        assert summary[0] == token_id
+        assert tuple(summary[1:5]) == vault.positions(token_id)[1:]
+        assert summary[5] == vault.claimable_for_token(token_id)
+
+    assert summaries[1][5] == 2 * 10**17
+    assert summaries[3][5] == 0  # liquidated
+    assert summaries[4][1:] == (0, 0, 0, False, 0)  # no position
+
+
+def test_positions_batch_with_no_token_ids(vault):
+    assert len(vault.positions_batch([])) == 0
@@ -0,0 +1,177 @@
+import pytest
+import boa
+
+CLAIMABLE_PRECISION = 10**36
+TOKEN_IDS = [0, 1, 2]
+AMOUNT = 10**18
+
+
+@pytest.fixture(autouse=True)
+def approve_and_mint(weth, vault, nft, owner, alchemist):
+    weth.approve(vault, 10 * AMOUNT)
+    vault.add_depositor(owner)
+    nft.DEBUG_transferMinter(owner)
+    for token_id in TOKEN_IDS:
+        nft.mint(owner, token_id)
+    alchemist.eval(f"self.total_value = {10 * AMOUNT}")
+
+
+def distribute(vault, weth, amount):
+    weth.transfer(vault, amount)
+    vault.withdraw_underlying_to_claim(0, amount)
+
+
+def test_deposit_after_distribution_starts_with_reward_debt(vault, weth):
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+    distribute(vault, weth, AMOUNT // 2)
+
+    vault.register_deposit(TOKEN_IDS[1], 2 * AMOUNT)
+
+    assert vault.claimable_for_token(TOKEN_IDS[0]) == AMOUNT // 2
+    assert vault.claimable_for_token(TOKEN_IDS[1]) == 0
+    assert vault.positions(TOKEN_IDS[1]) == (TOKEN_IDS[1], 2 * AMOUNT, 0, 2 * AMOUNT, False)
+    assert vault.eval(f"self.packed_positions[{TOKEN_IDS[1]}].claim_data") & (2**128 - 1) == AMOUNT
+
+
+def test_later_distributions_are_split_by_shares(vault, weth):
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+    distribute(vault, weth, AMOUNT // 2)
+    vault.register_deposit(TOKEN_IDS[1], 2 * AMOUNT)
+
+    distribute(vault, weth, 3 * AMOUNT // 10)
+
+    assert vault.claimable_for_token(TOKEN_IDS[0]) == AMOUNT // 2 + AMOUNT // 10
+    assert vault.claimable_for_token(TOKEN_IDS[1]) == 2 * AMOUNT // 10
+
+
+def test_deposit_after_claim_cannot_claim_earlier_weth(vault, weth, owner):
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+    distribute(vault, weth, AMOUNT)
+    vault.claim(TOKEN_IDS[0])
+
+    vault.register_deposit(TOKEN_IDS[1], AMOUNT)
+    distribute(vault, weth, AMOUNT)
+    balance_before = weth.balanceOf(owner)
+
+    vault.claim_many(TOKEN_IDS[:2])
+
+    assert weth.balanceOf(owner) == balance_before + AMOUNT
+    assert vault.positions(TOKEN_IDS[0])[2] == AMOUNT + AMOUNT // 2
+    assert vault.positions(TOKEN_IDS[1])[2] == AMOUNT // 2
+
+
+def test_initial_reward_debt_is_rounded_up(vault, weth):
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+    vault.eval("self.total_shares = 3")
+    distribute(vault, weth, 1)
+    vault.register_deposit(TOKEN_IDS[1], AMOUNT)
+
+    # 1/3 wei per share was made claimable before token 1 was deposited
+    deposit_data = vault.eval(f"self.packed_positions[{TOKEN_IDS[1]}].deposit_data")
+    assert deposit_data >> 128 == AMOUNT // 3 + 1
+    assert vault.claimable_for_token(TOKEN_IDS[1]) == 0
+
+
+def position(token_id, amount_deposited, amount_claimed, shares_owned, is_liquidated=False):
+    return (token_id, amount_deposited, amount_claimed, shares_owned, is_liquidated)
+
+
+def move_shares(alchemist, shares):
+    alchemist.eval(f"self.shares = {shares}")
+
+
+def test_import_positions_keeps_claimable_of_old_vault(vault, weth, owner, alchemist):
+    acps = CLAIMABLE_PRECISION // 4
+    balance_before = weth.balanceOf(owner)
+    move_shares(alchemist, 3 * AMOUNT)
+
+    vault.import_positions(
+        [
+            position(TOKEN_IDS[0], AMOUNT, 0, AMOUNT),
+            position(TOKEN_IDS[1], 2 * AMOUNT, AMOUNT // 4, 2 * AMOUNT),
+            position(TOKEN_IDS[2], AMOUNT, 0, AMOUNT, True),
+        ],
+        acps,
+    )
+
+    assert vault.total_shares() == 3 * AMOUNT
+    assert vault.amount_claimable_per_share() == acps
+    assert vault.claimable_for_token(TOKEN_IDS[0]) == AMOUNT // 4
+    assert vault.claimable_for_token(TOKEN_IDS[1]) == AMOUNT // 4
+    assert vault.claimable_for_token(TOKEN_IDS[2]) == 0
+    assert vault.positions(TOKEN_IDS[1]) == position(TOKEN_IDS[1], 2 * AMOUNT, AMOUNT // 4, 2 * AMOUNT)
+    assert weth.balanceOf(owner) == balance_before - AMOUNT // 2
+
+
+def test_import_positions_only_by_migration_admin(vault, alice):
+    with boa.env.prank(alice):
+        with boa.reverts("unauthorized"):
+            vault.import_positions([position(TOKEN_IDS[0], AMOUNT, 0, AMOUNT)], 0)
+
+
+def test_import_positions_after_distribution_reverts(vault, weth, alchemist):
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+    distribute(vault, weth, AMOUNT)
+    move_shares(alchemist, 2 * AMOUNT)
+
+    with boa.reverts("vault not empty"):
+        vault.import_positions(
+            [position(TOKEN_IDS[1], AMOUNT, 0, AMOUNT)], vault.amount_claimable_per_share()
+        )
+
+
+def test_import_positions_after_deposit_reverts(vault, alchemist):
+    vault.register_deposit(TOKEN_IDS[0], AMOUNT)
+    move_shares(alchemist, 2 * AMOUNT)
+
+    with boa.reverts("vault not empty"):
+        vault.import_positions([position(TOKEN_IDS[1], AMOUNT, 0, AMOUNT)], 0)
+
+
+def test_import_positions_only_once(vault, alchemist):
+    move_shares(alchemist, 2 * AMOUNT)
+    vault.import_positions([position(TOKEN_IDS[0], AMOUNT, 0, AMOUNT)], CLAIMABLE_PRECISION // 2)
+
+    with boa.reverts("vault not empty"):
+        vault.import_positions(
+            [position(TOKEN_IDS[1], AMOUNT, 0, AMOUNT)], vault.amount_claimable_per_share()
+        )
+
+
+def test_import_positions_cannot_import_a_token_twice(vault, alchemist):
+    move_shares(alchemist, 2 * AMOUNT)
+
+    with boa.reverts("can only deposit once per token"):
+        vault.import_positions(
+            [position(TOKEN_IDS[0], AMOUNT, 0, AMOUNT), position(TOKEN_IDS[0], AMOUNT, 0, AMOUNT)], 0
+        )
+
+
+def test_import_positions_requires_the_shares(vault, alchemist):
+    move_shares(alchemist, AMOUNT - 1)
+
+    with boa.reverts("shares not moved to vault"):
+        vault.import_positions([position(TOKEN_IDS[0], AMOUNT, 0, AMOUNT)], 0)
+
+
+def test_import_positions_requires_shares_owned(vault):
+    with boa.reverts("no shares imported"):
+        vault.import_positions([position(TOKEN_IDS[0], AMOUNT, 0, 0)], 0)
+
+
+def test_imported_positions_share_later_distributions(vault, weth, alchemist):
+    move_shares(alchemist, AMOUNT)
+    vault.import_positions([position(TOKEN_IDS[0], AMOUNT, 0, AMOUNT)], CLAIMABLE_PRECISION // 2)
+    vault.register_deposit(TOKEN_IDS[1], AMOUNT)
+
+    distribute(vault, weth, AMOUNT)
+
+    assert vault.claimable_for_token(TOKEN_IDS[0]) == AMOUNT // 2 + AMOUNT // 2
+    assert vault.claimable_for_token(TOKEN_IDS[1]) == AMOUNT // 2
+
+
+def test_import_positions_cannot_claim_more_than_earned(vault, alchemist):
+    move_shares(alchemist, AMOUNT)
+
+    with boa.reverts("claimed more than earned"):
+        vault.import_positions([position(TOKEN_IDS[0], AMOUNT, AMOUNT // 2 + 1, AMOUNT)], CLAIMABLE_PRECISION // 2)
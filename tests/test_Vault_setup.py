@@ -7,9 +7,9 @@ INVALID_ADDRESS = pytest.ZERO_ADDRESS
 VALID_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
 
 
-def test_cannot_deploy_with_invalid_nft_address():
+def test_cannot_deploy_with_invalid_nft_address(load_partial):
     with pytest.raises(eth.exceptions.Revert):
-        boa.load("contracts/Vault.vy", INVALID_ADDRESS)
+        load_partial("contracts/Vault.vy").deploy(INVALID_ADDRESS)
 
 
 def test_deployment_sets_nft_address(vault, nft):
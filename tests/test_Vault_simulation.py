@@ -0,0 +1,157 @@
+import pytest
+import boa
+
+BLOCKS_PER_MONTH = 30 * 24 * 60 * 60 // 12
+MIN_COLLATERALIZATION = 2 * 10**18
+
+HOLDERS = [f"0x{0xF022 + i:040x}" for i in range(4)]
+TOKENS_PER_HOLDER = 250
+
+
+def mine(blocks):
+    boa.env.vm.patch.block_number += blocks
+
+
+def debt(alchemist, account):
+    return alchemist.accounts(account)[0]
+
+
+@pytest.fixture()
+def deposited(yield_alchemist, weth, owner):
+    """
+    100 WETH deposited by the owner with 25 WETH of debt.
+    """
+    weth.approve(yield_alchemist, 100 * 10**18)
+    yield_alchemist.depositUnderlying(pytest.ALCX_YIELD_TOKEN, 100 * 10**18, owner, 1)
+    yield_alchemist.mint(25 * 10**18, owner)
+
+
+def test_yield_repays_debt(yield_alchemist, deposited, owner):
+    shares, _ = yield_alchemist.positions(owner, pytest.ALCX_YIELD_TOKEN)
+    price = yield_alchemist.getUnderlyingTokensPerShare(pytest.ALCX_YIELD_TOKEN)
+
+    mine(BLOCKS_PER_MONTH)
+
+    new_price = yield_alchemist.getUnderlyingTokensPerShare(pytest.ALCX_YIELD_TOKEN)
+    assert new_price == price + BLOCKS_PER_MONTH * yield_alchemist.yield_per_block()
+
+    earned = shares * (new_price - price) // 10**18
+    assert debt(yield_alchemist, owner) == 25 * 10**18 - earned
+    # the yield is spent on the debt, the collateral keeps its value
+    assert abs(yield_alchemist.totalValue(owner) - 100 * 10**18) <= 1
+
+
+def test_yield_past_debt_becomes_credit(yield_alchemist, deposited, owner):
+    yield_alchemist.set_yield_per_block(10**18 // BLOCKS_PER_MONTH)
+    mine(BLOCKS_PER_MONTH)
+
+    assert debt(yield_alchemist, owner) < 0
+
+
+def test_mint_checks_collateralization(yield_alchemist, deposited, owner):
+    yield_alchemist.mint(25 * 10**18, owner)
+
+    with boa.reverts("undercollateralized"):
+        yield_alchemist.mint(1, owner)
+
+
+def test_withdraw_checks_collateralization(yield_alchemist, deposited, weth, owner):
+    # 50 WETH of value keep the 25 WETH debt at 200%
+    shares = yield_alchemist.convertUnderlyingTokensToShares(pytest.ALCX_YIELD_TOKEN, 50 * 10**18)
+
+    with boa.reverts("undercollateralized"):
+        yield_alchemist.withdrawUnderlying(pytest.ALCX_YIELD_TOKEN, shares + 1, owner, 1)
+
+    balance = weth.balanceOf(owner)
+    amount = yield_alchemist.withdrawUnderlying(pytest.ALCX_YIELD_TOKEN, shares, owner, 1)
+    assert weth.balanceOf(owner) == balance + amount
+
+
+def test_liquidate_is_capped_at_debt(yield_alchemist, deposited, owner):
+    shares, _ = yield_alchemist.positions(owner, pytest.ALCX_YIELD_TOKEN)
+
+    liquidated = yield_alchemist.liquidate(pytest.ALCX_YIELD_TOKEN, shares, 1)
+
+    assert liquidated == yield_alchemist.convertUnderlyingTokensToShares(pytest.ALCX_YIELD_TOKEN, 25 * 10**18)
+    assert 0 <= debt(yield_alchemist, owner) <= 1
+
+
+@pytest.fixture()
+def thousand_positions(vault, yield_alchemist, nft, weth, owner):
+    vault.set_alchemist(yield_alchemist)
+    vault.add_depositor(owner)
+    weth.approve(vault, 2**256 - 1)
+    nft.DEBUG_transferMinter(owner)
+
+    for i, holder in enumerate(HOLDERS):
+        token_ids = list(range(i * TOKENS_PER_HOLDER, (i + 1) * TOKENS_PER_HOLDER))
+        nft.mint_batch(holder, token_ids)
+        vault.register_deposits(token_ids, [10**18 + token_id * 10**15 for token_id in token_ids])
+
+    # the vault's shares are worth slightly more than deposited once
+    # their value is rounded, fund the difference
+    weth.transfer(yield_alchemist, 10**6)
+
+
+def test_liquidate_right_after_harvest(vault, yield_alchemist, weth, nft, owner):
+    vault.set_alchemist(yield_alchemist)
+    vault.add_depositor(owner)
+    weth.approve(vault, 2**256 - 1)
+    nft.DEBUG_transferMinter(owner)
+    nft.mint_batch(HOLDERS[0], [0, 1, 2, 3])
+    vault.register_deposits([0, 1, 2, 3], [10**18, 2 * 10**18, 3 * 10**18, 4 * 10**18])
+    weth.transfer(yield_alchemist, 10**6)
+
+    for token_id in [0, 1, 2]:
+        mine(BLOCKS_PER_MONTH)
+        vault.harvest(0)
+
+        # the harvest must not leave too little collateral to liquidate
+        with boa.env.prank(HOLDERS[0]):
+            assert vault.liquidate(token_id, 0) > 0
+        assert vault.positions(token_id)[4]
+
+
+def token_ids_of(holder):
+    i = HOLDERS.index(holder)
+    return list(range(i * TOKENS_PER_HOLDER, (i + 1) * TOKENS_PER_HOLDER))
+
+
+def test_two_years_of_harvests_and_claims(vault, yield_alchemist, weth, thousand_positions):
+    deposited = sum(10**18 + token_id * 10**15 for token_id in range(4 * TOKENS_PER_HOLDER))
+    last_debt = debt(yield_alchemist, vault)
+    harvested = 0
+    claimed = 0
+
+    for month in range(24):
+        mine(BLOCKS_PER_MONTH)
+
+        # paid off debt unlocks collateral to harvest
+        assert debt(yield_alchemist, vault) < last_debt
+        last_debt = debt(yield_alchemist, vault)
+
+        harvested += vault.harvest(0)
+
+        if month == 12:
+            # in the same block as the harvest
+            with boa.env.prank(HOLDERS[0]):
+                vault.liquidate(0, 0)
+            last_debt = debt(yield_alchemist, vault)
+
+        holder = HOLDERS[month % len(HOLDERS)]
+        pending = sum(p[5] for p in vault.positions_batch(token_ids_of(holder)))
+        with boa.env.prank(holder):
+            assert vault.claim_many(token_ids_of(holder)) == pending
+        claimed += pending
+
+        pending = sum(
+            p[5] for holder in HOLDERS for p in vault.positions_batch(token_ids_of(holder))
+        )
+        assert weth.balanceOf(vault) >= pending
+        assert vault.unlocked_shares() < vault.total_shares() // 1000
+
+    # two years of about 5% repay about a tenth of the deposits in debt,
+    # every repaid WETH of debt unlocks two of collateral
+    assert deposited // 8 < harvested < deposited // 4
+    assert claimed + pending <= harvested
+    assert weth.balanceOf(HOLDERS[0]) > 0
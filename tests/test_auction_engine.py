@@ -0,0 +1,216 @@
+import pytest
+import boa
+from hypothesis import strategies as st
+from hypothesis.stateful import (
+    RuleBasedStateMachine,
+    initialize,
+    invariant,
+    precondition,
+    rule,
+    run_state_machine_as_test,
+)
+
+from auction_engine import EPOCH_LENGTH, TIME_BUFFER, AuctionEngine, AuctionError
+
+MAX_TOKEN_ID = 10
+RESERVE_PRICE = 10**18
+
+# around the edges of the anti sniping buffer and the epochs
+durations = st.one_of(
+    st.sampled_from([1, TIME_BUFFER - 1, TIME_BUFFER, TIME_BUFFER + 1, EPOCH_LENGTH, 3 * EPOCH_LENGTH]),
+    st.integers(min_value=0, max_value=2 * EPOCH_LENGTH),
+)
+
+
+def timetravel(to):
+    boa.env.vm.patch.timestamp = to
+
+
+def now():
+    return boa.env.vm.patch.timestamp
+
+
+def lower(address):
+    return None if address is None else address.lower()
+
+
+class AuctionHouseComparison(RuleBasedStateMachine):
+    """
+    Applies every call to the auction house and to the engine and
+    checks that both revert with the same message or neither does, and
+    that their state matches after every step.
+    """
+
+    house = None
+    weth = None
+    nft = None
+    mock_vault = None
+    owner = None
+    bidders = None
+
+    def __init__(self):
+        super().__init__()
+        self.anchor = boa.env.anchor()
+        self.anchor.__enter__()
+
+        self.engine = AuctionEngine(
+            RESERVE_PRICE, MAX_TOKEN_ID, fallback_receiver=lower(self.owner)
+        )
+        self.balances = {bidder: self.weth.balanceOf(bidder) for bidder in self.bidders}
+
+    def teardown(self):
+        self.anchor.__exit__(None, None, None)
+
+    def _call(self, contract_call, engine_call, sender=None):
+        try:
+            engine_call()
+        except AuctionError as e:
+            # the NFT reverts without a message
+            reason = () if str(e) == "token already minted" else (str(e),)
+            with boa.env.prank(sender or self.owner), boa.reverts(*reason):
+                contract_call()
+        else:
+            with boa.env.prank(sender or self.owner):
+                contract_call()
+
+    @initialize(delay=st.sampled_from([0, 1, EPOCH_LENGTH]), pull_refunds=st.booleans())
+    def start_auction(self, delay, pull_refunds):
+        start_time = 0 if delay == 0 else now() + delay
+        self.set_pull_refunds(pull_refunds)
+        self._call(
+            lambda: self.house.start_auction(start_time),
+            lambda: self.engine.start_auction(start_time, now()),
+        )
+
+    @rule(data=st.data())
+    def bid(self, data):
+        bidder = data.draw(st.sampled_from(self.bidders))
+        token_id = self.engine.current_epoch_token_id + data.draw(st.sampled_from([0, 0, 0, 1]))
+        minimum = max(RESERVE_PRICE, self.engine.highest_bid * 102 // 100)
+        amount = data.draw(
+            st.one_of(
+                st.integers(min_value=minimum - 2, max_value=minimum + 2),
+                st.integers(min_value=minimum, max_value=2 * minimum),
+            )
+        )
+        self._call(
+            lambda: self.house.bid(token_id, amount),
+            lambda: self.engine.bid(lower(bidder), token_id, amount, now()),
+            sender=bidder,
+        )
+
+    @rule(duration=durations)
+    def wait(self, duration):
+        timetravel(now() + duration)
+
+    @precondition(lambda self: self.engine.epoch_end > now())
+    @rule(data=st.data(), offset=st.sampled_from([-TIME_BUFFER - 1, -TIME_BUFFER, -TIME_BUFFER + 1, -1, 0, 1]))
+    def snipe(self, data, offset):
+        # bids the minimum right around the start of the buffer or epoch_end
+        timetravel(self.engine.epoch_end + offset)
+        bidder = data.draw(st.sampled_from(self.bidders))
+        amount = max(RESERVE_PRICE, self.engine.highest_bid * 102 // 100)
+        token_id = self.engine.current_epoch_token_id
+        self._call(
+            lambda: self.house.bid(token_id, amount),
+            lambda: self.engine.bid(lower(bidder), token_id, amount, now()),
+            sender=bidder,
+        )
+
+    @rule(
+        epochs=st.integers(min_value=1, max_value=4),
+        offset=st.sampled_from([-1, 0, 1]),
+        max_missed_epochs=st.integers(min_value=0, max_value=4),
+    )
+    def settle_late(self, epochs, offset, max_missed_epochs):
+        # settles right around the end of a later epoch
+        timetravel(max(now(), self.engine.epoch_end + epochs * EPOCH_LENGTH + offset))
+        self.settle_and_catch_up(max_missed_epochs)
+
+    @rule()
+    def settle(self):
+        self._call(self.house.settle, lambda: self.engine.settle(now()))
+
+    @rule(max_missed_epochs=st.integers(min_value=0, max_value=4))
+    def settle_and_catch_up(self, max_missed_epochs):
+        self._call(
+            lambda: self.house.settle_and_catch_up(max_missed_epochs),
+            lambda: self.engine.settle_and_catch_up(max_missed_epochs, now()),
+        )
+
+    @rule(enabled=st.booleans())
+    def set_pull_refunds(self, enabled):
+        self._call(
+            lambda: self.house.set_pull_refunds(enabled),
+            lambda: self.engine.set_pull_refunds(enabled),
+        )
+
+    @rule(data=st.data())
+    def withdraw_refunds(self, data):
+        receivers = data.draw(st.lists(st.sampled_from(self.bidders), max_size=3))
+        with boa.env.prank(self.owner):
+            amount = self.house.withdraw_refunds(receivers)
+        assert amount == self.engine.withdraw_refunds([lower(r) for r in receivers])
+
+    @rule(offset=st.integers(min_value=-1, max_value=3))
+    def set_max_token_id(self, offset):
+        max_token_id = self.engine.current_epoch_token_id + offset
+        if max_token_id < 0:
+            return
+        self._call(
+            lambda: self.house.set_max_token_id(max_token_id),
+            lambda: self.engine.set_max_token_id(max_token_id),
+        )
+
+    @invariant()
+    def auction_matches(self):
+        assert self.house.auction_started() == self.engine.auction_started
+        assert self.house.current_epoch_token_id() == self.engine.current_epoch_token_id
+        assert self.house.max_token_id() == self.engine.max_token_id
+        assert self.house.epoch_start() == self.engine.epoch_start
+        assert self.house.epoch_end() == self.engine.epoch_end
+        assert self.house.highest_bid() == self.engine.highest_bid
+        assert self.house.pull_refunds() == self.engine.pull_refunds
+
+        highest_bidder = self.house.highest_bidder().lower()
+        assert highest_bidder == (lower(self.engine.highest_bidder) or pytest.ZERO_ADDRESS)
+
+    @invariant()
+    def weth_matches(self):
+        for bidder in self.bidders:
+            paid = self.balances[bidder] - self.weth.balanceOf(bidder)
+            assert paid == self.engine.paid.get(lower(bidder), 0)
+            assert self.house.pending_refunds(bidder) == self.engine.pending_refunds.get(lower(bidder), 0)
+
+    @invariant()
+    def mints_and_deposits_match(self):
+        for token_id, receiver in self.engine.minted.items():
+            assert self.nft.ownerOf(token_id).lower() == receiver
+        assert sum(self.nft.balanceOf(b) for b in self.bidders) == len(self.engine.minted)
+
+        if self.engine.deposits:
+            token_id, amount = self.engine.deposits[-1]
+            assert (self.mock_vault.token_id(), self.mock_vault.amount()) == (token_id, amount)
+
+
+@pytest.fixture()
+def comparison_setup(house, weth, nft, mock_vault, owner, alice, bob):
+    house.set_max_token_id(MAX_TOKEN_ID)
+    for bidder in [alice, bob]:
+        weth.transfer(bidder, 1000 * 10**18)
+        with boa.env.prank(bidder):
+            weth.approve(house, 2**256 - 1)
+    weth.approve(house, 2**256 - 1)
+
+    AuctionHouseComparison.house = house
+    AuctionHouseComparison.weth = weth
+    AuctionHouseComparison.nft = nft
+    AuctionHouseComparison.mock_vault = mock_vault
+    AuctionHouseComparison.owner = owner
+    # the owner is the fallback receiver and bids as well
+    AuctionHouseComparison.bidders = [owner, alice, bob]
+
+
+def test_engine_matches_auction_house(comparison_setup):
+    run_state_machine_as_test(AuctionHouseComparison)
+
@@ -0,0 +1,88 @@
+import pytest
+
+import contract_loader
+
+COUNTER = """
+count: public(uint256)
+
+@internal
+def _add(_amount: uint256):
+    self.count += _amount
+
+@external
+def increase(_amount: uint256):
+    self._add(_amount)
+"""
+
+
+@pytest.fixture()
+def counter(tmp_path):
+    path = tmp_path / "Counter.vy"
+    path.write_text(COUNTER)
+    return path
+
+
+@pytest.fixture()
+def fresh_process(monkeypatch):
+    # forget deployers and labels of this process, like a new session would
+    monkeypatch.setattr(contract_loader, "_deployers", {})
+    monkeypatch.setattr(contract_loader.core, "_label", 0)
+    monkeypatch.setattr(contract_loader.self_call, "_label_counter", 0)
+    monkeypatch.setattr(contract_loader.compile_ir, "_next_symbol", 0)
+
+
+def test_compiled_contract_is_stored_in_cache_dir(tmp_path, counter, fresh_process):
+    cache_dir = tmp_path / "cache"
+    contract_loader.load_partial(counter, cache_dir=cache_dir)
+
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+
+def test_contract_is_restored_from_cache_dir(tmp_path, counter, monkeypatch, fresh_process):
+    compiled = contract_loader.load_partial(counter, cache_dir=tmp_path)
+    monkeypatch.setattr(contract_loader, "_deployers", {})
+
+    def compile(filename, source):
+        raise AssertionError("compiled again")
+
+    monkeypatch.setattr(contract_loader, "_compile", compile)
+    restored = contract_loader.load_partial(counter, cache_dir=tmp_path)
+
+    assert restored is not compiled
+    assert restored.compiler_data.bytecode == compiled.compiler_data.bytecode
+
+
+def test_restored_contract_can_eval_internal_calls(tmp_path, counter, monkeypatch, fresh_process):
+    contract_loader.load_partial(counter, cache_dir=tmp_path)
+    monkeypatch.setattr(contract_loader, "_deployers", {})
+    monkeypatch.setattr(contract_loader.self_call, "_label_counter", 0)
+    monkeypatch.setattr(contract_loader.compile_ir, "_next_symbol", 0)
+
+    restored = contract_loader.load_partial(counter, cache_dir=tmp_path).deploy()
+    restored.eval("self._add(2)")
+
+    assert restored.count() == 2
+
+
+def test_changed_source_is_compiled_again(tmp_path, counter, fresh_process):
+    cache_dir = tmp_path / "cache"
+
+    first = contract_loader.load_partial(counter, cache_dir=cache_dir)
+    counter.write_text(COUNTER + "\nlimit: public(uint256)\n")
+    second = contract_loader.load_partial(counter, cache_dir=cache_dir)
+
+    assert first is not second
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+    assert second.deploy().limit() == 0
+
+
+def test_corrupt_cache_entry_is_compiled_again(tmp_path, counter, fresh_process):
+    cache_dir = tmp_path / "cache"
+    contract_loader.load_partial(counter, cache_dir=cache_dir)
+    (entry,) = cache_dir.glob("*.pickle")
+    entry.write_bytes(b"garbage")
+    contract_loader._deployers.clear()
+
+    deployer = contract_loader.load_partial(counter, cache_dir=cache_dir)
+
+    assert deployer.deploy().count() == 0
@@ -0,0 +1,105 @@
+import pytest
+from boa.environment import Env
+from boa.vm.fork import CachingRPC
+from eth_utils import to_canonical_address
+
+import fork_snapshot
+
+BLOCK_NUMBER = 16_000_000
+WETH_CODE = "0x6080604052"
+WETH_SLOT = "0x3"
+WETH_SLOT_VALUE = "0x" + "00" * 31 + "12"
+
+NODE = {
+    "eth_blockNumber": hex(BLOCK_NUMBER + 15),
+    "eth_getBlockByNumber": {"number": hex(BLOCK_NUMBER), "timestamp": hex(1_670_000_000)},
+    "eth_getBalance": hex(10**18),
+    "eth_getTransactionCount": "0x1",
+    "eth_getCode": WETH_CODE,
+    "eth_getStorageAt": WETH_SLOT_VALUE,
+}
+
+
+@pytest.fixture()
+def node(monkeypatch):
+    def fetch(self, payloads):
+        return {i: NODE[method] for (i, method, params) in payloads}
+
+    monkeypatch.setattr(CachingRPC, "_raw_fetch_multi", fetch)
+
+
+@pytest.fixture()
+def new_env():
+    # forking swaps the account db of all VMs, every env has to start from
+    # the original one and it is put back for the other tests
+    state_class = Env().vm.__class__._state_class
+    account_db_class = state_class.account_db_class
+
+    def make():
+        state_class.account_db_class = account_db_class
+        return Env()
+
+    yield make
+    state_class.account_db_class = account_db_class
+
+
+def read_weth(env):
+    weth = to_canonical_address(pytest.WETH)
+    state = env.vm.state
+    return state.get_code(weth), state.get_storage(weth, int(WETH_SLOT, 16))
+
+
+def capture(new_env, path):
+    env = new_env()
+    rpc = fork_snapshot.fork(env, path, url="http://node")
+    values = read_weth(env)
+    rpc.save()
+    return env, values
+
+
+def go_offline(monkeypatch):
+    def fetch(self, payloads):
+        raise AssertionError("RPC used while replaying")
+
+    monkeypatch.setattr(CachingRPC, "_raw_fetch_multi", fetch)
+
+
+def test_capture_records_state_read_from_node(new_env, node, tmp_path):
+    path = tmp_path / "snapshot.json"
+    env, (code, value) = capture(new_env, path)
+
+    assert code == bytes.fromhex(WETH_CODE[2:])
+    assert value == int(WETH_SLOT_VALUE, 16)
+    assert env.vm.patch.block_number == BLOCK_NUMBER
+
+    snapshot = fork_snapshot.SnapshotRPC(path).snapshot
+    account = snapshot["accounts"][pytest.WETH]
+    assert account["code"] == WETH_CODE
+    assert account["storage"] == {WETH_SLOT: WETH_SLOT_VALUE}
+
+
+def test_replay_serves_captured_state_without_rpc(new_env, node, tmp_path, monkeypatch):
+    path = tmp_path / "snapshot.json"
+    _, captured = capture(new_env, path)
+
+    go_offline(monkeypatch)
+    env = new_env()
+    fork_snapshot.fork(env, path)
+
+    assert read_weth(env) == captured
+    assert env.vm.patch.block_number == BLOCK_NUMBER
+    assert env.vm.patch.timestamp == 1_670_000_000
+
+
+def test_replay_of_state_not_captured_raises(new_env, node, tmp_path, monkeypatch):
+    path = tmp_path / "snapshot.json"
+    capture(new_env, path)
+
+    go_offline(monkeypatch)
+    env = new_env()
+    fork_snapshot.fork(env, path)
+
+    with pytest.raises(fork_snapshot.SnapshotMiss):
+        env.vm.state.get_storage(to_canonical_address(pytest.WETH), 4)
+    with pytest.raises(fork_snapshot.SnapshotMiss):
+        env.vm.state.get_balance(to_canonical_address(pytest.ALETH))
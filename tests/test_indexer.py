@@ -0,0 +1,301 @@
+import io
+import json
+from urllib.error import HTTPError
+
+import pytest
+import boa
+from eth_utils import event_abi_to_log_topic
+
+from indexer import EventDecoder, Indexer, LocalChain, Log, RPCLogSource, Store, load_abi
+from indexer.sources import RPCError
+
+AMOUNT = 10**18
+
+
+def mine():
+    boa.env.vm.patch.block_number += 1
+
+
+def timetravel(to):
+    boa.env.vm.patch.timestamp = to
+
+
+@pytest.fixture()
+def chain():
+    block_number = boa.env.vm.patch.block_number
+    with LocalChain(boa.env) as chain:
+        yield chain
+    boa.env.vm.patch.block_number = block_number
+
+
+@pytest.fixture(scope="session")
+def abis():
+    return {
+        "vault": load_abi("contracts/Vault.vy"),
+        "house": load_abi("contracts/AuctionHouse.vy"),
+    }
+
+
+@pytest.fixture()
+def make_indexer(chain, vault, house, abis, tmp_path):
+    def make(source=chain, db="index.sqlite", **kwargs):
+        contracts = {
+            "vault": (vault.address, abis["vault"]),
+            "house": (house.address, abis["house"]),
+        }
+        return Indexer(Store(tmp_path / db), source, contracts, **kwargs)
+
+    return make
+
+
+@pytest.fixture()
+def vault_history(vault, nft, weth, owner, alchemist):
+    """
+    Deposits tokens 0 and 1, distributes WETH, claims token 0 and
+    liquidates token 1, each step in a new block.
+    """
+    vault.add_depositor(owner)
+    weth.approve(vault, 2 * AMOUNT)
+    nft.DEBUG_transferMinter(owner)
+    nft.mint(owner, 0)
+    nft.mint(owner, 1)
+    alchemist.eval(f"self.total_value = {4 * AMOUNT}")
+
+    mine()
+    vault.register_deposits([0, 1], [AMOUNT, AMOUNT])
+    alchemist.eval(f"self.shares = {2 * AMOUNT}")
+    alchemist.eval(f"self.debt = {AMOUNT // 2}")
+
+    mine()
+    weth.transfer(vault, AMOUNT // 10)
+    vault.withdraw_underlying_to_claim(0, AMOUNT // 10)
+
+    mine()
+    vault.claim(0)
+    vault.liquidate(1, 0)
+    mine()
+
+
+def rows(store, query):
+    return store.db.execute(query).fetchall()
+
+
+def test_indexes_vault_positions(make_indexer, vault_history, owner):
+    indexer = make_indexer()
+
+    # NewDepositor, Funded, 2 Deposit, Claimable, 2 Claimed, Liquidated
+    assert indexer.sync() == 8
+
+    positions = rows(indexer.store, "SELECT * FROM positions ORDER BY token_id")
+    assert [p[0] for p in positions] == ["0", "1"]
+    assert all(p[1].lower() == owner.lower() for p in positions)
+    assert [p[2:] for p in positions] == [
+        (str(AMOUNT), str(AMOUNT // 20), None),
+        (str(AMOUNT), str(AMOUNT // 20), "0"),
+    ]
+    assert dict(rows(indexer.store, "SELECT * FROM totals")) == {
+        "funded": str(AMOUNT - 1),
+        "claimable": str(AMOUNT // 10),
+        "claimed": str(AMOUNT // 10),
+    }
+
+
+def test_indexes_auctions(make_indexer, chain, house, alice, bob):
+    house.start_auction(0)
+    mine()
+    token_id = house.current_epoch_token_id()
+    reserve_price = house.RESERVE_PRICE()
+
+    with boa.env.prank(alice):
+        house.bid(token_id, reserve_price)
+    mine()
+    with boa.env.prank(bob):
+        house.bid(token_id, 2 * reserve_price)
+    mine()
+    timetravel(house.epoch_end() + 1)
+    house.settle()
+    mine()
+
+    indexer = make_indexer()
+    indexer.sync()
+
+    auction = rows(indexer.store, f"SELECT * FROM auctions WHERE token_id = '{token_id}'")[0]
+    _, bids, highest_bidder, highest_bid, amount_refunded, winner, winning_bid = auction
+    assert highest_bidder.lower() == winner.lower() == bob.lower()
+    assert highest_bid == winning_bid == str(2 * reserve_price)
+    assert amount_refunded == str(reserve_price)
+    assert bids >= 2
+
+
+def test_logs_are_kept_in_order_per_token(make_indexer, vault_history):
+    indexer = make_indexer()
+    indexer.sync()
+
+    logs = rows(
+        indexer.store,
+        "SELECT event, args FROM logs WHERE token_id = '1' ORDER BY block_number, log_index",
+    )
+    assert [event for event, _ in logs] == ["Deposit", "Claimed", "Liquidated"]
+    assert json.loads(logs[0][1])["amount"] == AMOUNT
+
+
+def test_sync_only_fetches_new_blocks(make_indexer, chain, vault_history, vault, weth):
+    fetched = []
+
+    class Spy:
+        def head(self):
+            return chain.head()
+
+        def get_logs(self, addresses, from_block, to_block):
+            fetched.append((from_block, to_block))
+            return chain.get_logs(addresses, from_block, to_block)
+
+    indexer = make_indexer(source=Spy())
+    indexer.sync()
+    head = chain.head()
+    assert indexer.store.cursor() == head
+
+    weth.transfer(vault, AMOUNT // 10)
+    vault.withdraw_underlying_to_claim(0, AMOUNT // 10)
+    mine()
+    fetched.clear()
+
+    assert indexer.sync() == 1
+    assert fetched == [(head + 1, head + 1)]
+    assert indexer.sync() == 0
+    assert rows(indexer.store, "SELECT amount FROM totals WHERE name = 'claimable'") == [
+        (str(AMOUNT // 5),)
+    ]
+
+
+def test_sync_in_chunks_matches_single_sync(make_indexer, vault_history):
+    single = make_indexer(db="single.sqlite")
+    chunked = make_indexer(db="chunked.sqlite", chunk_size=1)
+
+    assert single.sync() == chunked.sync()
+
+    for table in ["logs", "positions", "totals"]:
+        assert rows(single.store, f"SELECT * FROM {table}") == rows(chunked.store, f"SELECT * FROM {table}")
+
+
+def test_interrupted_sync_resumes_without_duplicates(make_indexer, chain, vault_history):
+    head = chain.head()
+
+    class Flaky:
+        def head(self):
+            return head
+
+        def get_logs(self, addresses, from_block, to_block):
+            if from_block == head - 1:
+                raise ConnectionError("node went away")
+            return chain.get_logs(addresses, from_block, to_block)
+
+    indexer = make_indexer(source=Flaky(), chunk_size=1)
+    with pytest.raises(ConnectionError):
+        indexer.sync()
+
+    assert indexer.store.cursor() == head - 2
+
+    indexer.source = chain
+    indexer.sync()
+    reference = make_indexer(db="reference.sqlite")
+    reference.sync()
+
+    assert rows(indexer.store, "SELECT * FROM logs") == rows(reference.store, "SELECT * FROM logs")
+    assert rows(indexer.store, "SELECT * FROM positions") == rows(reference.store, "SELECT * FROM positions")
+
+
+def test_confirmations_leave_latest_blocks(make_indexer, chain, vault_history):
+    indexer = make_indexer(confirmations=2)
+    indexer.sync()
+
+    assert indexer.store.cursor() == chain.head() - 2
+
+
+def test_rpc_source_splits_refused_ranges(monkeypatch):
+    requested = []
+
+    def request(self, method, params):
+        from_block, to_block = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+        requested.append((from_block, to_block))
+        if to_block - from_block >= 2:
+            raise RPCError({"code": -32005, "message": "query returned more than 10000 results"})
+        return []
+
+    monkeypatch.setattr(RPCLogSource, "_request", request)
+
+    assert RPCLogSource("http://node").get_logs([], 0, 7) == []
+    assert [r for r in requested if r[1] - r[0] < 2] == [(0, 1), (2, 3), (4, 5), (6, 7)]
+
+
+def test_rpc_source_splits_ranges_refused_with_http_errors(monkeypatch):
+    requested = []
+
+    def request(self, method, params):
+        from_block, to_block = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+        requested.append((from_block, to_block))
+        if to_block - from_block >= 2:
+            raise HTTPError(self.url, 413, "Request Entity Too Large", {}, io.BytesIO())
+        return []
+
+    monkeypatch.setattr(RPCLogSource, "_request", request)
+
+    assert RPCLogSource("http://node").get_logs([], 0, 7) == []
+    assert [r for r in requested if r[1] - r[0] < 2] == [(0, 1), (2, 3), (4, 5), (6, 7)]
+
+
+def test_token_ids_above_sqlite_integers(make_indexer, chain, vault, nft, weth, owner, alchemist):
+    token_id = 2**255
+    vault.add_depositor(owner)
+    weth.approve(vault, AMOUNT)
+    nft.DEBUG_transferMinter(owner)
+    nft.mint(owner, token_id)
+    alchemist.eval(f"self.total_value = {2 * AMOUNT}")
+    mine()
+    vault.register_deposit(token_id, AMOUNT)
+    mine()
+
+    indexer = make_indexer()
+    indexer.sync()
+
+    assert rows(indexer.store, "SELECT token_id, amount_deposited FROM positions") == [
+        (str(token_id), str(AMOUNT))
+    ]
+    assert rows(indexer.store, "SELECT token_id FROM logs WHERE event = 'Deposit'") == [
+        (str(token_id),)
+    ]
+
+
+def test_refuses_logs_indexed_differently_than_the_abi(chain, vault_history, abis):
+    topic = next(
+        event_abi_to_log_topic(item) for item in abis["vault"] if item.get("name") == "Deposit"
+    )
+    deposit = next(log for log in chain.logs if log.topics[0] == topic)
+    # a Deposit of a deployment that did not index token_id yet
+    log = Log(deposit.address, deposit.topics[:2], deposit.topics[2] + deposit.data, 0, 0)
+
+    with pytest.raises(ValueError, match="deployed with a different ABI"):
+        EventDecoder("vault", abis["vault"]).decode(log)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        HTTPError("http://node", 401, "Unauthorized", {}, io.BytesIO()),
+        HTTPError("http://node", 429, "Too Many Requests", {}, io.BytesIO()),
+        HTTPError("http://node", 503, "Service Unavailable", {}, io.BytesIO()),
+        RPCError({"code": -32005, "message": "daily request count exceeded, request rate limited"}),
+    ],
+)
+def test_rpc_source_raises_other_errors_right_away(monkeypatch, error):
+    requested = []
+
+    def request(self, method, params):
+        requested.append(params)
+        raise error
+
+    monkeypatch.setattr(RPCLogSource, "_request", request)
+
+    with pytest.raises(type(error)):
+        RPCLogSource("http://node").get_logs([], 0, 7)
+    assert len(requested) == 1
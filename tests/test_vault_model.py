@@ -0,0 +1,193 @@
+import pytest
+import boa
+from hypothesis import strategies as st
+from hypothesis.stateful import (
+    RuleBasedStateMachine,
+    invariant,
+    precondition,
+    rule,
+    run_state_machine_as_test,
+)
+
+from vault_model import VaultModel, VaultModelError
+
+TOKEN_IDS = list(range(20))
+HOLDERS = [f"0x{0xF022 + i:040x}" for i in range(4)]
+
+# keeps the mock alchemist at a collateralisation of 10, so deposits can
+# always mint and liquidations always have debt to repay
+TOTAL_VALUE = 10**30
+DEBT = 10**29
+
+amounts = st.integers(min_value=10**3, max_value=10 * 10**18)
+
+
+def owner_of(token_id):
+    return HOLDERS[token_id % len(HOLDERS)]
+
+
+class VaultModelComparison(RuleBasedStateMachine):
+    """
+    Applies every step to the vault and to the model and compares their
+    full accounting state after each of them.
+    """
+
+    vault = None
+    alchemist = None
+    weth = None
+
+    def __init__(self):
+        super().__init__()
+        self.anchor = boa.env.anchor()
+        self.anchor.__enter__()
+
+        self.model = VaultModel(len(TOKEN_IDS))
+        self.undeposited = list(TOKEN_IDS)
+        self.deposited = []
+
+    def teardown(self):
+        self.anchor.__exit__(None, None, None)
+
+    def _deposited(self, token_ids):
+        for token_id in token_ids:
+            self.undeposited.remove(token_id)
+            self.deposited.append(token_id)
+
+        # the mock does not track deposits, give the vault its shares and
+        # take the deposited WETH
+        self.alchemist.eval("self.shares += self.du_amount")
+        with boa.env.prank(self.vault.address):
+            self.weth.transfer(self.alchemist, self.alchemist.du_amount())
+        # the mock issues one share per WETH
+        return self.alchemist.du_amount()
+
+    @precondition(lambda self: self.undeposited)
+    @rule(data=st.data(), amount=amounts)
+    def register_deposit(self, data, amount):
+        token_id = data.draw(st.sampled_from(self.undeposited))
+        self.vault.register_deposit(token_id, amount)
+
+        self.model.register_deposit(token_id, amount, self._deposited([token_id]))
+
+    @precondition(lambda self: len(self.undeposited) > 1)
+    @rule(data=st.data())
+    def register_deposits(self, data):
+        token_ids = data.draw(
+            st.lists(st.sampled_from(self.undeposited), min_size=1, max_size=5, unique=True)
+        )
+        batch_amounts = data.draw(st.lists(amounts, min_size=len(token_ids), max_size=len(token_ids)))
+        self.vault.register_deposits(token_ids, batch_amounts)
+
+        self.model.register_deposits(token_ids, batch_amounts, self._deposited(token_ids))
+
+    @precondition(lambda self: self.vault.total_shares() > 0)
+    @rule(fraction=st.integers(min_value=1, max_value=10_000))
+    def withdraw_underlying_to_claim(self, fraction):
+        amount = self.alchemist.shares() * fraction // 10_000
+        if amount == 0:
+            return
+
+        # the mock returns the weth without sending it, send it in its place
+        self.weth.transfer(self.vault, amount)
+        self.vault.withdraw_underlying_to_claim(amount, amount)
+
+        self.model.withdraw_underlying_to_claim(amount)
+
+    @precondition(lambda self: self.deposited)
+    @rule(data=st.data())
+    def claim_many(self, data):
+        holder = data.draw(st.sampled_from(HOLDERS))
+        owned = [token_id for token_id in TOKEN_IDS if owner_of(token_id) == holder]
+        token_ids = data.draw(st.lists(st.sampled_from(owned), max_size=4, unique=True))
+
+        with boa.env.prank(holder):
+            assert self.vault.claim_many(token_ids) == self.model.claim(token_ids)
+
+    @precondition(lambda self: self.deposited)
+    @rule(data=st.data())
+    def liquidate(self, data):
+        token_id = data.draw(st.sampled_from(self.deposited))
+        with boa.env.prank(owner_of(token_id)):
+            self.vault.liquidate(token_id, 0)
+
+        self.model.liquidate(token_id)
+        self.deposited.remove(token_id)
+
+    @rule()
+    def sweep_dust(self):
+        assert self.vault.sweep_dust() == self.model.sweep_dust()
+
+    @invariant()
+    def totals_match(self):
+        assert self.vault.total_shares() == self.model.total_shares
+        assert self.vault.amount_claimable_per_share() == self.model.amount_claimable_per_share
+        assert self.vault.sweepable_dust() == self.model.sweepable_dust()
+        assert self.weth.balanceOf(self.vault) == self.model.weth_balance
+
+    @invariant()
+    def positions_match(self):
+        claimable = self.model.claimable()
+        for token_id in TOKEN_IDS:
+            assert self.vault.positions(token_id)[1:] == (
+                self.model.amount_deposited[token_id],
+                self.model.amount_claimed[token_id],
+                self.model.shares_owned[token_id],
+                self.model.is_liquidated[token_id],
+            )
+            assert self.vault.claimable_for_token(token_id) == claimable[token_id]
+
+
+@pytest.fixture()
+def model_setup(vault, alchemist, weth, nft, owner):
+    vault.add_depositor(owner)
+    weth.approve(vault, 2**256 - 1)
+    nft.DEBUG_transferMinter(owner)
+    for token_id in TOKEN_IDS:
+        nft.mint(owner_of(token_id), token_id)
+
+    alchemist.eval(f"self.total_value = {TOTAL_VALUE}")
+    alchemist.eval(f"self.debt = {DEBT}")
+
+    VaultModelComparison.vault = vault
+    VaultModelComparison.alchemist = alchemist
+    VaultModelComparison.weth = weth
+
+
+def test_model_matches_vault(model_setup):
+    run_state_machine_as_test(VaultModelComparison)
+
+
+def test_projection_matches_vault(model_setup, vault, alchemist, weth):
+    model = VaultModel(len(TOKEN_IDS))
+    deposits = [3 * 10**18, 10**18, 7 * 10**17, 10**18 + 1]
+    vault.register_deposits(TOKEN_IDS[:4], deposits)
+    model.register_deposits(TOKEN_IDS[:4], deposits, sum(deposits))
+    alchemist.eval(f"self.shares = {sum(deposits)}")
+
+    schedules = [[10**17, 3 * 10**16 + 7], [0, 1, 10**18], [12_345]]
+    projected = model.project([s + [0] * (3 - len(s)) for s in schedules], TOKEN_IDS[:4])
+
+    for schedule, expected in zip(schedules, projected):
+        with boa.env.anchor():
+            for amount in schedule:
+                weth.transfer(vault, amount)
+                vault.withdraw_underlying_to_claim(amount, amount)
+
+            assert [vault.claimable_for_token(t) for t in TOKEN_IDS[:4]] == list(expected)
+
+
+def test_projection_leaves_model_untouched():
+    model = VaultModel(2)
+    model.register_deposit(0, 10**18, 10**18)
+    model.withdraw_underlying_to_claim(10**17)
+
+    assert model.project([[10**17], [0]]).tolist() == [[2 * 10**17, 0], [10**17, 0]]
+    assert model.claimable().tolist() == [10**17, 0]
+
+
+def test_model_rejects_second_deposit():
+    model = VaultModel(2)
+    model.register_deposit(0, 10**18, 10**18)
+
+    with pytest.raises(VaultModelError, match="can only deposit once per token"):
+        model.register_deposits([1, 0], [10**18, 10**18], 2 * 10**18)
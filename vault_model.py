@@ -0,0 +1,198 @@
+"""
+Reference model of the Vault share accounting on NumPy arrays, to project
+the claimable WETH of many positions under many withdrawal schedules
+without calling the contract.
+
+    model = VaultModel(num_tokens=1000)
+    model.register_deposits([0, 1], [10**18, 2 * 10**18], shares_issued)
+    model.withdraw_underlying_to_claim(10**17)
+    model.claimable()                        # per token
+    model.project([[10**17, 10**17], ...])   # per schedule and token
+
+Positions are indexed by token id. Amounts are Python ints in object
+arrays: values scaled by CLAIMABLE_PRECISION overflow int64, object
+arrays keep the exact integer semantics of the contract, rounding
+included. Alchemix is not modelled, the shares issued for a deposit and
+the WETH withdrawn are inputs; weth_balance only counts the WETH
+withdrawn to claim.
+"""
+import numpy as np
+
+CLAIMABLE_PRECISION = 10**36
+
+
+class VaultModelError(Exception):
+    pass
+
+
+def _ints(values):
+    return np.array(values, dtype=object).reshape(-1)
+
+
+class VaultModel:
+    """
+    The accounting state of a Vault with positions for token ids
+    0 to num_tokens - 1.
+    """
+
+    def __init__(self, num_tokens):
+        self.total_shares = 0
+        self.amount_claimable_per_share = 0
+        self.weth_balance = 0
+
+        self.deposited = np.zeros(num_tokens, dtype=bool)
+        self.is_liquidated = np.zeros(num_tokens, dtype=bool)
+        self.amount_deposited = np.zeros(num_tokens, dtype=object)
+        self.shares_owned = np.zeros(num_tokens, dtype=object)
+        self.reward_debt = np.zeros(num_tokens, dtype=object)
+        self.initial_reward_debt = np.zeros(num_tokens, dtype=object)
+
+    @property
+    def amount_claimed(self):
+        return self.reward_debt - self.initial_reward_debt
+
+    # ----------
+    #  Deposits
+    # ----------
+    def register_deposit(self, token_id, amount, shares_issued):
+        """
+        Opens the position of token_id with all of shares_issued.
+        """
+        self._open_positions(_ints([token_id]), _ints([amount]), _ints([shares_issued]))
+        self.total_shares += shares_issued
+
+    def register_deposits(self, token_ids, amounts, shares_issued):
+        """
+        Splits shares_issued pro rata to amounts, the last token receives
+        the rounding remainder.
+        """
+        token_ids, amounts = _ints(token_ids), _ints(amounts)
+        if len(token_ids) != len(amounts):
+            raise VaultModelError("length mismatch")
+        if len(token_ids) == 0:
+            raise VaultModelError("nothing to deposit")
+        if any(amounts <= 0):
+            raise VaultModelError("cannot deposit zero")
+        if len(set(token_ids)) != len(token_ids):
+            raise VaultModelError("can only deposit once per token")
+
+        shares_owned = shares_issued * amounts // amounts.sum()
+        shares_owned[-1] = shares_issued - shares_owned[:-1].sum()
+
+        self._open_positions(token_ids, amounts, shares_owned)
+        self.total_shares += shares_issued
+
+    def _open_positions(self, token_ids, amounts, shares_owned):
+        token_ids = token_ids.astype(np.int64)
+        if self.deposited[token_ids].any():
+            raise VaultModelError("can only deposit once per token")
+
+        # what the shares would have earned so far, rounded up
+        earned = shares_owned * self.amount_claimable_per_share
+        initial_reward_debt = -(-earned // CLAIMABLE_PRECISION)
+
+        self.deposited[token_ids] = True
+        self.amount_deposited[token_ids] = amounts
+        self.shares_owned[token_ids] = shares_owned
+        self.reward_debt[token_ids] = initial_reward_debt
+        self.initial_reward_debt[token_ids] = initial_reward_debt
+
+    # ---------------
+    #  Distributions
+    # ---------------
+    def withdraw_underlying_to_claim(self, amount_withdrawn):
+        """
+        Makes amount_withdrawn WETH claimable by the current shares, as
+        Vault._mark_as_claimable does.
+        """
+        self.weth_balance += amount_withdrawn
+        if amount_withdrawn == 0 or self.total_shares == 0:
+            return
+
+        amount_scaled = amount_withdrawn * CLAIMABLE_PRECISION
+        self.amount_claimable_per_share += amount_scaled // self.total_shares
+
+    def sweepable_dust(self):
+        """
+        The WETH held above what the open positions can still claim at
+        most, as Vault._sweepable_dust bounds it.
+        """
+        is_open = self.deposited & ~self.is_liquidated
+        earned = self.total_shares * self.amount_claimable_per_share // CLAIMABLE_PRECISION
+        max_claimable = max(earned + int(is_open.sum()) - self.reward_debt[is_open].sum(), 0)
+        return max(self.weth_balance - max_claimable, 0)
+
+    def sweep_dust(self):
+        amount = self.sweepable_dust()
+        self.weth_balance -= amount
+        return amount
+
+    # --------
+    #  Claims
+    # --------
+    def claimable(self, token_ids=None):
+        """
+        Returns the pending WETH of token_ids, of all tokens by default.
+        """
+        index = slice(None) if token_ids is None else _ints(token_ids).astype(np.int64)
+        return self._claimable(
+            self.amount_claimable_per_share,
+            self.shares_owned[index],
+            self.reward_debt[index],
+            self.is_liquidated[index],
+        )
+
+    @staticmethod
+    def _claimable(amount_claimable_per_share, shares_owned, reward_debt, is_liquidated):
+        earned = shares_owned * amount_claimable_per_share // CLAIMABLE_PRECISION
+        return np.where(is_liquidated, 0, np.maximum(earned - reward_debt, 0))
+
+    def claim(self, token_ids):
+        """
+        Books the pending WETH of token_ids as claimed and returns the
+        sum, as Vault.claim_many does.
+        """
+        token_ids = np.unique(_ints(token_ids).astype(np.int64))
+        amounts = self.claimable(token_ids)
+        self.reward_debt[token_ids] += amounts
+        self.weth_balance -= amounts.sum()
+        return amounts.sum()
+
+    def liquidate(self, token_id):
+        """
+        Claims the pending WETH of token_id and removes its shares.
+        Returns the claimed WETH; the WETH withdrawn for the remaining
+        shares depends on Alchemix and is not modelled.
+        """
+        if self.is_liquidated[token_id]:
+            raise VaultModelError("position already liquidated")
+
+        amount = self.claim([token_id])
+        self.is_liquidated[token_id] = True
+        self.total_shares -= self.shares_owned[token_id]
+        return amount
+
+    # ------------
+    #  Projection
+    # ------------
+    def project(self, schedules, token_ids=None):
+        """
+        Returns the pending WETH of token_ids (all tokens by default) after
+        each schedule of schedules, a (schedule, step) array of WETH
+        amounts withdrawn to claim one after the other. The schedules
+        start from the current state and leave it untouched.
+        """
+        schedules = np.array(schedules, dtype=object, ndmin=2)
+        index = slice(None) if token_ids is None else _ints(token_ids).astype(np.int64)
+
+        amount_claimable_per_share = np.full(len(schedules), self.amount_claimable_per_share, dtype=object)
+        if self.total_shares > 0:
+            added_per_share = schedules * CLAIMABLE_PRECISION // self.total_shares
+            amount_claimable_per_share += added_per_share.sum(axis=1)
+
+        return self._claimable(
+            amount_claimable_per_share[:, None],
+            self.shares_owned[index][None, :],
+            self.reward_debt[index][None, :],
+            self.is_liquidated[index][None, :],
+        )